@@ -0,0 +1 @@
+"""Benchmarks for `types_parser` and `typedoc`."""
@@ -0,0 +1,43 @@
+"""`list[SourceReference]` built item by item vs. with `from_json_list`.
+
+Usage:
+
+```
+python -m benchmarks.batch_list_benchmark [num_items]
+```
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from typedoc import reflections
+import types_parser
+
+
+def main(num_items: int = 1_000_000):
+    values = [
+        {"fileName": f"src/file{i % 100}.ts", "line": i, "character": 4}
+        for i in range(num_items)
+    ]
+    cls = reflections.SourceReference
+    for trusted in (False, True):
+        # What the `list[SourceReference]` plans did before `from_json_list`
+        item_plan = types_parser.compile(cls, trusted=trusted)
+        list_plan = types_parser.compile(list[cls], trusted=trusted)
+        assert list_plan(values[:10]) == [item_plan(v) for v in values[:10]]
+
+        t_items = min(
+            timeit.repeat(lambda: [item_plan(v) for v in values], number=1, repeat=3)
+        )
+        t_batch = min(timeit.repeat(lambda: list_plan(values), number=1, repeat=3))
+        print(
+            f"trusted={trusted}: {num_items:_} items: "
+            f"per item {t_items:.2f}s, batch {t_batch:.2f}s "
+            f"({t_items / t_batch:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,105 @@
+"""Per-value cost of `types_parser.compile` vs. re-analysing the hint.
+
+Usage:
+
+```
+python -m benchmarks.compile_benchmark
+```
+"""
+
+from __future__ import annotations
+
+import enum
+import timeit
+import types
+import typing
+
+import types_parser
+
+
+class Item:
+    """Stand-in for a `Reflection`-like class with a `from_json`."""
+
+    def __init__(self, x):
+        self.x = x
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**value)
+
+
+# Reference implementation: the per-value dispatch `validate` used before
+# `compile`, which calls `typing.get_origin`/`typing.get_args` on every value.
+
+
+def _interpreted_validate(hint, value):
+    origin = typing.get_origin(hint)
+    return _ORIGIN_TO_VALIDATOR[origin](hint, value)
+
+
+def _list_validator(hint, value):
+    (item_hint,) = typing.get_args(hint)
+    if not isinstance(value, list):
+        raise types_parser.InvalidError(f"Expected list. Got: {type(value)}")
+    return [_interpreted_validate(item_hint, val) for val in value]
+
+
+def _union_validator(hint, value):
+    all_err = []
+    for item_hint in typing.get_args(hint):
+        try:
+            return _interpreted_validate(item_hint, value)
+        except types_parser.InvalidError as e:
+            all_err.append(e)
+    msg = "\n".join([str(e) for e in all_err])
+    raise types_parser.InvalidError(f"{msg}\nExpected: {hint}. Got: {type(value)}")
+
+
+def _type_validator(hint, value):
+    if hint is typing.Any:
+        return value
+    if issubclass(hint, enum.Enum):
+        return hint(value)
+    if hasattr(hint, "from_json"):
+        if isinstance(value, hint):
+            return value
+        return hint.from_json(value)
+    if not isinstance(value, hint):
+        raise types_parser.InvalidError(f"Expected {hint}. Got: {type(value)}")
+    return value
+
+
+_ORIGIN_TO_VALIDATOR = {
+    list: _list_validator,
+    types.UnionType: _union_validator,
+    None: _type_validator,
+}
+
+
+_CASES = [
+    ("list[Item] | None (None)", list[Item] | None, None),
+    ("list[Item] | None (100 items)", list[Item] | None, [Item(x=i) for i in range(100)]),
+    ("list[Item] | None (100 dicts)", list[Item] | None, [{"x": i} for i in range(100)]),
+    ("list[int | str] | None (100 items)", list[int | str] | None, list(range(100))),
+    ("str | None", str | None, "abc"),
+]
+
+
+def _time_per_call(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main(number: int = 2_000):
+    print(f"{'hint':<40} {'interpreted':>14} {'compiled':>14} {'speedup':>8}")
+    for name, hint, value in _CASES:
+        plan = types_parser.compile(hint)
+        before = _time_per_call(lambda: _interpreted_validate(hint, value), number)
+        after = _time_per_call(lambda: plan(value), number)
+        print(
+            f"{name:<40} {before * 1e6:>11.2f} us {after * 1e6:>11.2f} us"
+            f" {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
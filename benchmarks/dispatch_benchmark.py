@@ -0,0 +1,116 @@
+"""Cost of the `Reflection.from_json` kind dispatch, over a deep tree.
+
+Compares the registry table (built once at import) with the previous
+per-call dispatch (`dict(value)` + `ReflectionKind(kindString)` + a
+`kind -> cls` dict re-created for each reflection).
+
+Usage:
+
+```
+python -m benchmarks.dispatch_benchmark [depth] [num_functions]
+```
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import Any, Iterator
+
+from typedoc import reflections
+from typedoc import testing
+
+_Kind = reflections.ReflectionKind
+
+
+def _legacy_dispatch(value):
+    value = dict(value)
+    value.pop("kind")
+    value["kind"] = _Kind(value.pop("kindString"))
+    kind_to_cls = {
+        _Kind.Reference: reflections.ReferenceReflection,
+        _Kind.Project: reflections.ContainerReflection,
+        _Kind.Module: reflections.ContainerReflection,
+        _Kind.Namespace: reflections.ContainerReflection,
+        _Kind.Enum: reflections.ContainerReflection,
+        _Kind.Class: reflections.DeclarationReflection,
+        _Kind.Interface: reflections.DeclarationReflection,
+        _Kind.Function: reflections.DeclarationReflection,
+        _Kind.Method: reflections.DeclarationReflection,
+        _Kind.TypeLiteral: reflections.DeclarationReflection,
+        _Kind.TypeAlias: reflections.DeclarationReflection,
+        _Kind.Constructor: reflections.DeclarationReflection,
+        _Kind.Property: reflections.DeclarationReflection,
+        _Kind.Accessor: reflections.DeclarationReflection,
+        _Kind.CallSignature: reflections.SignatureReflection,
+        _Kind.ConstructorSignature: reflections.SignatureReflection,
+        _Kind.IndexSignature: reflections.SignatureReflection,
+        _Kind.GetSignature: reflections.SignatureReflection,
+        _Kind.SetSignature: reflections.SignatureReflection,
+        _Kind.Parameter: reflections.ParameterReflection,
+        _Kind.Variable: reflections.ParameterReflection,
+        _Kind.EnumMember: reflections.ParameterReflection,
+        _Kind.TypeParameter: reflections.TypeParameterReflection,
+    }
+    return kind_to_cls.get(value["kind"], reflections.Reflection), value
+
+
+def _dispatch(value):
+    # Same as in `Reflection.from_json`
+    value = value.copy()
+    kind, cls = reflections._JSON_KIND_TO_CLS[  # pylint: disable=protected-access
+        value.get("kindString") or value["kind"]
+    ]
+    value["kind"] = kind
+    value.pop("kindString", None)
+    return cls, value
+
+
+def deep_tree_json(depth: int, num_functions: int) -> dict[str, Any]:
+    """Returns a project with `depth` nested modules of `num_functions` each."""
+    next_id = 1 + depth
+    module = None
+    for i in reversed(range(depth)):
+        children = []
+        for j in range(num_functions):
+            children.append(testing.function_json(id=next_id, name=f"fn{j}"))
+            next_id += 3
+        if module is not None:
+            children.append(module)
+        module = testing.module_json(id=1 + i, name=f"m{i}", children=children)
+    return testing.project_json(num_functions=0) | {"children": [module]}
+
+
+def _iter_json_reflections(value) -> Iterator[dict[str, Any]]:
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        yield value
+        for name in ("children", "signatures", "parameters"):
+            stack.extend(value.get(name) or ())
+
+
+def main(depth: int = 30, num_functions: int = 100):
+    project_json = deep_tree_json(depth, num_functions)
+    values = list(_iter_json_reflections(project_json))
+    print(f"{len(values):_} reflections, depth {depth}")
+
+    for name, dispatch in (("legacy", _legacy_dispatch), ("registry", _dispatch)):
+        t = min(timeit.repeat(lambda: [dispatch(v) for v in values], number=1))
+        print(f"dispatch {name:>8}: {t * 1e9 / len(values):.0f} ns/reflection")
+
+    for trusted in (False, True):
+        t = min(
+            timeit.repeat(
+                lambda: reflections.Reflection.from_json(
+                    project_json, trusted=trusted
+                ),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(f"from_json(trusted={trusted}): {t:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
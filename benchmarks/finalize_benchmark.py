@@ -0,0 +1,76 @@
+"""Construction cost of a `make_dataclass` class before/after `finalize`.
+
+Before, `make_dataclass` installed a `__new__` walking the MRO on every
+instance creation. Now the lazy initialization is removed once the class is
+materialised.
+
+Usage:
+
+```
+python -m benchmarks.finalize_benchmark [num_instances]
+```
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import types_parser
+from types_parser import parser
+
+
+@types_parser.make_dataclass
+class Flags:
+    """Eleven booleans, like the (pre-packing) `ReflectionFlags`."""
+
+    hasExportAssignment: bool = False
+    isAbstract: bool = False
+    isConst: bool = False
+    isExternal: bool = False
+    isOptional: bool = False
+    isPrivate: bool = False
+    isProtected: bool = False
+    isPublic: bool = False
+    isReadonly: bool = False
+    isRest: bool = False
+    isStatic: bool = False
+
+
+def _legacy_copy(cls):
+    """Copy of `cls` using the previous per-instance lazy `__new__`."""
+    ns = {k: v for k, v in vars(cls).items() if k in cls.__annotations__}
+    ns["__annotations__"] = dict(cls.__annotations__)
+    ns["__module__"] = cls.__module__
+
+    def __new__(cls, *args, **kwargs):
+        parser._make_all_dataclass(cls)
+        return object.__new__(cls)
+
+    new_cls = type(f"Legacy{cls.__name__}", (), ns)
+    new_cls.__new__ = __new__
+    return new_cls
+
+
+def _time(cls, num: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num):
+        cls(isConst=True)
+    return time.perf_counter() - start
+
+
+def main(num: int = 1_000_000):
+    legacy_cls = _legacy_copy(Flags)
+    types_parser.finalize(Flags)
+
+    cls = Flags
+    _time(legacy_cls, 1)  # Materialise the legacy class
+    before = _time(legacy_cls, num)
+    after = _time(cls, num)
+    print(f"{num:_} x Flags(isConst=True)")
+    print(f"  lazy __new__: {before:.2f}s ({before / num * 1e6:.2f} us/instance)")
+    print(f"  finalized:    {after:.2f}s ({after / num * 1e6:.2f} us/instance)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
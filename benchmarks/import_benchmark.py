@@ -0,0 +1,62 @@
+"""Start-up cost of the `typedoc` entry points, from `python -X importtime`.
+
+Usage:
+
+```
+python -m benchmarks.import_benchmark [num_runs]
+```
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+# `(name, statement)` of the entry points
+_STATEMENTS = [
+    ("import typedoc", "import typedoc"),
+    ("typedoc.ReflectionKind", "import typedoc; typedoc.ReflectionKind"),
+    ("typedoc.Reflection", "import typedoc; typedoc.Reflection"),
+    ("typedoc.load", "import typedoc; typedoc.load"),
+    ("import types_parser", "import types_parser"),
+]
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Returns the cumulative import time (us) of each imported module."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(num_runs: int = 10):
+    for name, statement in _STATEMENTS:
+        runs = [_import_times(statement) for _ in range(num_runs)]
+        # Only the modules imported by the statement (not the interpreter
+        # start-up ones, like `encodings` or `site`)
+        baseline = _import_times("pass")
+        new_modules = [m for m in runs[0] if m not in baseline]
+        total = statistics.median(
+            sum(times.get(m, 0) for m in new_modules if "." not in m)
+            for times in runs
+        )
+        heaviest = sorted(new_modules, key=lambda m: -runs[0][m])[:3]
+        print(
+            f"{name:>22}: {total / 1e3:5.1f} ms, {len(new_modules):3} modules"
+            f" (heaviest: {', '.join(heaviest)})"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
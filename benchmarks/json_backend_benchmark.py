@@ -0,0 +1,96 @@
+"""Parse time and peak RSS of `typedoc.load_json` per JSON backend.
+
+Also reports `typedoc.load(engine="msgspec")` (decoding and validation in a
+single native pass). Each run is in a fresh process, so the peak RSS are
+independent.
+
+Usage:
+
+```
+python -m benchmarks.json_backend_benchmark [api.json]
+```
+
+Without path, a synthetic project (`testing.project_json`) is used.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import pathlib
+import resource
+import sys
+import tempfile
+import time
+
+from typedoc import loader
+from typedoc import reflections
+from typedoc import testing
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KiB
+
+
+def _run(path: str, backend: str) -> tuple[float, float, float, float]:
+    """Returns the parse and `from_json` times and peak RSS increases."""
+    loader._get_backend(backend)  # pylint: disable=protected-access
+    rss_before = _max_rss_mb()
+    start = time.perf_counter()
+    value = loader.load_json(path, backend=backend)
+    parse_time = time.perf_counter() - start
+    parse_rss = _max_rss_mb() - rss_before
+    start = time.perf_counter()
+    with loader._gc_paused():  # pylint: disable=protected-access
+        reflections.Reflection.from_json(value, trusted=True)
+    from_json_time = time.perf_counter() - start
+    return parse_time, from_json_time, parse_rss, _max_rss_mb() - rss_before
+
+
+def _run_msgspec_engine(path: str) -> tuple[float, float]:
+    """Returns the `load(engine="msgspec")` time and peak RSS increase."""
+    loader._struct_decoder()  # pylint: disable=protected-access
+    rss_before = _max_rss_mb()
+    start = time.perf_counter()
+    loader.load(path, engine="msgspec")
+    return time.perf_counter() - start, _max_rss_mb() - rss_before
+
+
+def main(path: str | None = None):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if path is None:
+            path = str(pathlib.Path(tmp_dir) / "api.json")
+            with open(path, "w") as f:
+                json.dump(testing.project_json(num_functions=100_000), f)
+        size_mb = pathlib.Path(path).stat().st_size / 1e6
+        print(f"{path}: {size_mb:.1f} MB")
+
+        ctx = multiprocessing.get_context("spawn")
+        for backend in loader.BACKENDS:
+            try:
+                loader._get_backend(backend)  # pylint: disable=protected-access
+            except ImportError:
+                print(f"{backend:>8}: not installed")
+                continue
+            with ctx.Pool(1) as pool:
+                parse_time, from_json_time, parse_rss, rss = pool.apply(
+                    _run, (path, backend)
+                )
+            print(
+                f"{backend:>8}: parse {parse_time:.2f}s (peak RSS +{parse_rss:.0f} MB)"
+                f", + from_json {from_json_time:.2f}s (peak RSS +{rss:.0f} MB)"
+            )
+        try:
+            loader._get_backend("msgspec")  # pylint: disable=protected-access
+        except ImportError:
+            return
+        with ctx.Pool(1) as pool:
+            load_time, rss = pool.apply(_run_msgspec_engine, (path,))
+        print(
+            f"engine=msgspec: decode + build {load_time:.2f}s"
+            f" (peak RSS +{rss:.0f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
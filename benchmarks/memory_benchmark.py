@@ -0,0 +1,48 @@
+"""Memory of a loaded synthetic `Reflection` tree.
+
+Usage:
+
+```
+python -m benchmarks.memory_benchmark [num_reflections]
+```
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from typedoc import interning
+from typedoc import reflections
+from typedoc import testing
+
+
+def main(num_reflections: int = 200_000):
+    # Each function has 3 reflections (function, signature, parameter).
+    # Round-trip, so equal strings are different objects, like in a real load.
+    project_json = json.loads(
+        json.dumps(testing.project_json(num_functions=num_reflections // 3))
+    )
+    reflections.Reflection.from_json(testing.project_json())  # Warm-up
+
+    for intern in (False, True):
+        interner = interning.Interner() if intern else False
+        gc.collect()
+        tracemalloc.start()
+        project = reflections.Reflection.from_json(project_json, intern=interner)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        num_nodes = len(project._index)  # pylint: disable=protected-access
+        print(
+            f"intern={intern}: {num_nodes:_} reflections: {size / 1e6:.1f} MB"
+            f" ({size / num_nodes:.0f} B/reflection) {interner or ''}"
+        )
+        del project
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Import and first construction time of the `typedoc` model.
+
+The first construction finalizes the classes (`dataclasses`, validators,
+type hints,...). Each run is in a fresh interpreter. `uncached` replaces the
+`types_parser.get_type_hints` cache by `typing.get_type_hints`.
+
+Usage:
+
+```
+python -m benchmarks.startup_benchmark [num_runs]
+```
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+
+_CHILD = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import typedoc
+import typedoc.reflections  # The model (`typedoc` is imported lazily)
+from typedoc import testing
+import types_parser
+import_time = time.perf_counter() - start
+
+if sys.argv[1] == "uncached":
+    import typing
+    import types_parser.parser  # Not imported by the lazy `types_parser`
+    import typedoc.types
+    # `typing.get_type_hints` does not see the lazy `types.reflections`
+    typedoc.types.reflections = typedoc.reflections
+    types_parser.get_type_hints = typing.get_type_hints
+    types_parser.parser.get_type_hints = typing.get_type_hints
+
+project_json = testing.project_json(num_functions=1)
+project_json["children"].append(
+    testing.module_json(id=50, name="m", children=[testing.class_json(51, "C")])
+)
+start = time.perf_counter()
+project = typedoc.Reflection.from_json(project_json)
+typedoc.Reflection.from_json(project_json, trusted=True)
+types_parser.finalize(typedoc.types)
+first_time = time.perf_counter() - start
+print(json.dumps([import_time, first_time]))
+"""
+
+
+def _run(mode: str) -> tuple[float, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return tuple(json.loads(out))
+
+
+def main(num_runs: int = 10):
+    for mode in ("uncached", "cached"):
+        runs = [_run(mode) for _ in range(num_runs)]
+        import_time = statistics.median(r[0] for r in runs)
+        first_time = statistics.median(r[1] for r in runs)
+        print(
+            f"{mode:>8}: import {import_time * 1e3:.1f} ms, "
+            f"first construction {first_time * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
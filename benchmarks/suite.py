@@ -0,0 +1,255 @@
+"""Benchmark suite of the load pipeline, compared with stored baselines.
+
+Each benchmark runs on the deterministic `testing.synthetic_project_json`
+and reports a single "lower is better" metric. Results are compared with
+`baselines.json` (recorded on a reference machine, so only compare runs
+from the same machine).
+
+Usage:
+
+```
+python -m benchmarks.suite                # Compare with the baselines
+python -m benchmarks.suite -k from_json   # Only the matching benchmarks
+python -m benchmarks.suite --save         # Record the new baselines
+python -m benchmarks.suite --check        # Exit 1 on regression (for CI)
+python -m benchmarks.suite --scale 10     # 10x more nodes
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import pathlib
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks import import_benchmark
+from typedoc import codegen
+from typedoc import reflections
+from typedoc import testing
+from typedoc import types
+import types_parser
+
+BASELINES_PATH = pathlib.Path(__file__).with_name("baselines.json")
+
+# Metrics above `baseline * (1 + threshold)` are reported as regressions
+_DEFAULT_THRESHOLD = 0.2
+
+
+# Benchmarks, as `fn(scale) -> (value, unit)`
+_BENCHMARKS: list[Callable[[int], tuple[float, str]]] = []
+
+
+def _register(fn: Callable[[int], tuple[float, str]]):
+    _BENCHMARKS.append(fn)
+    return fn
+
+
+def _best_time(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the fastest of `repeat` runs (in seconds)."""
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def _project_json(scale: int, depth: int = 8) -> dict[str, Any]:
+    # Round-trip, so equal strings are different objects, like in a real load
+    project_json = testing.synthetic_project_json(20_000 * scale, depth=depth)
+    return json.loads(json.dumps(project_json))
+
+
+def _deep_union_json(depth: int) -> dict[str, Any]:
+    """`string | 0 | (string | 0 | (...)[])[]`, nested `depth` times."""
+    value = {"type": "intrinsic", "name": "string"}
+    for _ in range(depth):
+        value = {
+            "type": "union",
+            "types": [
+                {"type": "intrinsic", "name": "string"},
+                {"type": "literal", "value": 0},
+                {"type": "array", "elementType": value},
+            ],
+        }
+    return value
+
+
+@_register
+def validate_nested(scale: int) -> tuple[float, str]:
+    hint = list[dict[str, list[tuple[int, str] | None]] | None]
+    item = {f"k{i}": [[i, "a"], None, [i, "b"]] for i in range(10)}
+    value = [item, None] * (5_000 * scale)
+    plan = types_parser.compile(hint)
+    return _best_time(lambda: plan(value)) * 1e3, "ms"
+
+
+@_register
+def from_json(scale: int) -> tuple[float, str]:
+    value = _project_json(scale)
+    return _best_time(lambda: reflections.Reflection.from_json(value)) * 1e3, "ms"
+
+
+@_register
+def from_json_trusted(scale: int) -> tuple[float, str]:
+    value = _project_json(scale)
+    fn = lambda: reflections.Reflection.from_json(value, trusted=True)
+    return _best_time(fn) * 1e3, "ms"
+
+
+@_register
+def from_json_deep(scale: int) -> tuple[float, str]:
+    # Nested modules, deeper than the recursion limit
+    value = _project_json(scale, depth=300)
+    fn = lambda: reflections.Reflection.from_json(value, trusted=True)
+    return _best_time(fn) * 1e3, "ms"
+
+
+@_register
+def type_from_json_deep_union(scale: int) -> tuple[float, str]:
+    values = [_deep_union_json(depth=30) for _ in range(100 * scale)]
+    fn = lambda: [types.Type.from_json(v) for v in values]
+    return _best_time(fn) * 1e3, "ms"
+
+
+@_register
+def memory_per_node(scale: int) -> tuple[float, str]:
+    value = _project_json(scale)
+    reflections.Reflection.from_json(testing.project_json())  # Warm-up
+    gc.collect()
+    tracemalloc.start()
+    try:
+        project = reflections.Reflection.from_json(value)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / len(project._index), "B"  # pylint: disable=protected-access
+
+
+@_register
+def import_time(scale: int) -> tuple[float, str]:
+    del scale
+    statement = "import typedoc; typedoc.load"
+    # The interpreter start-up modules are excluded
+    startup = import_benchmark._import_times("pass")  # pylint: disable=protected-access
+    runs = []
+    for _ in range(5):
+        times = import_benchmark._import_times(statement)  # pylint: disable=protected-access
+        runs.append(
+            sum(t for m, t in times.items() if m not in startup and "." not in m)
+        )
+    return min(runs) / 1e3, "ms"
+
+
+@_register
+def save_as_python(scale: int) -> tuple[float, str]:
+    project = reflections.Reflection.from_json(_project_json(scale, depth=1))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fn = lambda: codegen.save_as_python(project, tmp_dir, jobs=1, force=True)
+        return _best_time(fn, repeat=3) * 1e3, "ms"
+
+
+def run(*, pattern: str = "", scale: int = 1) -> dict[str, dict[str, Any]]:
+    """Runs the benchmarks whose name contains `pattern`."""
+    results = {}
+    for fn in _BENCHMARKS:
+        if pattern not in fn.__name__:
+            continue
+        value, unit = fn(scale)
+        results[fn.__name__] = {"value": value, "unit": unit}
+        print(f"{fn.__name__}: {value:.2f} {unit}", file=sys.stderr)
+    return results
+
+
+def report(
+    results: dict[str, dict[str, Any]],
+    baselines: dict[str, dict[str, Any]],
+    *,
+    threshold: float = _DEFAULT_THRESHOLD,
+) -> tuple[str, list[str]]:
+    """Returns the comparison table and the names of the regressions."""
+    rows = [("Benchmark", "Baseline", "Current", "Change", "")]
+    regressions = []
+    for name, result in results.items():
+        current = f"{result['value']:.2f} {result['unit']}"
+        baseline = baselines.get(name)
+        if baseline is None:
+            rows.append((name, "-", current, "", "new"))
+            continue
+        change = result["value"] / baseline["value"] - 1
+        if change > threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = ""
+        rows.append((
+            name,
+            f"{baseline['value']:.2f} {baseline['unit']}",
+            current,
+            f"{change:+.1%}",
+            status,
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    ]
+    return "\n".join(lines), regressions
+
+
+def _environment(scale: int) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scale": scale,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="Name filter")
+    parser.add_argument("--scale", type=int, default=1, help="Size multiplier")
+    parser.add_argument("--save", action="store_true", help="Save as baselines")
+    parser.add_argument("--check", action="store_true", help="Fail on regression")
+    parser.add_argument("--json", type=pathlib.Path, help="Write the results")
+    parser.add_argument("--threshold", type=float, default=_DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(pattern=args.pattern, scale=args.scale)
+    content = {"environment": _environment(args.scale), "results": results}
+    if args.json:
+        args.json.write_text(json.dumps(content, indent=2))
+
+    if BASELINES_PATH.exists():
+        stored = json.loads(BASELINES_PATH.read_text())
+    else:
+        stored = {"environment": content["environment"], "results": {}}
+    if stored["environment"] != content["environment"]:
+        print(
+            f"Baselines recorded with {stored['environment']}, not comparable.",
+            file=sys.stderr,
+        )
+        baselines = {}
+    else:
+        baselines = stored["results"]
+    table, regressions = report(results, baselines, threshold=args.threshold)
+    print(table)
+
+    if args.save:  # Only the benchmarks which were run are updated
+        if stored["environment"] == content["environment"]:
+            results = stored["results"] | results
+        content["results"] = dict(sorted(results.items()))
+        BASELINES_PATH.write_text(json.dumps(content, indent=2) + "\n")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,11 @@
 """."""
 
-import json
 import typedoc
 
 
 def main():
-    with open("api.json") as f:
-        api_json = json.load(f)
-
-    api_container = typedoc.Reflection.from_json(api_json)
+    # Parsed tree is cached, keyed by the `api.json` hash
+    api_container = typedoc.load_cached("api.json")
     api_container.save_as_python("python/")
 
 
@@ -1,3 +1,27 @@
 """Python API for https://typedoc.org/api."""
 
-from typedoc.reflections import Reflection
+import importlib
+
+__version__ = "0.1.0"
+
+# Public API, imported on first access (PEP 562), so `import typedoc` is cheap
+_LAZY_ATTRIBUTES = {
+    "Interner": "typedoc.interning",
+    "load": "typedoc.loader",
+    "Reflection": "typedoc.reflections",
+    "ReflectionKind": "typedoc.kinds",
+    "iter_children": "typedoc.streaming",
+    "load_cached": "typedoc.cache",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value  # Next accesses skip `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,58 @@
+"""Command line interface.
+
+Usage:
+
+```
+python -m typedoc convert a.json b.json --out-dir python/ --jobs 8
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+
+from typedoc import batch
+from typedoc import loader
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m typedoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert = subparsers.add_parser(
+        "convert",
+        help="Generate the Python API of each api.json, in OUT_DIR/<file stem>/",
+    )
+    convert.add_argument("paths", nargs="+", type=pathlib.Path)
+    convert.add_argument("--out-dir", type=pathlib.Path, required=True)
+    convert.add_argument("--jobs", type=int, help="Processes (default: all CPUs)")
+    convert.add_argument("--trusted", action="store_true", help="Skip validation")
+    convert.add_argument(
+        "--backend", default="auto", choices=("auto", *loader.BACKENDS)
+    )
+    convert.add_argument("--force", action="store_true", help="Regenerate all files")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = batch.convert(
+        args.paths,
+        args.out_dir,
+        jobs=args.jobs,
+        trusted=args.trusted,
+        backend=args.backend,
+        force=args.force,
+    )
+    print(batch.table(results))
+    num_failed = sum(result.error is not None for result in results)
+    print(
+        f"{len(results)} projects ({num_failed} failed) in "
+        f"{time.perf_counter() - start:.2f}s",
+        file=sys.stderr,
+    )
+    return 1 if num_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
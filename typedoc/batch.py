@@ -0,0 +1,238 @@
+"""Batch conversion of several `api.json` projects to Python."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import functools
+import os
+import pathlib
+import time
+from typing import Iterable
+
+from typedoc import codegen
+from typedoc import loader
+from typedoc import reflections
+from typedoc import types
+import types_parser
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """Conversion of one project.
+
+    Attributes:
+        path: The `api.json` path
+        output_dir: Where the Python files are generated
+        load_time: Time to parse the JSON and build the reflections (in seconds)
+        codegen_time: Time to generate the files (in seconds)
+        num_files: Number of generated files
+        error: The error, if the conversion failed
+    """
+
+    path: pathlib.Path
+    output_dir: pathlib.Path
+    load_time: float = 0.0
+    codegen_time: float = 0.0
+    num_files: int = 0
+    error: str | None = None
+
+
+def convert(
+    paths: Iterable[str | os.PathLike[str]],
+    output_dir: str | os.PathLike[str],
+    *,
+    jobs: int | None = None,
+    trusted: bool = False,
+    backend: str = "auto",
+    force: bool = False,
+) -> list[Result]:
+    """Generates the Python API of each project, in `output_dir/<stem>/`.
+
+    The projects are converted in a single process pool. The classes are
+    finalized and the plans compiled once in the parent, before the workers
+    are forked (so they inherit them rather than re-paying the cost for each
+    project).
+
+    A failed project does not stop the others (see `Result.error`).
+
+    Args:
+        paths: The `api.json` paths (with distinct file names)
+        output_dir: The root output dir
+        jobs: Number of processes (default to the number of CPUs)
+        trusted: Forwarded to `typedoc.load`
+        backend: Forwarded to `typedoc.load`
+        force: Forwarded to `codegen.save_as_python`
+
+    Returns:
+        The result of each project, in the `paths` order
+    """
+    paths = [pathlib.Path(path) for path in paths]
+    names = [path.stem for path in paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Projects with the same file name: {duplicates}")
+    output_dirs = [pathlib.Path(output_dir) / name for name in names]
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(paths))
+    convert_one = functools.partial(
+        _convert, trusted=trusted, backend=backend, force=force
+    )
+    warm_up()
+    if jobs <= 1:
+        return list(map(convert_one, paths, output_dirs))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=warm_up
+    ) as executor:
+        # `map` preserves the input order
+        return list(executor.map(convert_one, paths, output_dirs))
+
+
+def table(results: list[Result]) -> str:
+    """Returns the per-project timings as a text table."""
+    rows = [("Project", "Load (s)", "Codegen (s)", "Files", "")]
+    for result in results:
+        rows.append((
+            str(result.path),
+            f"{result.load_time:.2f}",
+            f"{result.codegen_time:.2f}",
+            str(result.num_files),
+            "" if result.error is None else f"FAILED: {result.error}",
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i in (0, 4) else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    )
+
+
+# `module m { class C { constructor(); items?: number[]; run(x?: string): void |
+# null } }`, covering the common plans and codegen paths
+_WARM_UP_SIGNATURE_JSON = {
+    "id": 7,
+    "name": "run",
+    "kind": 4096,
+    "flags": {},
+    "parameters": [
+        {
+            "id": 8,
+            "name": "x",
+            "kind": 32768,
+            "flags": {"isOptional": True},
+            "type": {"type": "intrinsic", "name": "string"},
+        }
+    ],
+    "type": {
+        "type": "union",
+        "types": [
+            {"type": "intrinsic", "name": "void"},
+            {"type": "literal", "value": None},
+        ],
+    },
+}
+_WARM_UP_CLASS_JSON = {
+    "id": 2,
+    "name": "C",
+    "kind": 128,
+    "flags": {},
+    "children": [
+        {
+            "id": 3,
+            "name": "constructor",
+            "kind": 512,
+            "flags": {},
+            "signatures": [
+                {
+                    "id": 4,
+                    "name": "new C",
+                    "kind": 16384,
+                    "flags": {},
+                    "type": {"type": "reference", "id": 2, "name": "C"},
+                }
+            ],
+        },
+        {
+            "id": 5,
+            "name": "items",
+            "kind": 1024,
+            "flags": {"isOptional": True},
+            "type": {
+                "type": "array",
+                "elementType": {"type": "intrinsic", "name": "number"},
+            },
+        },
+        {
+            "id": 6,
+            "name": "run",
+            "kind": 2048,
+            "flags": {},
+            "sources": [{"fileName": "m.ts", "line": 1, "character": 0}],
+            "signatures": [_WARM_UP_SIGNATURE_JSON],
+        },
+    ],
+}
+_WARM_UP_JSON = {
+    "id": 0,
+    "name": "warm-up",
+    "kind": 1,
+    "flags": {},
+    "children": [
+        {
+            "id": 1,
+            "name": '"m"',
+            "kind": 2,
+            "flags": {},
+            "comment": {"shortText": "Module m."},
+            "children": [_WARM_UP_CLASS_JSON],
+        }
+    ],
+}
+
+
+@functools.cache
+def warm_up() -> None:
+    """Finalizes the classes and compiles the plans of the conversion.
+
+    Cached, so it is a no-op in the workers forked after the first call.
+    """
+    types_parser.finalize(types)
+    types_parser.finalize(reflections)
+    for trusted in (False, True):
+        project = reflections.Reflection.from_json(_WARM_UP_JSON, trusted=trusted)
+    for file in codegen._split_files(project):  # pylint: disable=protected-access
+        codegen.render_file(file)
+
+
+def _convert(
+    path: pathlib.Path,
+    output_dir: pathlib.Path,
+    *,
+    trusted: bool,
+    backend: str,
+    force: bool,
+) -> Result:
+    start = time.perf_counter()
+    try:
+        project = loader.load(path, backend=backend, trusted=trusted)
+    except Exception as e:  # pylint: disable=broad-except
+        return Result(path, output_dir, error=f"{type(e).__name__}: {e}")
+    load_time = time.perf_counter() - start
+    start = time.perf_counter()
+    try:
+        # Already in a worker: the files are rendered serially
+        files = codegen.save_as_python(project, output_dir, jobs=1, force=force)
+    except Exception as e:  # pylint: disable=broad-except
+        return Result(
+            path, output_dir, load_time=load_time, error=f"{type(e).__name__}: {e}"
+        )
+    return Result(
+        path,
+        output_dir,
+        load_time=load_time,
+        codegen_time=time.perf_counter() - start,
+        num_files=len(files),
+    )
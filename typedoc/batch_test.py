@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from typedoc import __main__ as cli
+from typedoc import batch
+from typedoc import testing
+
+
+def _write_projects(tmp_path):
+    paths = []
+    for i in range(3):
+        project_json = testing.project_json(num_functions=2)
+        project_json["children"].append(
+            testing.module_json(id=50, name=f"m{i}", children=[])
+        )
+        path = tmp_path / f"p{i}.json"
+        path.write_text(json.dumps(project_json))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_convert(tmp_path, jobs: int):
+    paths = _write_projects(tmp_path)
+    paths[1].write_text("{")  # Invalid, the others are still converted
+    results = batch.convert(paths, tmp_path / "out", jobs=jobs)
+    assert [r.path for r in results] == paths
+    assert results[1].error is not None
+    for i in (0, 2):
+        assert results[i].error is None
+        assert results[i].output_dir == tmp_path / "out" / f"p{i}"
+        assert (results[i].output_dir / f"m{i}.py").exists()
+        assert results[i].num_files == 2
+    assert "FAILED" in batch.table(results)
+
+
+def test_convert_duplicate_names(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    with pytest.raises(ValueError, match="same file name"):
+        batch.convert([tmp_path / "a/api.json", tmp_path / "b/api.json"], tmp_path)
+
+
+def test_main(tmp_path, capsys):
+    paths = _write_projects(tmp_path)
+    argv = ["convert", *map(str, paths), "--out-dir", str(tmp_path / "out")]
+    assert cli.main(argv + ["--jobs", "2"]) == 0
+    out = capsys.readouterr().out
+    assert all(str(path) in out for path in paths)
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["p0", "p1", "p2"]
+
+
+def test_warm_up():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from typedoc import batch\n"
+        "batch.warm_up()\n"
+        "assert 'typedoc.testing' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
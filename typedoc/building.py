@@ -0,0 +1,266 @@
+"""Construction of the `Reflection` and `types.Type` trees of any depth.
+
+Building the tree with the recursive `compile` plans costs several Python
+frames per nesting level, so deep trees (e.g. `ReflectionType.declaration`
+-> `children` -> `type` chains) exceed the recursion limit. Past
+`MAX_RECURSIVE_DEPTH` levels, the subtree is instead built iteratively:
+
+1. The JSON is walked with an explicit stack. Each reflection and non-leaf
+   type node is recorded in pre-order, with a copy of its dict (the input is not
+   mutated).
+2. The nodes are built in reverse order (children before their parent), and
+   each one replaces its JSON dict in its parent. When the parent is built,
+   its nested fields are already objects, which the plans return as-is.
+
+Each node is built by the same code as before, so the objects are
+identical (including the validation, interning and the project index).
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import typing
+from typing import Any, TypeVar
+
+import types_parser
+from types_parser import stats as stats_lib
+
+_T = TypeVar("_T")
+
+# How to find the nodes in a field value: a node base class (`Reflection` or
+# `Type`), `("list", spec)` or `("tuple", (spec | None, ...))`
+_Spec = Any
+
+# `typing.Optional[X]` and `X | None`
+_UNION_ORIGINS = (typing.Union, typing.get_origin(int | None))
+
+
+class _Depth(threading.local):
+    """Number of nested `from_json` calls in progress (per thread)."""
+
+    value: int = 0
+
+
+# Incremented by `Reflection.from_json` and `Type.from_json` directly (an
+# extra frame per node measurably slows down the common, shallow, trees)
+DEPTH = _Depth()
+
+# Nesting levels built by the recursive plans (about 10 Python frames each)
+# before switching to `build_iteratively`
+MAX_RECURSIVE_DEPTH = 32
+
+
+def build_iteratively(value: Any, base: type[_T], *, trusted: bool) -> _T:
+    """Returns the `base` (`Reflection` or `types.Type`) built from `value`.
+
+    Called by `from_json` past `MAX_RECURSIVE_DEPTH` nested levels. The
+    objects are identical to the ones built by the recursive plans.
+
+    Args:
+        value: The JSON dict of the node
+        base: `reflections.Reflection` or `types.Type`
+        trusted: Forwarded to the `from_json` of each node
+
+    Returns:
+        The node, with all its nested nodes
+    """
+    depth = DEPTH.value
+    # The nested `from_json` calls (leaf types) restart from 0
+    DEPTH.value = 0
+    try:
+        return _build_iteratively(value, base, trusted=trusted)
+    finally:
+        DEPTH.value = depth
+
+
+def _build_iteratively(value: Any, base: type[_T], *, trusted: bool) -> _T:
+    """Builds the tree with an explicit stack rather than recursion."""
+    from typedoc import reflections  # pylint: disable=g-import-not-at-top
+    from typedoc import types  # pylint: disable=g-import-not-at-top
+
+    reflection_base = reflections.Reflection
+    json_kind_to_cls = reflections._JSON_KIND_TO_CLS  # pylint: disable=protected-access
+    type_kind_to_cls = types.TypeKindMap
+    root = [value]
+    # `(container, key, base, parent)`: the node JSON is `container[key]`,
+    # nested in the node `records[parent]`
+    stack = [(root, 0, base, -1)]
+    records = []
+    push = stack.append
+    pop = stack.pop
+    add_record = records.append
+    while stack:
+        container, key, base, parent = pop()
+        node = container[key]
+        if type(node) is not dict:  # Left to the validation
+            continue
+        if base is reflection_base:
+            kind_cls = json_kind_to_cls.get(node.get("kindString") or node.get("kind"))
+            cls = None if kind_cls is None else kind_cls[1]
+        else:
+            cls = type_kind_to_cls.get(node.get("type"))
+        try:
+            specs = _NODE_SPECS[cls]
+        except KeyError:
+            specs = _node_specs(cls)
+        if not specs and parent >= 0 and base is not reflection_base:
+            continue  # Leaf types are built by the plan of their parent
+        index = len(records)
+        add_record((container, key, base, parent))
+        copied = False
+        for name, tag, spec in specs:
+            field_value = node.get(name)
+            if field_value is None:
+                continue
+            if not copied:  # Leaves are not copied
+                node = container[key] = node.copy()
+                copied = True
+            if tag is _NODE:
+                push((node, name, spec, index))
+            elif tag is _NODE_LIST:
+                if type(field_value) is list:  # Else left to the validation
+                    items = node[name] = field_value.copy()
+                    for i in range(len(items)):
+                        push((items, i, spec, index))
+            else:
+                _push(stack, node, name, spec, index)
+
+    build_reflection = functools.partial(
+        reflections._from_json_node,  # pylint: disable=protected-access
+        trusted=trusted,
+    )
+    build_type = functools.partial(
+        types._from_json_node,  # pylint: disable=protected-access
+        trusted=trusted,
+    )
+    stats = stats_lib.current()
+    # Total build time of the children of each node, for the `stats`
+    children_time = [0.0] * len(records) if stats is not None else None
+    # Children are after their parent, so are built first
+    for i in reversed(range(len(records))):
+        container, key, base, parent = records[i]
+        build_node = build_reflection if base is reflection_base else build_type
+        try:
+            # The root is recorded by the caller (`_from_json_validator`)
+            if stats is None or parent < 0:
+                container[key] = build_node(container[key])
+                continue
+            start = time.perf_counter()
+            container[key] = stats.build(
+                build_node, container[key], nested_time=children_time[i]
+            )
+            elapsed = time.perf_counter() - start
+            if parent >= 0:
+                children_time[parent] += elapsed + children_time[i]
+        except types_parser.InvalidError as e:
+            _add_path(e, records, i)
+            raise
+    return root[0]
+
+
+def _push(stack, container, key, spec: _Spec, parent: int) -> None:
+    """Pushes the nodes of `container[key]`, copying the lists on the way."""
+    value = container[key]
+    if isinstance(spec, type):
+        stack.append((container, key, spec, parent))
+    elif type(value) is list:  # Else left to the validation
+        kind, item_spec = spec
+        items = container[key] = value.copy()
+        if kind == "list":
+            for i in range(len(items)):
+                _push(stack, items, i, item_spec, parent)
+        else:  # Tuples are JSON arrays
+            for i, position_spec in enumerate(item_spec[: len(items)]):
+                if position_spec is not None:
+                    _push(stack, items, i, position_spec, parent)
+
+
+def _add_path(e: types_parser.InvalidError, records, index: int) -> None:
+    """Prepends the path of the node `index` in the root to the error."""
+    while index >= 0:
+        container, key, _, parent = records[index]
+        if parent >= 0:
+            e._add_key(key)  # pylint: disable=protected-access
+            parent_container, parent_key, _, _ = records[parent]
+            # Not built yet (children are built first), so still the dict
+            parent_node = parent_container[parent_key]
+            for k in reversed(_keys_to(parent_node, container)):
+                e._add_key(k)  # pylint: disable=protected-access
+        index = parent
+
+
+def _keys_to(node: dict[str, Any], container: Any) -> list[Any]:
+    """Returns the keys from the `node` dict to its nested `container` list."""
+    if container is node:
+        return []
+    stack = [(node, [])]
+    while stack:
+        value, keys = stack.pop()
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        for k, v in items:
+            if v is container:
+                return keys + [k]
+            elif type(v) is list:
+                stack.append((v, keys + [k]))
+    return []
+
+
+# Tags of the common specs, handled inline by `_build_iteratively`
+_NODE = "node"
+_NODE_LIST = "node_list"
+_OTHER = "other"
+
+# `cls -> ((name, tag, spec), ...)` of the fields of `cls` containing nodes
+_NODE_SPECS: dict[type[Any] | None, tuple[tuple[str, str, _Spec], ...]] = {}
+
+
+def _node_specs(cls: type[Any] | None) -> tuple[tuple[str, str, _Spec], ...]:
+    specs = []
+    if cls is not None:
+        for name, hint in types_parser.get_type_hints(cls).items():
+            spec = _spec(hint)
+            if spec is None:
+                continue
+            elif isinstance(spec, type):
+                specs.append((name, _NODE, spec))
+            elif spec[0] == "list" and isinstance(spec[1], type):
+                specs.append((name, _NODE_LIST, spec[1]))
+            else:
+                specs.append((name, _OTHER, spec))
+    specs = _NODE_SPECS[cls] = tuple(specs)
+    return specs
+
+
+def _spec(hint: Any) -> _Spec | None:
+    """Returns how to find the nodes in values of `hint` (`None` if none)."""
+    from typedoc import reflections  # pylint: disable=g-import-not-at-top
+    from typedoc import types  # pylint: disable=g-import-not-at-top
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if isinstance(hint, type) and issubclass(hint, reflections.Reflection):
+        return reflections.Reflection
+    elif isinstance(hint, type) and issubclass(hint, types.Type):
+        return types.Type
+    elif origin is typing.Annotated:
+        return _spec(args[0])
+    elif origin in (list, typing.List):
+        item_spec = _spec(args[0])
+        return None if item_spec is None else ("list", item_spec)
+    elif origin in (tuple, typing.Tuple):
+        if len(args) == 2 and args[1] is Ellipsis:
+            item_spec = _spec(args[0])
+            return None if item_spec is None else ("list", item_spec)
+        position_specs = tuple(_spec(arg) for arg in args)
+        if all(spec is None for spec in position_specs):
+            return None
+        return ("tuple", position_specs)
+    elif origin in _UNION_ORIGINS:
+        specs = [_spec(arg) for arg in args if arg is not type(None)]
+        specs = [spec for spec in specs if spec is not None]
+        # Ambiguous unions are left to the (recursive) plans
+        return specs[0] if len(specs) == 1 else None
+    return None
+
@@ -0,0 +1,123 @@
+"""Binary cache of the parsed `Reflection` tree."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import os
+import pathlib
+import pickle
+import sys
+
+import typedoc
+from typedoc import loader
+from typedoc import reflections
+from typedoc import types
+import types_parser
+
+_PICKLE_PROTOCOL = 5
+_HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def load_cached(
+    path: str | os.PathLike[str],
+    *,
+    cache_dir: str | os.PathLike[str] | None = None,
+    trusted: bool = False,
+    backend: str = "auto",
+) -> reflections.Reflection:
+    """Loads the `api.json` project, from the cache if available.
+
+    Parsing and validating the JSON is slow, so after a successful load, the
+    tree is pickled in `cache_dir`. The cache is keyed by the hash of the
+    JSON file, the `typedoc` version, the fields of the `Reflection` and
+    `Type` classes, and `trusted` (a trusted load is not reused by a
+    validated one). It is ignored (re-created) if it cannot be loaded.
+
+    Args:
+        path: The `api.json` path
+        cache_dir: Where the cache is stored (default to
+            `$XDG_CACHE_HOME/typedoc`)
+        trusted: Forwarded to `Reflection.from_json` when the cache is missing
+        backend: JSON parser used when the cache is missing (see
+            `typedoc.load`)
+
+    Returns:
+        The project reflection
+    """
+    path = pathlib.Path(path)
+    key = f"{_file_hash(path)}-{typedoc.__version__}-{_schema_fingerprint()}"
+    mode = "trusted" if trusted else "validated"
+    cache_path = _cache_dir(cache_dir) / f"{key}-{mode}.pickle"
+    try:
+        with cache_path.open("rb") as f:
+            project = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # pylint: disable=broad-except
+        # Corrupted cache or incompatible classes: parse the JSON again
+        print(f"Ignoring invalid cache {cache_path}: {e!r}", file=sys.stderr)
+    else:
+        _restore(project)
+        return project
+
+    project = loader.load(path, backend=backend, trusted=trusted)
+    _save(project, cache_path)
+    return project
+
+
+def _restore(project: reflections.Reflection) -> None:
+    # Parent pointers and index are not pickled
+    if project.kind is reflections.ReflectionKind.Project:
+        project._build_index()  # pylint: disable=protected-access
+
+
+def _save(project: reflections.Reflection, cache_path: pathlib.Path) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump(project, f, protocol=_PICKLE_PROTOCOL)
+    except RecursionError:  # Very deep trees
+        tmp_path.unlink(missing_ok=True)
+        print("Tree too deep to be cached.", file=sys.stderr)
+        return
+    os.replace(tmp_path, cache_path)  # Atomic, for concurrent builds
+
+
+def _cache_dir(cache_dir: str | os.PathLike[str] | None) -> pathlib.Path:
+    if cache_dir is not None:
+        return pathlib.Path(cache_dir)
+    root = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(root) / "typedoc"
+
+
+@functools.cache
+def _schema_fingerprint() -> str:
+    """Hash of the field names of the pickled classes.
+
+    Unpickling restores the attributes as-is, so the cache of a tree pickled
+    with other fields (e.g. by a development version) would silently build
+    invalid objects.
+    """
+    h = hashlib.sha256()
+    for module in (reflections, types):
+        types_parser.finalize(module)
+        for name, cls in sorted(vars(module).items()):
+            if (
+                isinstance(cls, type)
+                and cls.__module__ == module.__name__
+                and dataclasses.is_dataclass(cls)
+            ):
+                fields = ",".join(f.name for f in dataclasses.fields(cls))
+                h.update(f"{module.__name__}.{name}({fields});".encode())
+    return h.hexdigest()[:16]
+
+
+def _file_hash(path: pathlib.Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
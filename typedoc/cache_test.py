@@ -0,0 +1,49 @@
+import json
+from unittest import mock
+
+from typedoc import cache
+from typedoc import reflections
+from typedoc import testing
+
+
+def test_load_cached(tmp_path):
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(testing.project_json(num_functions=3)))
+    cache_dir = tmp_path / "cache"
+
+    project = cache.load_cached(path, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    with mock.patch.object(reflections.Reflection, "from_json") as from_json:
+        cached_project = cache.load_cached(path, cache_dir=cache_dir)
+    from_json.assert_not_called()
+    assert cached_project == project
+    assert cached_project.get(4).parent is cached_project
+
+    # Corrupted cache is re-created
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(b"invalid")
+    assert cache.load_cached(path, cache_dir=cache_dir) == project
+    assert cache_file.read_bytes() != b"invalid"
+
+    # New content: new cache entry
+    path.write_text(json.dumps(testing.project_json(num_functions=1)))
+    assert len(cache.load_cached(path, cache_dir=cache_dir).children) == 1
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_load_cached_key(tmp_path):
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(testing.project_json()))
+    cache_dir = tmp_path / "cache"
+
+    cache.load_cached(path, cache_dir=cache_dir)
+    # Trusted loads are not mixed with validated ones
+    cache.load_cached(path, cache_dir=cache_dir, trusted=True)
+    assert len(list(cache_dir.iterdir())) == 2
+    cache.load_cached(path, cache_dir=cache_dir, trusted=True)
+    assert len(list(cache_dir.iterdir())) == 2
+
+    # Changing the fields of the classes invalidates the cache
+    with mock.patch.object(cache, "_schema_fingerprint", return_value="other"):
+        cache.load_cached(path, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 3
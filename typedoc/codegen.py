@@ -0,0 +1,524 @@
+"""Python code generation."""
+
+from __future__ import annotations
+
+import ast
+import concurrent.futures
+import dataclasses
+import keyword
+import os
+import pathlib
+import re
+from typing import Iterable, Iterator
+
+from typedoc import manifest as manifest_lib
+from typedoc import reflections
+from typedoc import types
+
+_INDENT = "    "
+_INIT_FILENAME = "__init__.py"
+
+_HEADER = '''\
+"""{doc}"""
+
+# Generated by `typedoc`. Do not edit.
+
+from __future__ import annotations
+
+import enum
+import typing
+'''
+
+_INTRINSIC_TO_PY = {
+    "any": "typing.Any",
+    "bigint": "int",
+    "boolean": "bool",
+    "never": "typing.NoReturn",
+    "null": "None",
+    "number": "float",
+    "object": "dict[str, typing.Any]",
+    "string": "str",
+    "undefined": "None",
+    "unknown": "typing.Any",
+    "void": "None",
+}
+
+_REFERENCE_TO_PY = {
+    "Array": "list",
+    "Map": "dict",
+    "Promise": "typing.Awaitable",
+    "Readonly": "",
+    "ReadonlyArray": "typing.Sequence",
+    "Record": "dict",
+    "Set": "set",
+}
+
+_Kind = reflections.ReflectionKind
+_MODULE_KINDS = (_Kind.Module, _Kind.Namespace)
+
+
+@dataclasses.dataclass(frozen=True)
+class _File:
+    """A generated `.py` file.
+
+    Attributes:
+        filename: Output filename, relative to the output dir
+        doc: The module docstring
+        members: Reflections rendered in the file
+    """
+
+    filename: str
+    doc: str
+    members: list[reflections.Reflection]
+
+
+def save_as_python(
+    project: reflections.ContainerReflection,
+    output_dir: str | os.PathLike[str],
+    *,
+    jobs: int | None = None,
+    force: bool = False,
+) -> list[pathlib.Path]:
+    """Generates the Python API of the project.
+
+    Each top-level module/namespace of the project is written to its own
+    `<name>.py` file, other top-level reflections to `__init__.py`.
+
+    Files are rendered in parallel, in a process pool. The output is
+    identical to the serial one.
+
+    Generation is incremental: a manifest with the content hash of each
+    file's reflections is saved in the output dir, and files whose
+    reflections did not change are neither rendered nor written (so their
+    mtime is preserved). Files of removed modules are deleted.
+
+    Args:
+        project: The project reflection
+        output_dir: Directory in which the files are written
+        jobs: Number of worker processes (default to the number of CPUs).
+            `jobs=1` renders everything in the current process.
+        force: If `True`, ignore the manifest and regenerate all files.
+
+    Returns:
+        The generated files (including the unchanged ones), in deterministic
+        order.
+    """
+    output_dir = pathlib.Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if force:
+        old_manifest = manifest_lib.Manifest()
+    else:
+        old_manifest = manifest_lib.Manifest.load(output_dir)
+    new_manifest = manifest_lib.Manifest()
+
+    files = _split_files(project)
+    stale_files = []
+    for file in files:
+        entry = manifest_lib.file_entry(file.filename, file.doc, file.members)
+        new_manifest.files[file.filename] = entry
+        old_entry = old_manifest.files.get(file.filename)
+        if (
+            old_entry is None
+            or old_entry["hash"] != entry["hash"]
+            or not (output_dir / file.filename).exists()
+        ):
+            stale_files.append(file)
+
+    for file, content in zip(stale_files, _render_all(stale_files, jobs=jobs)):
+        path = output_dir / file.filename
+        # Identical content: keep the file untouched
+        if not path.exists() or path.read_text() != content:
+            path.write_text(content)
+
+    for filename in old_manifest.files.keys() - new_manifest.files.keys():
+        (output_dir / filename).unlink(missing_ok=True)
+    new_manifest.save(output_dir)
+    return [output_dir / file.filename for file in files]
+
+
+def _render_all(files: list[_File], *, jobs: int | None) -> Iterator[str]:
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(files))
+    if jobs <= 1:
+        yield from map(render_file, files)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        # `map` preserves the input order
+        yield from executor.map(render_file, files)
+
+
+def _split_files(project: reflections.ContainerReflection) -> list[_File]:
+    """Returns the files to generate, one per top-level module."""
+    root_members = []
+    files = []
+    used_filenames = {_INIT_FILENAME}
+    for child in project.children or []:
+        if child.kind in _MODULE_KINDS:
+            filename = f"{_py_name(_strip_module_name(child.name))}.py"
+            if filename in used_filenames:  # Collision after sanitization
+                filename = f"{filename[:-3]}_{child.id}.py"
+            used_filenames.add(filename)
+            files.append(
+                _File(
+                    filename=filename,
+                    doc=_doc(child) or child.name,
+                    members=list(child.children or []),
+                )
+            )
+        else:
+            root_members.append(child)
+    root = _File(
+        filename=_INIT_FILENAME,
+        doc=_doc(project) or project.name,
+        members=root_members,
+    )
+    return [root] + files
+
+
+def render_file(file: _File) -> str:
+    """Returns the Python source of the file."""
+    renderer = _Renderer()
+    body = renderer.render_members(file.members, indent="")
+    lines = [_HEADER.format(doc=_escape_doc(file.doc))]
+    for block in body:
+        lines.append("\n\n" + "\n".join(block) + "\n")
+    return "".join(lines)
+
+
+class _Renderer:
+    """Renders reflections as Python source lines."""
+
+    def __init__(self):
+        # Ids of the classes already rendered in the file (usable as base)
+        self._defined_ids: set[int] = set()
+
+    def render_members(
+        self,
+        members: Iterable[reflections.Reflection],
+        *,
+        indent: str,
+        in_class: bool = False,
+        in_namespace: bool = False,
+    ) -> list[list[str]]:
+        """Returns one block of lines per member."""
+        blocks = []
+        for member in members:
+            block = self._render(
+                member,
+                indent=indent,
+                in_class=in_class,
+                in_namespace=in_namespace,
+            )
+            if block:
+                blocks.append(block)
+        return blocks
+
+    def _render(
+        self,
+        r: reflections.Reflection,
+        *,
+        indent: str,
+        in_class: bool,
+        in_namespace: bool,
+    ) -> list[str]:
+        kind = r.kind
+        if kind in (_Kind.Class, _Kind.Interface):
+            return self._render_class(r, indent=indent)
+        elif kind is _Kind.Enum:
+            return self._render_enum(r, indent=indent)
+        elif kind in _MODULE_KINDS:
+            return self._render_namespace(r, indent=indent)
+        elif kind in (_Kind.Function, _Kind.Method):
+            return self._render_function(
+                r,
+                indent=indent,
+                self_arg=in_class and not r.flags.isStatic,
+                static=in_namespace or (in_class and r.flags.isStatic),
+            )
+        elif kind is _Kind.Constructor:
+            return self._render_function(
+                r, indent=indent, name="__init__", self_arg=True, return_type="None"
+            )
+        elif kind in (_Kind.Property, _Kind.Variable, _Kind.Accessor):
+            return self._render_attribute(r, indent=indent)
+        elif kind is _Kind.TypeAlias:
+            type_str = render_type(getattr(r, "type", None)).replace('"', '\\"')
+            return [f'{indent}{_py_name(r.name)}: typing.TypeAlias = "{type_str}"']
+        else:
+            return [f"{indent}# Unsupported {kind.value}: {r.name}"]
+
+    def _render_class(self, r: reflections.Reflection, *, indent: str) -> list[str]:
+        bases = []
+        for base in getattr(r, "extendedTypes", None) or []:
+            # Only bases defined above can be evaluated when importing
+            if isinstance(base, types.ReferenceType) and base.id in self._defined_ids:
+                bases.append(_py_name(base.name))
+        if not bases and r.kind is _Kind.Interface:
+            bases.append("typing.Protocol")
+        bases_str = f"({', '.join(bases)})" if bases else ""
+        lines = [f"{indent}class {_py_name(r.name)}{bases_str}:"]
+        lines.extend(self._render_body(r, indent=indent + _INDENT, in_class=True))
+        self._defined_ids.add(r.id)
+        return lines
+
+    def _render_namespace(
+        self, r: reflections.Reflection, *, indent: str
+    ) -> list[str]:
+        lines = [f"{indent}class {_py_name(_strip_module_name(r.name))}:"]
+        lines.extend(
+            self._render_body(r, indent=indent + _INDENT, in_namespace=True)
+        )
+        return lines
+
+    def _render_body(
+        self,
+        r: reflections.Reflection,
+        *,
+        indent: str,
+        in_class: bool = False,
+        in_namespace: bool = False,
+    ) -> list[str]:
+        lines = _docstring(r, indent=indent)
+        blocks = self.render_members(
+            getattr(r, "children", None) or [],
+            indent=indent,
+            in_class=in_class,
+            in_namespace=in_namespace,
+        )
+        for block in blocks:
+            if lines:
+                lines.append("")
+            lines.extend(block)
+        return lines or [f"{indent}pass"]
+
+    def _render_enum(self, r: reflections.Reflection, *, indent: str) -> list[str]:
+        lines = [f"{indent}class {_py_name(r.name)}(enum.Enum):"]
+        body = _docstring(r, indent=indent + _INDENT)
+        if body and r.children:
+            body.append("")
+        for member in r.children or []:
+            value = _literal(getattr(member, "defaultValue", ""), default=member.name)
+            body.append(f"{indent}{_INDENT}{_py_name(member.name)} = {value}")
+        lines.extend(body or [f"{indent}{_INDENT}pass"])
+        self._defined_ids.add(r.id)
+        return lines
+
+    def _render_attribute(
+        self, r: reflections.Reflection, *, indent: str
+    ) -> list[str]:
+        type_str = render_type(_attribute_type(r))
+        if r.flags.isOptional:
+            type_str = _optional(type_str)
+        lines = [f"{indent}{_py_name(r.name)}: {type_str}"]
+        doc = _doc(r)
+        if doc:
+            lines.extend(_docstring(r, indent=indent))
+        return lines
+
+    def _render_function(
+        self,
+        r: reflections.Reflection,
+        *,
+        indent: str,
+        name: str | None = None,
+        self_arg: bool = False,
+        static: bool = False,
+        return_type: str | None = None,
+    ) -> list[str]:
+        name = name or _py_name(r.name)
+        signatures = getattr(r, "signatures", None) or []
+        lines = []
+        for sig in signatures:
+            if lines:
+                lines.append("")
+            if static:
+                lines.append(f"{indent}@staticmethod")
+            if len(signatures) > 1:
+                lines.append(f"{indent}@typing.overload")
+            params = ["self"] if self_arg else []
+            params.extend(_render_parameters(sig.parameters or []))
+            ret = return_type or render_type(sig.type)
+            lines.append(f"{indent}def {name}({', '.join(params)}) -> {ret}:")
+            doc_lines = _docstring(sig, indent=indent + _INDENT) or _docstring(
+                r, indent=indent + _INDENT
+            )
+            lines.extend(doc_lines or [f"{indent}{_INDENT}..."])
+        return lines
+
+
+def _attribute_type(r: reflections.Reflection) -> types.Type | None:
+    """Returns the type of a property, variable or accessor."""
+    if r.kind is _Kind.Accessor:
+        if r.getSignature is not None:
+            return r.getSignature.type
+        elif r.setSignature is not None and r.setSignature.parameters:
+            return getattr(r.setSignature.parameters[0], "type", None)
+        return None
+    return getattr(r, "type", None)
+
+
+def _render_parameters(parameters: list[reflections.Reflection]) -> list[str]:
+    """Returns the Python parameters of the signature.
+
+    TypeScript allows required parameters after optional ones (e.g.
+    `f(a = 1, b: number)`, called with `f(undefined, 2)`), Python does not,
+    so they get a `...` default.
+    """
+    params = []
+    after_default = False
+    for p in parameters:
+        params.append(_render_parameter(p, after_default=after_default))
+        after_default = after_default or _has_default(p)
+    return params
+
+
+def _render_parameter(p: reflections.Reflection, *, after_default: bool) -> str:
+    name = _py_name(p.name)
+    t = getattr(p, "type", None)
+    if p.flags.isRest:
+        if isinstance(t, types.ArrayType):
+            t = t.elementType
+        return f"*{name}: {render_type(t)}"
+    type_str = render_type(t)
+    if _has_default(p):
+        return f"{name}: {_optional(type_str)} = None"
+    elif after_default:
+        return f"{name}: {type_str} = ..."
+    return f"{name}: {type_str}"
+
+
+def _has_default(p: reflections.Reflection) -> bool:
+    return bool(
+        not p.flags.isRest and (p.flags.isOptional or getattr(p, "defaultValue", ""))
+    )
+
+
+def render_type(t: types.Type | None) -> str:
+    """Returns the Python annotation of the TypeDoc type."""
+    if isinstance(t, types.IntrinsicType):
+        return _INTRINSIC_TO_PY.get(t.name, "typing.Any")
+    elif isinstance(t, types.LiteralType):
+        if t.value is None:
+            return "None"
+        return f"typing.Literal[{t.value!r}]"
+    elif isinstance(t, types.ArrayType):
+        return f"list[{render_type(t.elementType)}]"
+    elif isinstance(t, types.UnionType):
+        return _render_union(t.types)
+    elif isinstance(t, types.ConditionalType):  # Either branch
+        return _render_union([t.trueType, t.falseType])
+    elif isinstance(t, types.TupleType):
+        if not t.elements:
+            return "tuple[()]"
+        return f"tuple[{', '.join(render_type(e) for e in t.elements)}]"
+    elif isinstance(t, (types.OptionalType, types.NamedTupleMemberType)):
+        # Tuple items
+        inner = t.elementType if isinstance(t, types.OptionalType) else t.element
+        return render_type(inner)
+    elif isinstance(t, types.RestType):  # `...T[]` in a tuple
+        item = "typing.Any"
+        if isinstance(t.elementType, types.ArrayType):
+            item = render_type(t.elementType.elementType)
+        return f"*tuple[{item}, ...]"
+    elif isinstance(t, types.TypeOperatorType):
+        if t.operator == "keyof":
+            return "str"
+        return render_type(t.target)  # `readonly T`, `unique symbol`
+    elif isinstance(t, types.TemplateLiteralType):
+        return "str"
+    elif isinstance(t, types.PredicateType):
+        return "None" if t.asserts else "bool"
+    elif isinstance(t, types.MappedType):
+        return f"dict[str, {render_type(t.templateType)}]"
+    elif isinstance(t, types.ReferenceType):
+        name = _REFERENCE_TO_PY.get(t.name, _py_name(t.name))
+        args = [render_type(a) for a in t.typeArguments or []]
+        if not name:  # `Readonly<T>`
+            return args[0] if args else "typing.Any"
+        if args:
+            return f"{name}[{', '.join(args)}]"
+        return name
+    elif isinstance(t, types.ReflectionType):
+        declaration = t.declaration
+        signatures = getattr(declaration, "signatures", None)
+        if signatures:  # Callback: `(x: number) => void`
+            sig = signatures[0]
+            params = [render_type(p.type) for p in sig.parameters or []]
+            return f"typing.Callable[[{', '.join(params)}], {render_type(sig.type)}]"
+        return "dict[str, typing.Any]"
+    else:
+        return "typing.Any"
+
+
+def _render_union(items: list[types.Type]) -> str:
+    all_types = []
+    for item in items:
+        item_str = render_type(item)
+        if item_str not in all_types:
+            all_types.append(item_str)
+    if "typing.Any" in all_types:
+        return "typing.Any"
+    return " | ".join(all_types)
+
+
+def _optional(type_str: str) -> str:
+    if type_str in ("None", "typing.Any") or type_str.endswith(" | None"):
+        return type_str
+    return f"{type_str} | None"
+
+
+def _doc(r: reflections.Reflection) -> str:
+    comment = r.comment
+    if comment is None:
+        return ""
+    parts = [p.strip() for p in (comment.shortText, comment.text) if p and p.strip()]
+    return "\n\n".join(parts)
+
+
+def _escape_doc(doc: str) -> str:
+    return doc.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def _docstring(r: reflections.Reflection, *, indent: str) -> list[str]:
+    doc = _doc(r)
+    if not doc:
+        return []
+    lines = _escape_doc(doc).split("\n")
+    if len(lines) == 1:
+        return [f'{indent}"""{lines[0]}"""']
+    return (
+        [f'{indent}"""{lines[0]}']
+        + [f"{indent}{line}" if line else "" for line in lines[1:]]
+        + [f'{indent}"""']
+    )
+
+
+def _literal(value: str, *, default: str) -> str:
+    """Returns the Python literal of the TS value (e.g. enum values)."""
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        value = default
+    if not isinstance(value, (str, int, float, bool)):
+        value = default
+    return repr(value)
+
+
+def _strip_module_name(name: str) -> str:
+    """`"src/utils/index"` -> `src/utils/index`."""
+    return name.strip('"')
+
+
+_INVALID_CHARS = re.compile(r"\W")
+
+
+def _py_name(name: str) -> str:
+    """Returns a valid Python identifier."""
+    name = _INVALID_CHARS.sub("_", name)
+    if not name or name[0].isdigit():
+        name = f"_{name}"
+    if keyword.iskeyword(name):
+        name = f"{name}_"
+    return name
@@ -0,0 +1,221 @@
+from unittest import mock
+
+import pytest
+from typedoc import codegen
+from typedoc import manifest
+from typedoc import reflections
+from typedoc import testing
+from typedoc import types
+
+
+def _project_json():
+    project_json = testing.project_json(num_functions=1)
+    project_json["children"] += [
+        testing.module_json(
+            id=100,
+            name="src/utils",
+            children=[testing.class_json(id=101, name="MyClass")],
+        ),
+        testing.module_json(
+            id=200,
+            name="src/other",
+            children=[testing.function_json(id=201, name="other_fn")],
+        ),
+    ]
+    return project_json
+
+
+def _from_json(project_json, **kwargs):
+    return reflections.Reflection.from_json(project_json, **kwargs)
+
+
+def _project():
+    return _from_json(_project_json())
+
+
+def _read_all(paths):
+    return {p.name: p.read_text() for p in paths}
+
+
+def test_save_as_python(tmp_path):
+    paths = _project().save_as_python(tmp_path / "serial", jobs=1)
+    files = _read_all(paths)
+    assert list(files) == ["__init__.py", "src_utils.py", "src_other.py"]
+    for content in files.values():
+        compile(content, "<generated>", "exec")
+
+    assert "def fn0(x: str | None = None) -> None:" in files["__init__.py"]
+    utils = files["src_utils.py"]
+    assert '"""Module src/utils."""' in utils
+    assert "class MyClass:" in utils
+    assert "def __init__(self) -> None:" in utils
+    assert "items: list[float] | None" in utils
+    assert "def run(self, x: str | None = None) -> None:" in utils
+
+
+def test_save_as_python_required_after_default(tmp_path):
+    # `function fn0(x?: string, y: number, ...rest: number[])`
+    project_json = testing.project_json(num_functions=1)
+    (sig,) = project_json["children"][0]["signatures"]
+    sig["parameters"] += [
+        {"id": 50, "name": "y", "kind": 32768, "flags": {}, "type": _NUMBER},
+        {
+            "id": 51,
+            "name": "rest",
+            "kind": 32768,
+            "flags": {"isRest": True},
+            "type": {"type": "array", "elementType": _NUMBER},
+        },
+    ]
+    (path,) = _from_json(project_json).save_as_python(tmp_path, jobs=1)
+    content = path.read_text()
+    assert (
+        "def fn0(x: str | None = None, y: float = ..., *rest: float) -> None:"
+        in content
+    )
+    exec(compile(content, str(path), "exec"), {})  # pylint: disable=exec-used
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_save_as_python_accessor(tmp_path, trusted: bool):
+    project_json = _project_json()
+    class_json = project_json["children"][1]["children"][0]
+    class_json["children"].append(testing.accessor_json(id=120, name="size"))
+    project = _from_json(project_json, trusted=trusted)
+    project.save_as_python(tmp_path, jobs=1)
+    assert "    size: float\n" in (tmp_path / "src_utils.py").read_text()
+
+
+def test_save_as_python_parallel(tmp_path):
+    project = _project()
+    serial = _read_all(project.save_as_python(tmp_path / "serial", jobs=1))
+    parallel = _read_all(project.save_as_python(tmp_path / "parallel", jobs=2))
+    assert parallel == serial
+
+
+def test_render_type():
+    t = reflections.Reflection.from_json(testing.project_json()).get(2).type
+    assert codegen.render_type(t) == "None"
+
+
+_STRING = {"type": "intrinsic", "name": "string"}
+_NUMBER = {"type": "intrinsic", "name": "number"}
+
+
+@pytest.mark.parametrize(
+    "type_json, expected",
+    [
+        (
+            {
+                "type": "conditional",
+                "checkType": {"type": "reference", "name": "T"},
+                "extendsType": _STRING,
+                "trueType": _STRING,
+                "falseType": {"type": "literal", "value": None},
+            },
+            "str | None",
+        ),
+        (
+            {
+                "type": "tuple",
+                "elements": [
+                    {
+                        "type": "named-tuple-member",
+                        "name": "x",
+                        "isOptional": False,
+                        "element": _NUMBER,
+                    },
+                    {"type": "optional", "elementType": _STRING},
+                    {
+                        "type": "rest",
+                        "elementType": {"type": "array", "elementType": _STRING},
+                    },
+                ],
+            },
+            "tuple[float, str, *tuple[str, ...]]",
+        ),
+        ({"type": "tuple"}, "tuple[()]"),
+        (
+            {"type": "typeOperator", "operator": "keyof", "target": _STRING},
+            "str",
+        ),
+        (
+            {"type": "template-literal", "head": "a-", "tail": [[_NUMBER, "-b"]]},
+            "str",
+        ),
+        ({"type": "predicate", "name": "x", "asserts": False}, "bool"),
+        (
+            {
+                "type": "mapped",
+                "parameter": "K",
+                "parameterType": _STRING,
+                "templateType": _NUMBER,
+                "optionalModifier": "+",
+            },
+            "dict[str, float]",
+        ),
+        (
+            {"type": "intersection", "types": [_STRING, _NUMBER]},
+            "typing.Any",
+        ),
+        (
+            {
+                "type": "indexedAccess",
+                "objectType": {"type": "reference", "name": "T"},
+                "indexType": {"type": "literal", "value": "k"},
+            },
+            "typing.Any",
+        ),
+        (
+            {"type": "query", "queryType": {"type": "reference", "name": "x"}},
+            "typing.Any",
+        ),
+        ({"type": "inferred", "name": "U"}, "typing.Any"),
+        ({"type": "unknown", "name": "T[number]"}, "typing.Any"),
+    ],
+)
+@pytest.mark.parametrize("trusted", [False, True])
+def test_render_type_kinds(type_json, expected, trusted):
+    t = types.Type.from_json(type_json, trusted=trusted)
+    assert type(t) is types.TypeKindMap[type_json["type"]]
+    assert codegen.render_type(t) == expected
+
+
+def test_save_as_python_incremental(tmp_path):
+    project_json = _project_json()
+    paths = _from_json(project_json).save_as_python(tmp_path, jobs=1)
+    mtimes = {p.name: p.stat().st_mtime_ns for p in paths}
+    assert (tmp_path / manifest.MANIFEST_FILENAME).exists()
+
+    # Only `src_other.py` changed
+    project_json["children"][2]["children"][0]["name"] = "renamed_fn"
+    with mock.patch.object(
+        codegen, "render_file", wraps=codegen.render_file
+    ) as render:
+        paths = _from_json(project_json).save_as_python(tmp_path, jobs=1)
+    rendered = [call.args[0].filename for call in render.call_args_list]
+    assert rendered == ["src_other.py"]
+    new_mtimes = {p.name: p.stat().st_mtime_ns for p in paths}
+    assert new_mtimes["__init__.py"] == mtimes["__init__.py"]
+    assert new_mtimes["src_utils.py"] == mtimes["src_utils.py"]
+    assert "def renamed_fn(" in (tmp_path / "src_other.py").read_text()
+
+    # Module docstring changed
+    project_json["children"][1]["comment"] = {"shortText": "New doc."}
+    _from_json(project_json).save_as_python(tmp_path, jobs=1)
+    assert '"""New doc."""' in (tmp_path / "src_utils.py").read_text()
+
+    # Removed modules are deleted
+    del project_json["children"][2]
+    _from_json(project_json).save_as_python(tmp_path, jobs=1)
+    assert not (tmp_path / "src_other.py").exists()
+    assert (tmp_path / "src_utils.py").exists()
+
+
+def test_subtree_hash():
+    project = _project()
+    assert manifest.subtree_hash(project) == manifest.subtree_hash(_project())
+    lazy_project = _from_json(_project_json(), lazy=True)
+    assert manifest.subtree_hash(lazy_project) == manifest.subtree_hash(project)
+    project.children[0].name = "other"
+    assert manifest.subtree_hash(project) != manifest.subtree_hash(_project())
@@ -0,0 +1,106 @@
+"""Interning of the repeated strings and type nodes during a load."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Any, Callable, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+_CURRENT: contextvars.ContextVar[Interner | None] = contextvars.ContextVar(
+    "interner", default=None
+)
+
+
+class Interner:
+    """Per-load table of the shared strings and type nodes.
+
+    TypeDoc JSON repeats the same `fileName`, `name`, `package`,... strings
+    and the same `IntrinsicType(name="string")`,... nodes many times. When
+    loading with an `Interner`, equal strings and equal simple nodes (whose
+    values are all scalars) are shared, so should not be mutated.
+
+    Usage:
+
+    ```python
+    interner = typedoc.Interner()
+    project = typedoc.Reflection.from_json(api_json, intern=interner)
+    print(interner)  # Number of shared objects
+    ```
+    """
+
+    def __init__(self):
+        self._strings: dict[str, str] = {}
+        self._nodes: dict[tuple[Any, ...], Any] = {}
+        self.num_strings = 0
+        self.num_shared_strings = 0
+        self.num_nodes = 0
+        self.num_shared_nodes = 0
+
+    def intern_dict(self, value: dict[str, Any]) -> dict[str, Any]:
+        """Returns a copy of the JSON dict with its string values interned."""
+        strings = self._strings
+        new_value = {}
+        for k, v in value.items():
+            if type(v) is str:
+                self.num_strings += 1
+                shared = strings.setdefault(v, v)
+                if shared is not v:
+                    self.num_shared_strings += 1
+                    v = shared
+            new_value[k] = v
+        return new_value
+
+    def intern_node(
+        self,
+        cls: type[_T],
+        value: dict[str, Any],
+        build: Callable[[dict[str, Any]], _T],
+    ) -> _T:
+        """Returns the shared `cls` node equal to `build(value)`.
+
+        Nodes are only shared if all values are hashable scalars.
+        """
+        # `type(v)` so `True`, `1` and `1.0` are different nodes
+        key = (cls, *((k, type(v), v) for k, v in value.items()))
+        try:
+            node = self._nodes.get(key)
+        except TypeError:  # Nested values (e.g. `typeArguments`)
+            return build(self.intern_dict(value))
+        self.num_nodes += 1
+        if node is None:
+            node = self._nodes[key] = build(self.intern_dict(value))
+        else:
+            self.num_shared_nodes += 1
+        return node
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[None]:
+        """Makes this interner the one used by the nested `from_json`."""
+        token = _CURRENT.set(self)
+        try:
+            yield
+        finally:
+            _CURRENT.reset(token)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"strings={self.num_shared_strings}/{self.num_strings} shared, "
+            f"nodes={self.num_shared_nodes}/{self.num_nodes} shared)"
+        )
+
+
+def current() -> Interner | None:
+    """Returns the interner of the load in progress, if any."""
+    return _CURRENT.get()
+
+
+def resolve(intern: bool | Interner) -> Interner | None:
+    """Returns the `Interner` for the `from_json(intern=)` argument."""
+    if intern is True:
+        return Interner()
+    elif intern is False:
+        return None
+    return intern
@@ -0,0 +1,90 @@
+"""Reflection kinds.
+
+Does not import the `typedoc` model, so can be used without paying its
+import cost (e.g. by CLI wrappers).
+"""
+
+from __future__ import annotations
+
+import enum
+
+
+class ReflectionKind(str, enum.Enum):
+    """Kind of a reflection (the TypeDoc `kindString`).
+
+    Case insensitive (`ReflectionKind("call signature")`). Only uses the
+    stdlib: importing `etils.epy` would triple the import time.
+    """
+
+    def _generate_next_value_(
+        name, start, count, last_values
+    ) -> str:  # pylint: disable=no-self-argument
+        return name
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            value = value.lower()
+            for kind in cls:
+                if kind.value.lower() == value:
+                    return kind
+        return None
+
+    # `str(kind)` is the `kindString` (like `enum.StrEnum`, Python >= 3.11)
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+    Accessor = enum.auto()
+    CallSignature = "Call signature"
+    Class = enum.auto()
+    Constructor = enum.auto()
+    ConstructorSignature = "Constructor signature"
+    Enum = "Enumeration"
+    EnumMember = "Enumeration member"
+    Event = enum.auto()
+    Function = enum.auto()
+    GetSignature = "Get signature"
+    IndexSignature = "Index signature"
+    Interface = enum.auto()
+    Method = enum.auto()
+    Module = enum.auto()
+    Namespace = enum.auto()
+    ObjectLiteral = enum.auto()
+    Parameter = enum.auto()
+    Project = enum.auto()
+    Property = enum.auto()
+    Reference = enum.auto()
+    SetSignature = "Set signature"
+    TypeAlias = "Type alias"
+    TypeLiteral = "Type literal"
+    TypeParameter = "Type parameter"
+    Variable = enum.auto()
+
+
+# Numeric `kind` bitmask (TypeDoc >= 0.23 numbering, where `kindString` was
+# deprecated. Older JSON also has `kindString`, used first.)
+KIND_TO_BITMASK = {
+    ReflectionKind.Project: 0x1,
+    ReflectionKind.Module: 0x2,
+    ReflectionKind.Namespace: 0x4,
+    ReflectionKind.Enum: 0x8,
+    ReflectionKind.EnumMember: 0x10,
+    ReflectionKind.Variable: 0x20,
+    ReflectionKind.Function: 0x40,
+    ReflectionKind.Class: 0x80,
+    ReflectionKind.Interface: 0x100,
+    ReflectionKind.Constructor: 0x200,
+    ReflectionKind.Property: 0x400,
+    ReflectionKind.Method: 0x800,
+    ReflectionKind.CallSignature: 0x1000,
+    ReflectionKind.IndexSignature: 0x2000,
+    ReflectionKind.ConstructorSignature: 0x4000,
+    ReflectionKind.Parameter: 0x8000,
+    ReflectionKind.TypeLiteral: 0x10000,
+    ReflectionKind.TypeParameter: 0x20000,
+    ReflectionKind.Accessor: 0x40000,
+    ReflectionKind.GetSignature: 0x80000,
+    ReflectionKind.SetSignature: 0x100000,
+    ReflectionKind.TypeAlias: 0x200000,
+    ReflectionKind.Reference: 0x400000,
+}
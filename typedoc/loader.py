@@ -0,0 +1,175 @@
+"""Loading of the TypeDoc JSON, with the fastest available JSON backend."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import gc
+import json
+import mmap
+import os
+import sys
+from typing import Any, Callable, Iterator
+
+from typedoc import interning
+from typedoc import reflections
+from typedoc import types
+import types_parser
+
+# Preference order of `backend="auto"`
+BACKENDS = ("orjson", "msgspec", "json")
+ENGINES = ("python", "msgspec")
+
+
+def load(
+    path: str | os.PathLike[str],
+    *,
+    backend: str = "auto",
+    engine: str = "python",
+    trusted: bool = False,
+    lazy: bool = False,
+    intern: bool | interning.Interner = False,
+    stats: bool | types_parser.Stats = False,
+    jobs: int | None = 1,
+) -> reflections.Reflection:
+    """Loads the `api.json` TypeDoc project.
+
+    Args:
+        path: The `api.json` path
+        backend: JSON parser (`orjson`, `msgspec` or `json`). By default,
+            the first installed of `BACKENDS`.
+        engine: `python` parses the JSON with the `backend`, then builds the
+            reflections with `Reflection.from_json`. `msgspec` decodes and
+            validates in a single native pass, into structs derived from the
+            reflection annotations (requires `kindString`, so
+            TypeDoc < 0.24). Both build the same reflections.
+        trusted: Forwarded to `Reflection.from_json`
+        lazy: Forwarded to `Reflection.from_json`
+        intern: Forwarded to `Reflection.from_json`
+        stats: If `True`, prints the per-class counts and construction times
+            of the load to stderr. Or the `types_parser.Stats` recording
+            them.
+        jobs: If not 1, the top-level children are built in `jobs` processes
+            (`None` for one per CPU). See `typedoc.sharding`.
+
+    Returns:
+        The project reflection
+    """
+    if jobs != 1 and (lazy or intern or stats):
+        raise ValueError("`jobs` is incompatible with `lazy`, `intern` and `stats`.")
+    if engine == "msgspec":
+        if lazy or intern or stats:
+            raise ValueError(
+                "`lazy`, `intern` and `stats` require `engine='python'`."
+            )
+        with _gc_paused():
+            project = _read(path, _struct_decoder(), accepts_buffer=True)
+        if project.kind is reflections.ReflectionKind.Project:
+            project._build_index()  # pylint: disable=protected-access
+        return project
+    elif engine != "python":
+        raise ValueError(f"Unknown engine {engine!r}. Expected: {ENGINES}")
+    from_json = functools.partial(
+        reflections.Reflection.from_json,
+        trusted=trusted,
+        lazy=lazy,
+        intern=intern,
+    )
+    if jobs != 1:
+        from typedoc import sharding  # pylint: disable=g-import-not-at-top
+
+        from_json = functools.partial(sharding.from_json, jobs=jobs, trusted=trusted)
+    with _gc_paused():
+        value = load_json(path, backend=backend)
+        if stats is False:
+            return from_json(value)
+        recorder = types_parser.Stats() if stats is True else stats
+        with recorder.activate():
+            project = recorder.build(from_json, value)
+    if stats is True:
+        print(recorder.table(), file=sys.stderr)
+    return project
+
+
+def load_json(path: str | os.PathLike[str], *, backend: str = "auto") -> Any:
+    """Parses the JSON file with the `backend` (see `load`).
+
+    The file is decoded from its raw bytes (no text decoding step), read
+    with a single `mmap` for the backends parsing from a buffer.
+    """
+    loads, accepts_buffer = _get_backend(backend)
+    with _gc_paused():
+        return _read(path, loads, accepts_buffer=accepts_buffer)
+
+
+def _read(path, loads: Callable[[Any], Any], *, accepts_buffer: bool) -> Any:
+    with open(path, "rb") as f:
+        if not accepts_buffer or not os.fstat(f.fileno()).st_size:
+            return loads(f.read())  # (`mmap` cannot map empty files)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            # The view has to be released before the `mmap` is closed
+            with memoryview(m) as view:
+                return loads(view)
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pauses the cyclic GC while millions of new containers are allocated.
+
+    Otherwise each collection re-scans the whole (still alive) tree, which
+    dominates the parse time.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@functools.cache
+def _struct_decoder() -> Callable[[Any], reflections.Reflection]:
+    """Returns the `msgspec` decoder of the `Reflection` tree."""
+    from types_parser import structs  # pylint: disable=g-import-not-at-top
+
+    kind_to_cls = reflections._KIND_TO_CLS  # pylint: disable=protected-access
+    kinds = structs.TaggedUnion(
+        tag_field="kindString",
+        variants={
+            kind.value: (kind_to_cls.get(kind, reflections.Reflection), {"kind": kind})
+            for kind in reflections.ReflectionKind
+        },
+    )
+    type_kinds = structs.TaggedUnion(
+        tag_field="type",
+        variants={tag: (cls, {"type": tag}) for tag, cls in types.TypeKindMap.items()},
+    )
+    return structs.make_decoder(
+        reflections.Reflection,
+        unions={reflections.Reflection: kinds, types.Type: type_kinds},
+        json_types={reflections.ReflectionFlags: dict[str, bool]},
+    )
+
+
+def _get_backend(backend: str) -> tuple[Callable[[Any], Any], bool]:
+    """Returns the `loads` function and whether it accepts a `memoryview`."""
+    if backend == "auto":
+        for name in BACKENDS:
+            try:
+                return _get_backend(name)
+            except ImportError:
+                continue
+    if backend == "orjson":
+        import orjson  # pylint: disable=g-import-not-at-top
+
+        return orjson.loads, True
+    elif backend == "msgspec":
+        import msgspec  # pylint: disable=g-import-not-at-top
+
+        return msgspec.json.decode, True
+    elif backend == "json":
+        return json.loads, False
+    else:
+        raise ValueError(f"Unknown JSON backend {backend!r}. Expected: {BACKENDS}")
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+import typedoc
+from typedoc import loader
+from typedoc import reflections
+from typedoc import testing
+import types_parser
+
+
+@pytest.mark.parametrize("backend", ["auto", *loader.BACKENDS])
+def test_load(tmp_path, backend: str):
+    if backend not in ("auto", "json"):
+        pytest.importorskip(backend)
+    project_json = testing.project_json(num_functions=3)
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(project_json))
+
+    assert loader.load_json(path, backend=backend) == project_json
+    project = typedoc.load(path, backend=backend, trusted=True)
+    assert project == reflections.Reflection.from_json(project_json)
+    assert project.get(4).parent is project
+
+
+def test_load_json_empty(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+    with pytest.raises(json.JSONDecodeError):
+        loader.load_json(path, backend="json")
+
+
+def test_unknown_backend(tmp_path):
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        loader.load_json(tmp_path / "api.json", backend="yaml")
+
+
+def test_load_msgspec_engine(tmp_path):
+    pytest.importorskip("msgspec")
+    project_json = testing.project_json(num_functions=3)
+    project_json["children"].append(
+        testing.module_json(id=50, name="m", children=[testing.class_json(51, "C")])
+    )
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(project_json))
+
+    project = typedoc.load(path, engine="msgspec")
+    assert project == reflections.Reflection.from_json(project_json)
+    assert project.get(4).parent is project
+    with pytest.raises(ValueError, match="require"):
+        typedoc.load(path, engine="msgspec", lazy=True)
+
+
+def test_unknown_engine(tmp_path):
+    with pytest.raises(ValueError, match="Unknown engine"):
+        typedoc.load(tmp_path / "api.json", engine="rust")
+
+
+def test_load_stats(tmp_path, capsys):
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(testing.project_json(num_functions=3)))
+
+    stats = types_parser.Stats()
+    typedoc.load(path, stats=stats)
+    assert stats.instances[reflections.ContainerReflection] == 1
+    assert stats.instances[reflections.DeclarationReflection] == 3
+    assert stats.validator_calls["Reflection.name"] == 10
+
+    typedoc.load(path, stats=True)
+    assert "DeclarationReflection" in capsys.readouterr().err
+
+
+def test_load_jobs(tmp_path):
+    project_json = testing.project_json(num_functions=3)
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(project_json))
+
+    project = typedoc.load(path, jobs=2)
+    assert project == reflections.Reflection.from_json(project_json)
+    assert project.get(4).parent is project
+    with pytest.raises(ValueError, match="incompatible"):
+        typedoc.load(path, jobs=2, lazy=True)
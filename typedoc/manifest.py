@@ -0,0 +1,133 @@
+"""Manifest of the generated files, for incremental regeneration."""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any
+
+from typedoc import reflections
+import types_parser
+
+MANIFEST_FILENAME = ".typedoc_manifest.json"
+_VERSION = 1
+
+
+@dataclasses.dataclass
+class Manifest:
+    """Content hash of the generated files.
+
+    Attributes:
+        files: Mapping `filename -> {"hash": ..., "members": [...]}`, where
+            `members` lists the `id`, `fileName` and subtree hash of each
+            reflection rendered in the file.
+    """
+
+    files: dict[str, dict[str, Any]] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def load(cls, output_dir: str | os.PathLike[str]) -> Manifest:
+        """Loads the manifest (empty if missing or from another version)."""
+        path = pathlib.Path(output_dir) / MANIFEST_FILENAME
+        try:
+            content = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls()
+        if content.get("version") != _VERSION:
+            return cls()
+        return cls(files=content["files"])
+
+    def save(self, output_dir: str | os.PathLike[str]) -> None:
+        path = pathlib.Path(output_dir) / MANIFEST_FILENAME
+        tmp_path = path.with_name(path.name + ".tmp")
+        content = {"version": _VERSION, "files": self.files}
+        tmp_path.write_text(json.dumps(content, indent=2, sort_keys=True))
+        os.replace(tmp_path, path)  # Atomic: no partial manifest on crash
+
+
+def file_entry(
+    filename: str, doc: str, members: list[reflections.Reflection]
+) -> dict[str, Any]:
+    """Returns the manifest entry of a file.
+
+    Args:
+        filename: The output file name
+        doc: The module docstring
+        members: The reflections rendered in the file
+
+    Returns:
+        The entry, whose `hash` changes when the rendered file would
+    """
+    member_entries = [
+        {
+            "id": member.id,
+            "fileName": member.sources[0].fileName if member.sources else None,
+            "hash": subtree_hash(member),
+        }
+        for member in members
+    ]
+    h = hashlib.sha256(_generator_hash().encode())
+    h.update(json.dumps([filename, doc]).encode())
+    for entry in member_entries:
+        h.update(json.dumps(entry, sort_keys=True).encode())
+    return {"hash": h.hexdigest(), "members": member_entries}
+
+
+@functools.cache
+def _generator_hash() -> str:
+    """Changing the generator invalidates all files."""
+    from typedoc import codegen  # pylint: disable=g-import-not-at-top
+
+    return hashlib.sha256(pathlib.Path(codegen.__file__).read_bytes()).hexdigest()
+
+
+def subtree_hash(obj: Any) -> str:
+    """Returns the content hash of the `Reflection` (or `Type`,...) subtree.
+
+    The tree is walked iteratively (no recursion limit). `parent` pointers are
+    not fields, so are not followed.
+    """
+    h = hashlib.sha256()
+    # Items are either values to hash, or already encoded `bytes` tokens
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if type(obj) is bytes:
+            h.update(obj)
+        elif obj is None or isinstance(obj, (str, int, float)):
+            h.update(repr(obj).encode())
+            h.update(b",")
+        elif isinstance(obj, enum.Enum):
+            h.update(repr(obj.value).encode())
+            h.update(b",")
+        elif isinstance(obj, (list, tuple, types_parser.LazyList)):
+            h.update(b"[")
+            stack.append(b"],")
+            stack.extend(reversed(obj))
+        elif isinstance(obj, dict):  # Raw JSON (`Any` fields)
+            h.update(b"{")
+            stack.append(b"},")
+            for k, v in sorted(obj.items(), reverse=True):
+                stack.append(v)
+                stack.append(f"{k!r}:".encode())
+        elif isinstance(obj, reflections.ReflectionFlags):
+            h.update(f"flags={obj.bits},".encode())
+        elif dataclasses.is_dataclass(obj):
+            h.update(f"{type(obj).__name__}(".encode())
+            stack.append(b"),")
+            for name in reversed(_field_names(type(obj))):
+                stack.append(getattr(obj, name))
+                stack.append(f"{name}=".encode())
+        else:
+            raise TypeError(f"Cannot hash {type(obj)}: {obj!r}")
+    return h.hexdigest()
+
+
+@functools.cache
+def _field_names(cls) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(cls))
@@ -2,66 +2,129 @@
 
 from __future__ import annotations
 
-import enum
-from typing import Any
+import functools
+import os
+import pathlib
+import typing
+from typing import Any, Iterator
 
 from etils import epy
+from typedoc import building
+from typedoc import interning
+from typedoc import kinds
 from typedoc import types
 from typedoc import utils
 import types_parser
 
 
-class ReflectionKind(epy.StrEnum):
-    def _generate_next_value_(
-        name, start, count, last_values
-    ) -> str:  # pylint: disable=no-self-argument
-        return name
-
-    Accessor = enum.auto()
-    CallSignature = "Call signature"
-    Class = enum.auto()
-    Constructor = enum.auto()
-    ConstructorSignature = "Constructor signature"
-    Enum = "Enumeration"
-    EnumMember = "Enumeration member"
-    Event = enum.auto()
-    Function = enum.auto()
-    GetSignature = enum.auto()
-    IndexSignature = enum.auto()
-    Interface = enum.auto()
-    Method = enum.auto()
-    Module = enum.auto()
-    Namespace = enum.auto()
-    ObjectLiteral = enum.auto()
-    Parameter = enum.auto()
-    Project = enum.auto()
-    Property = enum.auto()
-    Reference = enum.auto()
-    SetSignature = enum.auto()
-    TypeAlias = enum.auto()
-    TypeLiteral = "Type literal"
-    TypeParameter = "Type parameter"
-    Variable = enum.auto()
-
-
-@types_parser.make_dataclass
+ReflectionKind = kinds.ReflectionKind
+KIND_TO_BITMASK = kinds.KIND_TO_BITMASK
+
+
+# `list[Reflection]` fields built on access with `from_json(lazy=True)`
+_LAZY_FIELDS = ("children", "signatures", "parameters")
+
+
 class ReflectionFlags:
-    hasExportAssignment: bool = False
-    isAbstract: bool = False
-    isConst: bool = False
-    isExternal: bool = False
-    isOptional: bool = False
-    isPrivate: bool = False
-    isProtected: bool = False
-    isPublic: bool = False
-    isReadonly: bool = False
-    isRest: bool = False
-    isStatic: bool = False
+    """Flags of a reflection, packed in a single int (`bits`).
 
-    from_json = utils.from_json
+    Instances are immutable and interned: reflections with the same flags
+    share the same instance (most reflections have no flags set).
+    """
+
+    __slots__ = ("bits",)
+
+    hasExportAssignment: bool
+    isAbstract: bool
+    isConst: bool
+    isExternal: bool
+    isOptional: bool
+    isPrivate: bool
+    isProtected: bool
+    isPublic: bool
+    isReadonly: bool
+    isRest: bool
+    isStatic: bool
+
+    # `bits -> ReflectionFlags`
+    _interned: typing.ClassVar[dict[int, ReflectionFlags]] = {}
+
+    def __new__(cls, **flags: bool) -> ReflectionFlags:
+        bits = 0
+        for name, value in flags.items():
+            try:
+                mask = _FLAG_TO_MASK[name]
+            except KeyError:
+                raise TypeError(
+                    f"{cls.__name__}() got an unexpected keyword argument {name!r}"
+                ) from None
+            if not isinstance(value, bool):
+                raise types_parser.InvalidError(
+                    f"{cls.__name__}.{name}: Expected {bool}. Got: {type(value)}"
+                )
+            if value:
+                bits |= mask
+        return cls.from_bits(bits)
+
+    @classmethod
+    def from_bits(cls, bits: int) -> ReflectionFlags:
+        try:
+            return cls._interned[bits]
+        except KeyError:
+            self = object.__new__(cls)
+            object.__setattr__(self, "bits", bits)
+            return cls._interned.setdefault(bits, self)
+
+    @classmethod
+    def from_json(cls, value, *, trusted: bool = False) -> ReflectionFlags:
+        if isinstance(value, dict):
+            if trusted:  # Unknown flags are ignored
+                bits = 0
+                for name, flag in value.items():
+                    if flag:
+                        bits |= _FLAG_TO_MASK.get(name, 0)
+                return cls.from_bits(bits)
+            return cls(**value)
+        elif isinstance(value, cls) or value is None:
+            return value
+        else:
+            raise TypeError(f"{cls.__name__} got unexpected: {type(value)}")
 
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
 
-@types_parser.make_dataclass
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ReflectionFlags):
+            return self.bits == other.bits
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        flags = [f"{name}=True" for name in _FLAG_TO_MASK if getattr(self, name)]
+        return f"{type(self).__name__}({', '.join(flags)})"
+
+    def __reduce__(self):
+        return (ReflectionFlags.from_bits, (self.bits,))
+
+
+_FLAG_TO_MASK = {
+    name: 1 << i
+    for i, name in enumerate(
+        k for k, v in ReflectionFlags.__annotations__.items() if v == "bool"
+    )
+}
+for _name, _mask in _FLAG_TO_MASK.items():
+    setattr(
+        ReflectionFlags,
+        _name,
+        property(lambda self, mask=_mask: bool(self.bits & mask)),
+    )
+del _name, _mask
+
+
+@types_parser.make_dataclass(slots=True)
 class SourceReference:
     character: int
     fileName: str
@@ -70,9 +133,10 @@ class SourceReference:
     url: str | None = None
 
     from_json = utils.from_json
+    from_json_list = utils.from_json_list
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
 class Comment:
     returns: str | None = None
     shortText: str | None = None
@@ -82,8 +146,12 @@ class Comment:
     from_json = utils.from_json
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
 class Reflection:
+    # Non-field attributes. Not pickled (the full project would be pickled
+    # with each reflection).
+    __slots__ = ("_parent",)
+
     id: int
     name: str
     kind: ReflectionKind
@@ -92,45 +160,204 @@ class Reflection:
     comment: Comment | None = None
 
     @classmethod
-    def from_json(cls, value) -> Reflection:
-        value = dict(value)
-        value.pop("kind")
-        value["kind"] = ReflectionKind(value.pop("kindString"))
-        kind_to_cls = {
-            ReflectionKind.Reference: ReferenceReflection,
-            ReflectionKind.Project: ContainerReflection,
-            ReflectionKind.Namespace: ContainerReflection,
-            ReflectionKind.Enum: ContainerReflection,
-            ReflectionKind.Class: DeclarationReflection,
-            ReflectionKind.Function: DeclarationReflection,
-            ReflectionKind.Method: DeclarationReflection,
-            ReflectionKind.TypeLiteral: DeclarationReflection,
-            ReflectionKind.Constructor: DeclarationReflection,
-            ReflectionKind.Property: DeclarationReflection,
-            ReflectionKind.CallSignature: SignatureReflection,
-            ReflectionKind.ConstructorSignature: SignatureReflection,
-            ReflectionKind.Parameter: ParameterReflection,
-            ReflectionKind.Variable: ParameterReflection,
-            ReflectionKind.EnumMember: ParameterReflection,
-            ReflectionKind.TypeParameter: TypeParameterReflection,
-        }
-        cls = kind_to_cls.get(value["kind"], Reflection)
+    def from_json(
+        cls,
+        value,
+        *,
+        trusted: bool = False,
+        lazy: bool = False,
+        intern: bool | interning.Interner = False,
+    ) -> Reflection:
+        """Builds the `Reflection` subclass matching the `kindString`.
 
+        Args:
+            value: The TypeDoc JSON dict
+            trusted: If `True`, skip the validation (faster). Only for input
+                known to be valid, like TypeDoc output generated by us.
+            lazy: If `True`, the `children`, `signatures` and `parameters`
+                are only built (recursively lazily) when accessed.
+            intern: If `True` (or an `Interner` to collect the number of shared
+                objects), equal strings and simple type nodes are shared
+                across the tree. See `typedoc.Interner`.
+
+        Returns:
+            The reflection
+        """
+        interner = interning.resolve(intern)
+        if interner is not None and interning.current() is not interner:
+            with interner.activate():
+                return cls.from_json(
+                    value, trusted=trusted, lazy=lazy, intern=interner
+                )
+        if lazy:  # Each level is only built when accessed
+            return _from_json_node(value, trusted=trusted, lazy=True)
+        depth = building.DEPTH.value
+        if depth >= building.MAX_RECURSIVE_DEPTH:  # Too deep for recursion
+            return building.build_iteratively(value, Reflection, trusted=trusted)
+        building.DEPTH.value = depth + 1
         try:
-            return cls(**value)
+            return _from_json_node(value, trusted=trusted)
+        finally:
+            building.DEPTH.value = depth
+
+    @property
+    def parent(self) -> Reflection | None:
+        """The parent reflection (set once the project index is built)."""
+        return getattr(self, "_parent", None)
+
+
+def _from_json_node(value, *, trusted: bool, lazy: bool = False) -> Reflection:
+    """Builds a single reflection (see `Reflection.from_json`).
+
+    Nested reflections and types are built with their `from_json`, unless
+    already built (by `building.build_iteratively`).
+    """
+    interner = interning.current()
+    if interner is None:
+        value = value.copy()
+    else:
+        value = interner.intern_dict(value)
+    try:
+        kind, cls = _JSON_KIND_TO_CLS[value.get("kindString") or value["kind"]]
+    except KeyError:
+        raise ValueError(
+            f"Unknown reflection kind: {value.get('kindString')} "
+            f"({value.get('kind')})"
+        ) from None
+    value["kind"] = kind
+    value.pop("kindString", None)
+
+    if lazy:
+        # The interner is passed explicitly as the conversion happens after
+        # the load
+        convert = functools.partial(
+            Reflection.from_json,
+            trusted=trusted,
+            lazy=True,
+            intern=interner or False,
+        )
+        for name in _LAZY_FIELDS:
+            if value.get(name) is not None:
+                value[name] = types_parser.LazyList(value[name], convert)
+    if trusted:
+        reflection = types_parser.from_trusted(cls, value)
+    else:
+        try:
+            reflection = cls(**value)
+        except types_parser.InvalidError:
+            raise  # Structured: the JSON path is added by the validators
         except Exception as e:
             msg = f'{cls.__name__} ({value["kind"]}): {value["name"]}: {list(value)}'
             epy.reraise(e, prefix="\n" + msg + "\n")
+    # In lazy mode, the index is only built on the first `.get(id)`
+    if reflection.kind is ReflectionKind.Project and not lazy:
+        reflection._build_index()
+    return reflection
+
+
+_KIND_TO_CLS: dict[ReflectionKind, type[Reflection]] = {}
+
+
+def _register(*kinds: ReflectionKind):
+    """Registers the `Reflection` subclass built for the `kinds`.
+
+    Should be the outermost decorator (`make_dataclass(slots=True)` re-creates
+    the class).
+    """
+
+    def decorator(cls):
+        for kind in kinds:
+            if kind in _KIND_TO_CLS:
+                raise ValueError(f"{kind} already registered: {_KIND_TO_CLS[kind]}")
+            _KIND_TO_CLS[kind] = cls
+        return cls
+
+    return decorator
 
 
-@types_parser.make_dataclass
+@_register(
+    ReflectionKind.Project,
+    ReflectionKind.Module,
+    ReflectionKind.Namespace,
+    ReflectionKind.Enum,
+)
+@types_parser.make_dataclass(slots=True)
 class ContainerReflection(Reflection):
     children: list[Reflection] | None = None
     categories: Any = None  # Unused
     groups: Any = None  # Unused
 
+    # `id -> Reflection` of the full tree, only set on the project
+    __slots__ = ("_index",)
+
+    def get(self, id: int) -> Reflection:  # pylint: disable=redefined-builtin
+        """Returns the reflection of the project with the given `id`.
+
+        Used to resolve `ReferenceReflection.target` and
+        `types.ReferenceType.id` in O(1).
+
+        Args:
+            id: The reflection id
+
+        Returns:
+            The reflection
+        """
+        if self.kind is not ReflectionKind.Project:
+            raise ValueError(
+                f"`.get(id)` should be called on the project. Got: {self.kind}"
+            )
+        if getattr(self, "_index", None) is None:
+            self._build_index()
+        return self._index[id]
+
+    def save_as_python(
+        self,
+        output_dir: str | os.PathLike[str],
+        *,
+        jobs: int | None = None,
+        force: bool = False,
+    ) -> list[pathlib.Path]:
+        """Generates the Python API of the project.
+
+        See `typedoc.codegen.save_as_python` for details.
+
+        Args:
+            output_dir: Directory in which the `.py` files are written
+            jobs: Number of worker processes (`1` to render serially)
+            force: Regenerate all files, even the unchanged ones
 
-@types_parser.make_dataclass
+        Returns:
+            The generated files
+        """
+        from typedoc import codegen  # pylint: disable=g-import-not-at-top
+
+        return codegen.save_as_python(self, output_dir, jobs=jobs, force=force)
+
+    def _build_index(self) -> None:
+        """Indexes all reflections of the tree and sets their `.parent`."""
+        index = {self.id: self}
+        stack = [self]
+        while stack:
+            parent = stack.pop()
+            for child in _iter_nested_reflections(parent):
+                object.__setattr__(child, "_parent", parent)
+                index[child.id] = child
+                stack.append(child)
+        object.__setattr__(self, "_index", index)
+
+
+@_register(
+    ReflectionKind.Class,
+    ReflectionKind.Interface,
+    ReflectionKind.Function,
+    ReflectionKind.Method,
+    ReflectionKind.TypeLiteral,
+    ReflectionKind.TypeAlias,
+    ReflectionKind.Constructor,
+    ReflectionKind.Property,
+    ReflectionKind.Accessor,
+)
+@types_parser.make_dataclass(slots=True)
 class DeclarationReflection(ContainerReflection):
     signatures: list[SignatureReflection] | None = None
     # Inheritance
@@ -141,19 +368,31 @@ class DeclarationReflection(ContainerReflection):
     inheritedFrom: None | types.ReferenceType = None
     type: None | types.Type = None
     indexSignature: SignatureReflection | None = None
+    # Accessors (`get x(): T`, `set x(value: T)`)
+    getSignature: SignatureReflection | None = None
+    setSignature: SignatureReflection | None = None
 
 
-@types_parser.make_dataclass
+@_register(ReflectionKind.Reference)
+@types_parser.make_dataclass(slots=True)
 class ReferenceReflection(DeclarationReflection):
     target: int
 
 
-@types_parser.make_dataclass
+@_register(ReflectionKind.TypeParameter)
+@types_parser.make_dataclass(slots=True)
 class TypeParameterReflection(Reflection):
     type: types.Type = None
 
 
-@types_parser.make_dataclass
+@_register(
+    ReflectionKind.CallSignature,
+    ReflectionKind.ConstructorSignature,
+    ReflectionKind.IndexSignature,
+    ReflectionKind.GetSignature,
+    ReflectionKind.SetSignature,
+)
+@types_parser.make_dataclass(slots=True)
 class SignatureReflection(Reflection):
     parameters: list[ParameterReflection] | None = None
     type: types.Type
@@ -164,8 +403,62 @@ class SignatureReflection(Reflection):
     typeParameter: None | list[TypeParameterReflection] = None
 
 
-@types_parser.make_dataclass
+@_register(
+    ReflectionKind.Parameter,
+    ReflectionKind.Variable,
+    ReflectionKind.EnumMember,
+)
+@types_parser.make_dataclass(slots=True)
 class ParameterReflection(Reflection):
     type: types.Type | None = None
     # Only used for Enum ?
     defaultValue: str = ""
+
+
+def _make_json_kind_to_cls() -> dict[str | int, tuple[ReflectionKind, type]]:
+    """Returns `kindString` and numeric `kind` -> `(kind, cls)`."""
+    json_kind_to_cls = {}
+    for kind in ReflectionKind:
+        kind_and_cls = (kind, _KIND_TO_CLS.get(kind, Reflection))
+        json_kind_to_cls[kind.value] = kind_and_cls
+        if kind in kinds.KIND_TO_BITMASK:
+            json_kind_to_cls[kinds.KIND_TO_BITMASK[kind]] = kind_and_cls
+    return json_kind_to_cls
+
+
+# Built once, after all subclasses are registered
+_JSON_KIND_TO_CLS = _make_json_kind_to_cls()
+
+
+def _iter_nested_reflections(reflection: Reflection) -> Iterator[Reflection]:
+    """Yields the reflections directly nested in `reflection`.
+
+    Includes the ones nested inside types (e.g. `types.ReflectionType`).
+    """
+    stack = [getattr(reflection, name) for name in _nested_fields(type(reflection))]
+    while stack:
+        value = stack.pop()
+        if value is None:
+            continue
+        elif isinstance(value, Reflection):
+            yield value
+        elif isinstance(value, types.Type):
+            stack.extend(getattr(value, name) for name in _nested_fields(type(value)))
+        elif not isinstance(value, str):  # Lists and tuples (template tails)
+            stack.extend(value)
+
+
+@functools.cache
+def _nested_fields(cls) -> tuple[str, ...]:
+    """Fields of `cls` which can contain a `Reflection` or `types.Type`."""
+    return tuple(
+        name
+        for name, hint in types_parser.get_type_hints(cls).items()
+        if _contains_nested(hint)
+    )
+
+
+def _contains_nested(hint) -> bool:
+    if isinstance(hint, type) and issubclass(hint, (Reflection, types.Type)):
+        return True
+    return any(_contains_nested(arg) for arg in typing.get_args(hint))
@@ -0,0 +1,325 @@
+import json
+import pickle
+
+import pytest
+from typedoc import interning
+from typedoc import reflections
+from typedoc import testing
+from typedoc import types
+import types_parser
+
+
+def test_from_json():
+    project = reflections.Reflection.from_json(testing.project_json())
+    assert isinstance(project, reflections.ContainerReflection)
+    (fn,) = project.children
+    assert isinstance(fn, reflections.DeclarationReflection)
+    assert fn.flags.isConst
+    (sig,) = fn.signatures
+    assert sig.kind == reflections.ReflectionKind.CallSignature
+    assert sig.parameters[0].type == types.IntrinsicType(
+        type="intrinsic", name="string"
+    )
+
+
+def test_from_json_trusted():
+    project = reflections.Reflection.from_json(testing.project_json(), trusted=True)
+    assert project == reflections.Reflection.from_json(testing.project_json())
+
+
+def test_from_json_template_literal():
+    # `` x: `a${string}b` ``: the tail is a list of `(type, text)` tuples
+    template_json = {
+        "type": "template-literal",
+        "head": "a",
+        "tail": [[{"type": "intrinsic", "name": "string"}, "b"]],
+    }
+    project_json = testing.project_json(num_functions=0)
+    project_json["children"] = [
+        {"id": 1, "name": "x", "kind": 32, "flags": {}, "type": template_json}
+    ]
+    project = reflections.Reflection.from_json(project_json)
+    ((type_, text),) = project.get(1).type.tail
+    assert type_ == types.IntrinsicType(type="intrinsic", name="string")
+    assert text == "b"
+
+
+def _drop_kind_strings(value):
+    if isinstance(value, dict):
+        return {
+            k: _drop_kind_strings(v) for k, v in value.items() if k != "kindString"
+        }
+    elif isinstance(value, list):
+        return [_drop_kind_strings(v) for v in value]
+    return value
+
+
+def test_from_json_invalid_path():
+    value = json.loads(json.dumps(testing.project_json()))
+    value["children"][0]["signatures"][0]["parameters"][0]["type"] = 123
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        reflections.Reflection.from_json(value)
+    e = exc_info.value
+    assert e.path == "$.children[0].signatures[0].parameters[0].type"
+    assert e.value == 123
+    assert str(e).startswith(e.path + ": Expected")
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_numeric_kind(trusted: bool):
+    # TypeDoc >= 0.24 only has the numeric `kind`
+    project_json = _drop_kind_strings(testing.project_json(num_functions=2))
+    project = reflections.Reflection.from_json(project_json, trusted=trusted)
+    assert project == reflections.Reflection.from_json(testing.project_json(2))
+    assert project.kind is reflections.ReflectionKind.Project
+    assert type(project.children[0].signatures[0]) is reflections.SignatureReflection
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_kind_strings(trusted: bool):
+    # Multi-word `kindString` are space separated
+    alias_json = {
+        "id": 2,
+        "name": "Id",
+        "kind": 0x200000,
+        "kindString": "Type alias",
+        "flags": {},
+        "type": {"type": "intrinsic", "name": "string"},
+    }
+    project_json = testing.project_json() | {"children": [alias_json]}
+    project = reflections.Reflection.from_json(project_json, trusted=trusted)
+    (alias,) = project.children
+    assert alias.kind is reflections.ReflectionKind.TypeAlias
+    for kind_string in ("Get signature", "Set signature", "Index signature"):
+        assert reflections.ReflectionKind(kind_string).value == kind_string
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_type_parameter(trusted: bool):
+    # Type parameter without constraint (`<T>`)
+    value = {"id": 3, "name": "T", "kindString": "Type parameter", "flags": {}}
+    reflection = reflections.Reflection.from_json(value, trusted=trusted)
+    assert isinstance(reflection, reflections.TypeParameterReflection)
+    assert reflection.type is None
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_accessor(trusted: bool):
+    class_json = testing.class_json(id=1, name="C")
+    class_json["children"].append(testing.accessor_json(id=10, name="size"))
+    project_json = testing.project_json(num_functions=0)
+    project_json["children"] = [class_json]
+    project = reflections.Reflection.from_json(project_json, trusted=trusted)
+    accessor = project.get(10)
+    assert accessor.kind is reflections.ReflectionKind.Accessor
+    assert accessor.getSignature.kind is reflections.ReflectionKind.GetSignature
+    assert accessor.getSignature.type == types.IntrinsicType(
+        type="intrinsic", name="number"
+    )
+    assert project.get(11) is accessor.getSignature
+
+
+def test_from_json_unknown_kind():
+    value = testing.function_json(id=1, name="fn") | {"kindString": "Unknown"}
+    with pytest.raises(ValueError, match="Unknown reflection kind"):
+        reflections.Reflection.from_json(value)
+
+
+def test_register_duplicate():
+    with pytest.raises(ValueError, match="already registered"):
+        reflections._register(reflections.ReflectionKind.Class)(
+            reflections.Reflection
+        )
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_intern(trusted: bool):
+    # Round-trip, so equal strings are different objects, like in a real load
+    project_json = json.loads(json.dumps(testing.project_json(num_functions=3)))
+    interner = interning.Interner()
+    project = reflections.Reflection.from_json(
+        project_json, trusted=trusted, intern=interner
+    )
+    assert project == reflections.Reflection.from_json(project_json)
+    fn0, fn1, _ = project.children
+    type0 = fn0.signatures[0].parameters[0].type
+    type1 = fn1.signatures[0].parameters[0].type
+    assert type0 is type1
+    assert fn0.sources[0].fileName is fn1.sources[0].fileName
+    assert interner.num_shared_nodes > 0
+    assert interner.num_shared_strings > 0
+    assert interning.current() is None  # Reset after the load
+
+
+def test_type_from_json_intern():
+    interner = interning.Interner()
+    values = json.loads("""[
+        {"type": "literal", "value": 1},
+        {"type": "literal", "value": true},
+        {"type": "literal", "value": 1},
+        {"type": "array", "elementType": {"type": "intrinsic", "name": "x"}}
+    ]""")
+    t0, t1, t2, t3 = [types.Type.from_json(v, intern=interner) for v in values]
+    assert t0 is t2
+    assert t0 is not t1  # `True == 1`, but different literals
+    assert t1.value is True
+    assert isinstance(t3, types.ArrayType)
+    assert repr(interner) == "Interner(strings=1/5 shared, nodes=1/4 shared)"
+
+
+def test_from_json_lazy():
+    project_json = testing.project_json(num_functions=3)
+    project = reflections.Reflection.from_json(project_json, lazy=True)
+    assert isinstance(project.children, types_parser.LazyList)
+    assert repr(project.children) == "LazyList(0/3 converted)"
+    fn = project.children[1]
+    assert fn.name == "fn1"
+    assert isinstance(fn.signatures, types_parser.LazyList)
+    assert repr(project.children) == "LazyList(1/3 converted)"
+    assert project.children[1] is fn
+
+    assert project == reflections.Reflection.from_json(project_json)
+    lazy_trusted = reflections.Reflection.from_json(
+        project_json, lazy=True, trusted=True
+    )
+    assert lazy_trusted == project
+
+
+def test_from_json_lazy_invalid():
+    project_json = testing.project_json(num_functions=2)
+    # A function is not a `SignatureReflection`
+    project_json["children"][1]["signatures"].append(testing.function_json(9, "f"))
+    project = reflections.Reflection.from_json(project_json, lazy=True)
+    fn = project.children[1]
+    assert fn.signatures[0].name == "fn1"
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        fn.signatures[1]
+    assert exc_info.value.path == "$[1]"
+
+
+def test_index():
+    project_json = testing.project_json(num_functions=2)
+    # Reflection nested inside a type: `fn1(x?: string): { y: string }`
+    fn1_sig = project_json["children"][1]["signatures"][0]
+    fn1_sig["type"] = {
+        "type": "reflection",
+        "declaration": {
+            "id": 100,
+            "name": "__type",
+            "kind": 65536,
+            "kindString": "Type literal",
+            "flags": {},
+        },
+    }
+    for lazy in (False, True):
+        project = reflections.Reflection.from_json(project_json, lazy=lazy)
+        assert project.parent is None
+        fn1 = project.get(4)
+        assert fn1.name == "fn1"
+        assert fn1.parent is project
+        param = project.get(6)
+        assert param.name == "x"
+        assert param.parent.parent is fn1
+        assert project.get(100).parent is project.get(5)
+        with pytest.raises(KeyError):
+            project.get(1234)
+        with pytest.raises(ValueError, match="project"):
+            fn1.get(4)
+
+
+def test_flags():
+    flags = reflections.ReflectionFlags(isConst=True, isStatic=False)
+    assert flags.isConst
+    assert not flags.isStatic
+    assert flags is reflections.ReflectionFlags.from_json({"isConst": True})
+    assert reflections.ReflectionFlags() is reflections.ReflectionFlags.from_bits(0)
+    assert repr(flags) == "ReflectionFlags(isConst=True)"
+    assert pickle.loads(pickle.dumps(flags)) is flags
+    with pytest.raises(AttributeError):
+        flags.isConst = False
+    with pytest.raises(TypeError):
+        reflections.ReflectionFlags(isUnknown=True)
+    with pytest.raises(types_parser.InvalidError):
+        reflections.ReflectionFlags(isConst=1)
+    trusted = reflections.ReflectionFlags.from_json(
+        {"isConst": True, "isUnknown": True}, trusted=True
+    )
+    assert trusted is flags
+
+    project = reflections.Reflection.from_json(testing.project_json(2))
+    assert project.get(1).flags is project.get(4).flags
+    assert not hasattr(project.get(1), "__dict__")
+
+
+def test_lazy_import():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, typedoc\n"
+        "kind = typedoc.ReflectionKind('CALL SIGNATURE')\n"
+        "assert kind is typedoc.ReflectionKind.CallSignature\n"
+        "assert 'typedoc.reflections' not in sys.modules\n"
+        "assert typedoc.Reflection is sys.modules['typedoc.reflections'].Reflection\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_synthetic_project_json():
+    value = testing.synthetic_project_json(500, depth=4, seed=1)
+    assert value == testing.synthetic_project_json(500, depth=4, seed=1)
+    assert value != testing.synthetic_project_json(500, depth=4, seed=2)
+    project = reflections.Reflection.from_json(value)
+    # 4 nested modules
+    modules = [m for m in project._index.values() if m.kind == "Module"]
+    assert len(modules) == 4
+    assert 500 <= len(project._index) - 5 < 500 + 7 * 4  # Per-module overshoot
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_deep(trusted: bool):
+    # Deeper than the recursion limit
+    value = testing.synthetic_project_json(2_000, depth=1_000)
+    project = reflections.Reflection.from_json(value, trusted=trusted)
+    modules = [m for m in project._index.values() if m.kind == "Module"]
+    assert len(modules) == 1_000
+    (innermost,) = [
+        m for m in modules if not any(c.kind == "Module" for c in m.children)
+    ]
+    num_ancestors = 0
+    while innermost.parent is not None:
+        innermost = innermost.parent
+        num_ancestors += 1
+    assert innermost is project
+    assert num_ancestors == 1_000
+
+
+def test_from_json_deep_invalid_path():
+    value = testing.synthetic_project_json(100, depth=100)
+    node = value
+    path = "$"
+    for _ in range(100):
+        i = len(node["children"]) - 1  # The nested module is last
+        node = node["children"][i]
+        path += f".children[{i}]"
+    node["name"] = 123
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        reflections.Reflection.from_json(value)
+    assert exc_info.value.path == path + ".name"
+
+
+def test_type_from_json_deep():
+    value = {"type": "intrinsic", "name": "string"}
+    for i in range(5_000):  # Templates contain `(type, str)` tuples
+        value = {"type": "template-literal", "head": "", "tail": [[value, f"{i}"]]}
+    project_json = testing.project_json(num_functions=0)
+    project_json["children"] = [
+        {"id": 1, "name": "x", "kind": 32, "flags": {}, "type": value}
+    ]
+    project = reflections.Reflection.from_json(project_json)
+    type_ = project.get(1).type
+    for i in reversed(range(5_000)):
+        assert isinstance(type_, types.TemplateLiteralType)
+        ((type_, text),) = type_.tail
+        assert text == f"{i}"
+    assert type_ == types.IntrinsicType(type="intrinsic", name="string")
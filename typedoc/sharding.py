@@ -0,0 +1,148 @@
+"""Multiprocess construction of a project, sharded by top-level child.
+
+Building the `Reflection` tree is CPU-bound pure Python, so a single
+`api.json` only uses one core. Instead, the project `children` are split
+into shards of about the same JSON size, and each shard is built in a
+separate process:
+
+* Each shard is sent to its worker as compact JSON bytes, re-encoded by the
+  native backend (a single buffer copy, rather than pickling the dicts).
+* The worker returns its reflections pickled, like the `typedoc.cache`
+  binary tree format.
+* The parent unpickles the shards in order and builds the project around
+  them (the plans keep the already built children as-is), so the ids,
+  the project index and the `.parent` pointers are the same as with
+  `Reflection.from_json`.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import json
+import os
+import pickle
+from typing import Any, Callable
+
+from typedoc import loader
+from typedoc import reflections
+import types_parser
+
+_PICKLE_PROTOCOL = 5
+
+# Shards per process, so the load is balanced when a few children are much
+# bigger than the others
+_SHARDS_PER_JOB = 4
+
+
+def from_json(
+    value: dict[str, Any],
+    *,
+    jobs: int | None = None,
+    trusted: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+) -> reflections.Reflection:
+    """Like `Reflection.from_json`, with the children built in parallel.
+
+    Args:
+        value: The TypeDoc JSON dict of the project
+        jobs: Number of processes (default to the number of CPUs). With an
+            `executor`, only used to size the shards.
+        trusted: Forwarded to `Reflection.from_json`
+        executor: Process pool to reuse (e.g. across projects). By default,
+            a pool of `jobs` processes is created for the call.
+
+    Returns:
+        The project reflection
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    children = value.get("children")
+    if not children or (executor is None and jobs <= 1):
+        return reflections.Reflection.from_json(value, trusted=trusted)
+    if executor is None:
+        executor_cm = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    else:  # Not shut down
+        executor_cm = contextlib.nullcontext(executor)
+
+    shards = _split(children, num_shards=jobs * _SHARDS_PER_JOB)
+    built = []
+    with executor_cm as pool:
+        futures = [
+            pool.submit(_build_shard, data, trusted=trusted)
+            for _, _, data in shards
+        ]
+        for (start, stop, _), future in zip(shards, futures):
+            try:
+                built.extend(pickle.loads(future.result()))
+            except Exception:  # pylint: disable=broad-except
+                # Invalid child, or worker failure: re-built here, so the
+                # error (if any) is raised with its JSON path
+                built.extend(_build_children(children, start, stop, trusted))
+    return reflections.Reflection.from_json(
+        value | {"children": built}, trusted=trusted
+    )
+
+
+def _split(
+    children: list[Any], *, num_shards: int
+) -> list[tuple[int, int, bytes]]:
+    """Returns the `(start, stop, json_bytes)` of consecutive children."""
+    dumps = _get_dumps()
+    encoded = [dumps(child) for child in children]
+    shard_size = sum(len(data) for data in encoded) / num_shards
+    shards = []
+    start = 0
+    size = 0
+    for i, data in enumerate(encoded):
+        size += len(data)
+        if size >= shard_size or i == len(encoded) - 1:
+            data = b"[" + b",".join(encoded[start : i + 1]) + b"]"
+            shards.append((start, i + 1, data))
+            start = i + 1
+            size = 0
+    return shards
+
+
+def _build_shard(data: bytes, *, trusted: bool) -> bytes:
+    """Returns the pickled reflections of the JSON list `data` (in a worker)."""
+    loads, _ = loader._get_backend("auto")  # pylint: disable=protected-access
+    with loader._gc_paused():  # pylint: disable=protected-access
+        children = loads(data)
+        built = [
+            reflections.Reflection.from_json(child, trusted=trusted)
+            for child in children
+        ]
+    return pickle.dumps(built, protocol=_PICKLE_PROTOCOL)
+
+
+def _build_children(
+    children: list[Any], start: int, stop: int, trusted: bool
+) -> list[reflections.Reflection]:
+    built = []
+    for i in range(start, stop):
+        try:
+            child = reflections.Reflection.from_json(children[i], trusted=trusted)
+        except types_parser.InvalidError as e:
+            e._add_key(i)  # pylint: disable=protected-access
+            e._add_key("children")  # pylint: disable=protected-access
+            raise
+        built.append(child)
+    return built
+
+
+def _get_dumps() -> Callable[[Any], bytes]:
+    """Returns the fastest installed JSON encoder (to `bytes`)."""
+    try:
+        import orjson  # pylint: disable=g-import-not-at-top
+
+        return orjson.dumps
+    except ImportError:
+        pass
+    try:
+        import msgspec  # pylint: disable=g-import-not-at-top
+
+        return msgspec.json.encode
+    except ImportError:
+        pass
+    return lambda value: json.dumps(value, separators=(",", ":")).encode()
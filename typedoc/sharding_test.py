@@ -0,0 +1,50 @@
+import concurrent.futures
+import json
+
+import pytest
+from typedoc import reflections
+from typedoc import sharding
+from typedoc import testing
+import types_parser
+
+
+def _project_json():
+    project_json = testing.project_json(num_functions=5)
+    for i in range(3):
+        module_id = 100 + 10 * i
+        project_json["children"].append(
+            testing.module_json(
+                id=module_id,
+                name=f"m{i}",
+                children=[testing.class_json(module_id + 1, f"C{i}")],
+            )
+        )
+    return project_json
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json(trusted: bool):
+    project_json = _project_json()
+    project = sharding.from_json(project_json, jobs=2, trusted=trusted)
+    assert project == reflections.Reflection.from_json(project_json)
+    assert [c.id for c in project.children] == [
+        c["id"] for c in project_json["children"]
+    ]
+    assert project.get(111).parent is project.get(110)
+    assert project.get(110).parent is project
+
+
+def test_from_json_executor():
+    project_json = _project_json()
+    expected = reflections.Reflection.from_json(project_json)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):  # The pool is reused
+            assert sharding.from_json(project_json, executor=executor) == expected
+
+
+def test_from_json_invalid_path():
+    project_json = json.loads(json.dumps(_project_json()))
+    project_json["children"][6]["children"][0]["name"] = 123
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        sharding.from_json(project_json, jobs=2)
+    assert exc_info.value.path == "$.children[6].children[0].name"
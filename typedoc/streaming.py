@@ -0,0 +1,138 @@
+"""Streaming loader for large `api.json` files."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Any, Iterator, TextIO
+
+from typedoc import reflections
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def iter_children(
+    path: str | os.PathLike[str] | TextIO,
+    *,
+    trusted: bool = False,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[reflections.Reflection]:
+    """Yields the top-level `children` of the project, one at a time.
+
+    Contrary to `Reflection.from_json(json.load(f))`, the file is read
+    incrementally and the raw JSON dict of each child is dropped as soon as
+    the child is built, so memory is bounded by the largest child (e.g. a
+    module) rather than the whole project. The other project fields are
+    skipped.
+
+    Args:
+        path: The `api.json` path (or text file object)
+        trusted: Forwarded to `Reflection.from_json`
+        chunk_size: Number of characters read at once
+
+    Yields:
+        The project children `Reflection`
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        yield from _iter_children(_Reader(path, chunk_size), trusted=trusted)
+        return
+    with open(path, encoding="utf-8") as f:
+        yield from _iter_children(_Reader(f, chunk_size), trusted=trusted)
+
+
+def _iter_children(
+    reader: _Reader, *, trusted: bool
+) -> Iterator[reflections.Reflection]:
+    reader.expect("{")
+    if reader.consume("}"):
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "children":
+            reader.expect("[")
+            if not reader.consume("]"):
+                while True:
+                    child = reader.value()
+                    child = reflections.Reflection.from_json(child, trusted=trusted)
+                    yield child
+                    del child
+                    if not reader.consume(","):
+                        reader.expect("]")
+                        break
+        else:
+            reader.value()
+        if not reader.consume(","):
+            reader.expect("}")
+            return
+
+
+class _Reader:
+    """Decodes JSON values one by one from a text file."""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Reads more data. Returns `False` at the end of the file."""
+        if self._eof:
+            return False
+        # Read at least as much as buffered, so a value spanning many chunks
+        # is re-decoded O(log(size)) times rather than O(size / chunk_size)
+        pending = self._buffer[self._pos :]
+        chunk = self._f.read(max(self._chunk_size, len(pending)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = pending + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character (without consuming it)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end", self._buffer, self._pos)
+
+    def consume(self, char: str) -> bool:
+        """Consumes `char` if it is the next character."""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        if not self.consume(char):
+            raise json.JSONDecodeError(
+                f"Expecting {char!r}", self._buffer, self._pos
+            )
+
+    def value(self) -> Any:
+        """Decodes the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():  # The value might be truncated
+                    continue
+                raise
+            # Numbers can be truncated at the end of the buffer
+            if end == len(self._buffer) and self._fill():
+                continue
+            break
+        self._pos = end
+        if self._pos > self._chunk_size:  # Release the consumed text
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        return value
@@ -0,0 +1,29 @@
+import io
+import json
+
+import pytest
+from typedoc import reflections
+from typedoc import streaming
+from typedoc import testing
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+def test_iter_children(tmp_path, chunk_size):
+    project_json = testing.project_json(num_functions=5)
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(project_json, indent=2))
+
+    children = list(streaming.iter_children(path, chunk_size=chunk_size))
+    project = reflections.Reflection.from_json(project_json)
+    assert children == project.children
+
+
+def test_iter_children_empty():
+    f = io.StringIO('{"id": 0, "children": []}')
+    assert list(streaming.iter_children(f)) == []
+    assert list(streaming.iter_children(io.StringIO("{}"))) == []
+
+
+def test_iter_children_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        list(streaming.iter_children(io.StringIO('{"id": 0, "children": [{')))
@@ -0,0 +1,274 @@
+"""Test utils."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Iterator
+
+
+def project_json(num_functions: int = 1) -> dict[str, Any]:
+    """Returns a small TypeDoc project, with `fn0`, `fn1`,... functions."""
+    return {
+        "id": 0,
+        "name": "my-project",
+        "kind": 1,
+        "kindString": "Project",
+        "flags": {},
+        "children": [
+            function_json(id=1 + 3 * i, name=f"fn{i}") for i in range(num_functions)
+        ],
+        "groups": [{"title": "Functions", "kind": 64}],
+    }
+
+
+def function_json(
+    id: int,  # pylint: disable=redefined-builtin
+    name: str,
+) -> dict[str, Any]:
+    """Returns a `name(x?: string): void | null` function (uses 3 ids)."""
+    return {
+        "id": id,
+        "name": name,
+        "kind": 64,
+        "kindString": "Function",
+        "flags": {"isConst": True},
+        "sources": [{"fileName": "a.ts", "line": 1, "character": 0}],
+        "signatures": [
+            {
+                "id": id + 1,
+                "name": name,
+                "kind": 4096,
+                "kindString": "Call signature",
+                "flags": {},
+                "parameters": [
+                    {
+                        "id": id + 2,
+                        "name": "x",
+                        "kind": 32768,
+                        "kindString": "Parameter",
+                        "flags": {"isOptional": True},
+                        "type": {"type": "intrinsic", "name": "string"},
+                    }
+                ],
+                "type": {
+                    "type": "union",
+                    "types": [
+                        {"type": "intrinsic", "name": "void"},
+                        {"type": "literal", "value": None},
+                    ],
+                },
+            }
+        ],
+    }
+
+
+def module_json(
+    id: int,  # pylint: disable=redefined-builtin
+    name: str,
+    children: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Returns a module containing the `children`."""
+    return {
+        "id": id,
+        "name": f'"{name}"',
+        "kind": 2,
+        "kindString": "Module",
+        "flags": {},
+        "comment": {"shortText": f"Module {name}."},
+        "children": children,
+    }
+
+
+def class_json(
+    id: int,  # pylint: disable=redefined-builtin
+    name: str,
+) -> dict[str, Any]:
+    """Returns a class with a constructor, a property and a method (7 ids)."""
+    return {
+        "id": id,
+        "name": name,
+        "kind": 128,
+        "kindString": "Class",
+        "flags": {},
+        "comment": {"shortText": "A class."},
+        "children": [
+            {
+                "id": id + 1,
+                "name": "constructor",
+                "kind": 512,
+                "kindString": "Constructor",
+                "flags": {},
+                "signatures": [
+                    {
+                        "id": id + 2,
+                        "name": "new " + name,
+                        "kind": 16384,
+                        "kindString": "Constructor signature",
+                        "flags": {},
+                        "type": {"type": "reference", "id": id, "name": name},
+                    }
+                ],
+            },
+            {
+                "id": id + 3,
+                "name": "items",
+                "kind": 1024,
+                "kindString": "Property",
+                "flags": {"isOptional": True},
+                "type": {
+                    "type": "array",
+                    "elementType": {"type": "intrinsic", "name": "number"},
+                },
+            },
+            function_json(id=id + 4, name="run") | {"kind": 2048, "kindString": "Method"},
+        ],
+    }
+
+
+def accessor_json(
+    id: int,  # pylint: disable=redefined-builtin
+    name: str,
+) -> dict[str, Any]:
+    """Returns a `get name(): number` accessor (uses 2 ids)."""
+    return {
+        "id": id,
+        "name": name,
+        "kind": 262144,
+        "kindString": "Accessor",
+        "flags": {},
+        "getSignature": {
+            "id": id + 1,
+            "name": name,
+            "kind": 524288,
+            "kindString": "Get signature",
+            "flags": {},
+            "type": {"type": "intrinsic", "name": "number"},
+        },
+    }
+
+
+_INTRINSICS = ("string", "number", "boolean", "void", "any", "unknown")
+
+
+def synthetic_project_json(
+    num_nodes: int = 1_000,
+    *,
+    depth: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Returns a deterministic TypeDoc project of about `num_nodes` reflections.
+
+    The project contains a chain of `depth` nested modules, each containing
+    classes and functions whose parameter and return types are drawn from
+    the common type kinds (intrinsic, literal, reference, array, union,
+    tuple) with a fixed-seed RNG. The output only depends on the arguments.
+
+    Args:
+        num_nodes: Approximate number of reflections (excluding the modules)
+        depth: Number of nested modules (built iteratively, so can exceed the
+            recursion limit)
+        seed: Seed of the RNG
+
+    Returns:
+        The project JSON
+    """
+    rng = random.Random(seed)
+    next_id = itertools.count(1)
+    class_ids = []
+    # Reflections of each module, outer module first
+    all_members = []
+    for level in range(depth):
+        budget = num_nodes // depth + (level < num_nodes % depth)
+        members = []
+        num_level_nodes = 0
+        while num_level_nodes < budget:
+            if rng.random() < 0.2:
+                id_ = next(next_id)
+                for _ in range(6):  # `class_json` uses 7 ids
+                    next(next_id)
+                members.append(class_json(id=id_, name=f"C{id_}"))
+                class_ids.append(id_)
+                num_level_nodes += 7
+            else:
+                member = _synthetic_function_json(rng, next_id, class_ids)
+                members.append(member)
+                num_level_nodes += 2 + len(member["signatures"][0]["parameters"])
+        all_members.append(members)
+    # Assembled from the innermost module
+    children = []
+    for level, members in reversed(list(enumerate(all_members))):
+        module = module_json(id=next(next_id), name=f"m{level}", children=members)
+        module["children"].extend(children)
+        children = [module]
+    return project_json(num_functions=0) | {"children": children}
+
+
+def _synthetic_function_json(
+    rng: random.Random,
+    next_id: Iterator[int],
+    class_ids: list[int],
+) -> dict[str, Any]:
+    """Returns a function with 0-3 parameters of random types."""
+    id_ = next(next_id)
+    sig_id = next(next_id)
+    parameters = [
+        {
+            "id": next(next_id),
+            "name": f"p{i}",
+            "kind": 32768,
+            "kindString": "Parameter",
+            "flags": {"isOptional": True} if rng.random() < 0.3 else {},
+            "type": _synthetic_type_json(rng, class_ids, depth=2),
+        }
+        for i in range(rng.randrange(4))
+    ]
+    return {
+        "id": id_,
+        "name": f"fn{id_}",
+        "kind": 64,
+        "kindString": "Function",
+        "flags": {},
+        "sources": [{"fileName": f"src/f{id_ % 50}.ts", "line": id_, "character": 0}],
+        "signatures": [
+            {
+                "id": sig_id,
+                "name": f"fn{id_}",
+                "kind": 4096,
+                "kindString": "Call signature",
+                "flags": {},
+                "parameters": parameters,
+                "type": _synthetic_type_json(rng, class_ids, depth=2),
+            }
+        ],
+    }
+
+
+def _synthetic_type_json(
+    rng: random.Random,
+    class_ids: list[int],
+    depth: int,
+) -> dict[str, Any]:
+    kinds = ["intrinsic", "intrinsic", "literal"]
+    if class_ids:
+        kinds.append("reference")
+    if depth:
+        kinds += ["array", "union", "tuple"]
+    kind = rng.choice(kinds)
+    if kind == "intrinsic":
+        return {"type": "intrinsic", "name": rng.choice(_INTRINSICS)}
+    elif kind == "literal":
+        return {"type": "literal", "value": rng.choice([None, True, 0, "a"])}
+    elif kind == "reference":
+        id_ = rng.choice(class_ids)
+        return {"type": "reference", "id": id_, "name": f"C{id_}"}
+    elif kind == "array":
+        element = _synthetic_type_json(rng, class_ids, depth - 1)
+        return {"type": "array", "elementType": element}
+    items = [
+        _synthetic_type_json(rng, class_ids, depth - 1)
+        for _ in range(rng.randrange(2, 4))
+    ]
+    if kind == "union":
+        return {"type": "union", "types": items}
+    return {"type": "tuple", "elements": items}
@@ -1,49 +1,159 @@
 from __future__ import annotations
 
-import dataclasses
-import enum
 import functools
+import importlib
+import typing
 
-from etils import epy
-
-from typedoc import utils
-from typedoc import reflections
+from typedoc import building
+from typedoc import interning
 import types_parser
 
+if typing.TYPE_CHECKING:
+    from typedoc import reflections
+
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
 class Type:
     type: str
 
     @classmethod
-    def from_json(cls, val):
+    def from_json(
+        cls,
+        val,
+        *,
+        trusted: bool = False,
+        intern: bool | interning.Interner = False,
+    ):
         if val is None:
             return None
-        cls = TypeKindMap[val["type"]]
+        interner = interning.resolve(intern)
+        if interner is not None and interning.current() is not interner:
+            with interner.activate():
+                return cls.from_json(val, trusted=trusted, intern=interner)
+        depth = building.DEPTH.value
+        if depth >= building.MAX_RECURSIVE_DEPTH:  # Too deep for recursion
+            return building.build_iteratively(val, Type, trusted=trusted)
+        building.DEPTH.value = depth + 1
         try:
-            return cls(**val)
-        except Exception as e:
-            print(e)
-            print(val)
-            raise
+            return _from_json_node(val, trusted=trusted)
+        finally:
+            building.DEPTH.value = depth
+
+
+def _from_json_node(val, *, trusted: bool) -> Type:
+    """Builds a single type node (nested nodes may already be built)."""
+    cls = TypeKindMap[val["type"]]
+    interner = interning.current()
+    if interner is None:  # Inlined `_build` (the common path)
+        if trusted:
+            return types_parser.from_trusted(cls, val)
+        return cls(**val)
+    build = functools.partial(_build, cls, trusted=trusted)
+    if cls in _HASH_CONSED:
+        return interner.intern_node(cls, val, build)
+    else:
+        return build(interner.intern_dict(val))
 
 
-@types_parser.make_dataclass
+def _build(cls, val, *, trusted: bool):
+    if trusted:
+        return types_parser.from_trusted(cls, val)
+    return cls(**val)
+
+
+@types_parser.make_dataclass(slots=True)
 class ArrayType(Type):
     elementType: Type
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
+class ConditionalType(Type):
+    """Example: `T extends string ? A : B`."""
+
+    checkType: Type
+    extendsType: Type
+    trueType: Type
+    falseType: Type
+
+
+@types_parser.make_dataclass(slots=True)
+class IndexedAccessType(Type):
+    """Example: `T["key"]`."""
+
+    objectType: Type
+    indexType: Type
+
+
+@types_parser.make_dataclass(slots=True)
+class InferredType(Type):
+    """Example: `infer U` (in a conditional type)."""
+
+    name: str
+    constraint: Type | None = None
+
+
+@types_parser.make_dataclass(slots=True)
+class IntersectionType(Type):
+    """Example: `A & B`."""
+
+    types: list[Type]
+
+
+@types_parser.make_dataclass(slots=True)
 class IntrinsicType(Type):
     name: str
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
 class LiteralType(Type):
     value: str | None | int | float | bool
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
+class MappedType(Type):
+    """Example: `{ readonly [K in keyof T]?: T[K] }`."""
+
+    parameter: str
+    parameterType: Type
+    templateType: Type
+    readonlyModifier: str | None = None  # `+` or `-`
+    optionalModifier: str | None = None  # `+` or `-`
+    nameType: Type | None = None
+
+
+@types_parser.make_dataclass(slots=True)
+class NamedTupleMemberType(Type):
+    """Example: `name: string` in `[name: string]`."""
+
+    name: str
+    isOptional: bool
+    element: Type
+
+
+@types_parser.make_dataclass(slots=True)
+class OptionalType(Type):
+    """Example: `string?` in `[string?]`."""
+
+    elementType: Type
+
+
+@types_parser.make_dataclass(slots=True)
+class PredicateType(Type):
+    """Example: `x is string`, `asserts x`."""
+
+    name: str
+    asserts: bool
+    targetType: Type | None = None
+
+
+@types_parser.make_dataclass(slots=True)
+class QueryType(Type):
+    """Example: `typeof x`."""
+
+    queryType: Type
+
+
+@types_parser.make_dataclass(slots=True)
 class ReferenceType(Type):
     """Reference can be.
 
@@ -59,7 +169,7 @@ class ReferenceType(Type):
     typeArguments: None | list[Type] = None
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
 class ReflectionType(Type):
     """Example: callback.
 
@@ -69,30 +179,82 @@ class ReflectionType(Type):
     declaration: reflections.DeclarationReflection | None = None
 
 
-@types_parser.make_dataclass
+@types_parser.make_dataclass(slots=True)
+class RestType(Type):
+    """Example: `...string[]` in `[number, ...string[]]`."""
+
+    elementType: Type
+
+
+@types_parser.make_dataclass(slots=True)
+class TemplateLiteralType(Type):
+    """Example: `` `prefix-${string}` ``."""
+
+    head: str
+    # `(type, text)` following each `${}`
+    tail: list[tuple[Type, str]]
+
+
+@types_parser.make_dataclass(slots=True)
+class TupleType(Type):
+    """Example: `[string, number]`."""
+
+    elements: list[Type] | None = None
+
+
+@types_parser.make_dataclass(slots=True)
+class TypeOperatorType(Type):
+    """Example: `keyof T`."""
+
+    operator: str  # `keyof`, `unique` or `readonly`
+    target: Type
+
+
+@types_parser.make_dataclass(slots=True)
 class UnionType(Type):
     types: list[Type]
 
 
+@types_parser.make_dataclass(slots=True)
+class UnknownType(Type):
+    """Type TypeDoc could not convert (`name` is the source text)."""
+
+    name: str
+
+
 TypeKindMap = {
     "array": ArrayType,
-    "conditional": None,
-    "indexedAccess": None,
-    "inferred": None,
-    "intersection": None,
+    "conditional": ConditionalType,
+    "indexedAccess": IndexedAccessType,
+    "inferred": InferredType,
+    "intersection": IntersectionType,
     "intrinsic": IntrinsicType,
     "literal": LiteralType,
-    "mapped": None,
-    "named-tuple-member": None,
-    "optional": None,
-    "predicate": None,
-    "query": None,
+    "mapped": MappedType,
+    "named-tuple-member": NamedTupleMemberType,
+    "optional": OptionalType,
+    "predicate": PredicateType,
+    "query": QueryType,
     "reference": ReferenceType,
     "reflection": ReflectionType,
-    "rest": None,
-    "template-literal": None,
-    "tuple": None,
-    "typeOperator": None,
+    "rest": RestType,
+    "template-literal": TemplateLiteralType,
+    "tuple": TupleType,
+    "typeOperator": TypeOperatorType,
     "union": UnionType,
-    "unknown": None,
+    "unknown": UnknownType,
 }
+
+# Nodes shared across the tree in `intern=` mode (only the ones with scalar
+# values, e.g. `ReferenceType` without `typeArguments`)
+_HASH_CONSED = frozenset({IntrinsicType, LiteralType, ReferenceType, UnknownType})
+
+
+def __getattr__(name: str):
+    # `reflections` imports this module, so is only imported on first use
+    # (resolving the `ReflectionType.declaration` annotation)
+    if name == "reflections":
+        module = importlib.import_module("typedoc.reflections")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
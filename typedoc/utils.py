@@ -9,12 +9,19 @@ import functools
 from etils import edc
 from etils import epy
 from typing_extensions import Self
+from typedoc import interning
 from typedoc import utils
+import types_parser
 
 
 @classmethod
-def from_json(cls, value) -> Self:
+def from_json(cls, value, *, trusted: bool = False) -> Self:
     if isinstance(value, dict):
+        interner = interning.current()
+        if interner is not None:
+            value = interner.intern_dict(value)
+        if trusted:
+            return types_parser.from_trusted(cls, value)
         return cls(**value)
     elif isinstance(value, cls):
         return value
@@ -24,6 +31,14 @@ def from_json(cls, value) -> Self:
         raise TypeError(f"{cls.__name__} got unexpected: {type(value)}")
 
 
+@classmethod
+def from_json_list(cls, values, *, trusted: bool = False) -> list[Self]:
+    """Builds `list[cls]` at once (used by the `list[cls]` validators)."""
+    if interning.current() is not None:  # Strings are interned item by item
+        return [cls.from_json(value, trusted=trusted) for value in values]
+    return types_parser.from_json_list(cls, values, trusted=trusted)
+
+
 def field_list(cls, print_: bool = False):
     def _make_list(vals):
         if vals is None:
@@ -1,5 +1,30 @@
 """Utils to parse types."""
 
-from types_parser.parser import make_dataclass
-from types_parser.parser import InvalidError
-from types_parser.parser import validate
+import importlib
+
+# Public API, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "make_dataclass": "types_parser.parser",
+    "Discriminator": "types_parser.parser",
+    "finalize": "types_parser.parser",
+    "from_trusted": "types_parser.parser",
+    "from_json_list": "types_parser.parser",
+    "get_type_hints": "types_parser.parser",
+    "LazyList": "types_parser.lazy_list",
+    "Stats": "types_parser.stats",
+    "InvalidError": "types_parser.parser",
+    "validate": "types_parser.parser",
+    "compile": "types_parser.parser",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value  # Next accesses skip `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
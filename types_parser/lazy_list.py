@@ -0,0 +1,100 @@
+"""Lazy list."""
+
+from __future__ import annotations
+
+import collections.abc
+from typing import Any, Callable, Iterable
+
+_PENDING = object()
+
+
+class LazyList(collections.abc.Sequence):
+    """Sequence converting its items on first access.
+
+    Accepted by the `list[...]` validators without converting the items, so
+    `make_dataclass` fields can be filled without building the full
+    sub-tree. Outside `trusted` mode, each item returned by `convert` is
+    still validated against the item hint on access (with the item index
+    in the error path).
+
+    ```python
+    children = LazyList(raw_children, convert=Reflection.from_json)
+    children[0]  # Only the first child is built (and cached)
+    ```
+    """
+
+    __slots__ = ("_raw", "_items", "_convert", "_check")
+
+    def __init__(self, values: Iterable[Any], convert: Callable[[Any], Any]):
+        self._raw = list(values)
+        self._items = [_PENDING] * len(self._raw)
+        self._convert = convert
+        self._check = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is _PENDING:
+            item = self._items[index] = self._convert_item(index)
+            self._raw[index] = None  # Release the raw value
+        return item
+
+    def _convert_item(self, index: int):
+        try:
+            item = self._convert(self._raw[index])
+            if self._check is not None:
+                item = self._check(item)
+        except TypeError as e:
+            _add_index(e, index % len(self))
+            raise
+        return item
+
+    def _with_check(self, check: Callable[[Any], Any]) -> LazyList:
+        """Returns a copy whose items are validated by `check` on conversion.
+
+        Items already converted are validated immediately.
+        """
+        if self._check is check:
+            return self
+        lazy = LazyList(self._raw, self._convert)
+        lazy._check = check
+        if self._check is not None:  # Keep the previous validation
+            lazy._convert = self._convert_and_check
+        for i, item in enumerate(self._items):
+            if item is not _PENDING:
+                try:
+                    lazy._items[i] = check(item)
+                except TypeError as e:
+                    _add_index(e, i)
+                    raise
+        return lazy
+
+    def _convert_and_check(self, value):
+        return self._check(self._convert(value))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        num_converted = sum(item is not _PENDING for item in self._items)
+        return f"{type(self).__name__}({num_converted}/{len(self)} converted)"
+
+
+def _add_index(e: TypeError, index: int) -> None:
+    # Not imported globally, as `parser` depends on this module
+    from types_parser import parser  # pylint: disable=g-import-not-at-top
+
+    if isinstance(e, parser.InvalidError):
+        e._add_key(index)  # pylint: disable=protected-access
@@ -0,0 +1,36 @@
+import pytest
+import types_parser
+
+
+def test_lazy_list():
+    calls = []
+
+    def convert(x):
+        calls.append(x)
+        return x * 10
+
+    values = types_parser.LazyList([1, 2, 3], convert)
+    assert len(values) == 3
+    assert calls == []
+    assert values[-1] == 30
+    assert values[2] == 30
+    assert calls == [3]
+    assert values[:2] == [10, 20]
+    assert values == [10, 20, 30]
+    assert calls == [3, 1, 2]
+    assert types_parser.validate(list[int] | None, values) == values
+
+
+def test_lazy_list_validate():
+    values = types_parser.LazyList([1, "2", 3], lambda x: x)
+    assert values[0] == 1
+    values = types_parser.validate(list[int], values)
+    assert repr(values) == "LazyList(1/3 converted)"
+    assert values[2] == 3
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        values[1]
+    assert exc_info.value.path == "$[1]"
+    # Already converted items are validated immediately
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        types_parser.validate(list[str], values)
+    assert exc_info.value.path == "$[0]"
@@ -3,85 +3,486 @@
 Features:
 
 * Validation: `validate(type, value)`
-
+* Compilation: `compile(type)` returns a cached `fn(value)` validator, with
+  the hint analysed once rather than for every value.
+* Unions only try the branches matching the value type, or dispatch on a
+  tag with `Annotated[A | B, Discriminator(key, tags)]`.
+* Errors: `InvalidError` records the hint, value and JSON path (e.g.
+  `$.children[3].type`) of the failure, and is only formatted on display.
 
 """
 
 import dataclasses
 import enum
+import functools
+import inspect
+import sys
 import types
 import typing
-from typing import TypeAlias
-from etils import epy
+from typing import Any, Callable, TypeAlias
 from etils import edc
+from etils import epy
+from etils.edc import field_utils
+from types_parser.lazy_list import LazyList
+
+_Plan = Callable[[Any], Any]
+
+# The active `types_parser.Stats`, if any (a global, so the disabled check is
+# as cheap as possible)
+_STATS = None
 
 
 # Sentinel value
 class InvalidError(TypeError):
-    pass
+    """Value does not match the hint.
+
+    The error is structured: nothing is formatted until it is displayed
+    (union branches fail routinely as part of normal matching). As the error
+    propagates through the validators, each field, list index and dict key
+    is prepended to its JSON `path`, so tracking the path is free when the
+    value is valid.
+
+    Usage:
+
+    ```python
+    try:
+      obj = Reflection.from_json(value)
+    except types_parser.InvalidError as e:
+      e.path  # '$.children[3].signatures[0].type'
+    ```
+
+    A custom message (`str`, or `fn() -> str` formatted on display) can be
+    passed instead of the `hint`.
+
+    Attributes:
+        hint: The expected annotation
+        value: The offending value
+        errors: For unions, the error of each tried branch (with a path
+            relative to the union value)
+    """
+
+    def __init__(self, msg=None, *, hint=None, value=None, errors=()):
+        # `args` (the `msg`) is set by `BaseException.__new__`
+        self.hint = hint
+        self.value = value
+        self.errors = errors
+        # Path segments, innermost first (appended while propagating): keys,
+        # or `(container, item)` whose index is only searched on display
+        self._segments: list[Any] = []
+        # The value the `path` currently points to, to locate it in its parent
+        self._node = value
+
+    @property
+    def path(self) -> str:
+        """JSON path of the offending value (e.g. `$.children[3].type`)."""
+        return "$" + "".join(_format_segment(s) for s in reversed(self._segments))
+
+    def _add_key(self, key) -> None:
+        """Prepends the field (or dict key) `key` to the path."""
+        self._segments.append(key)
+        self._node = None
+
+    def _add_item(self, container) -> None:
+        """Prepends the index (or key) of the failing item of `container`."""
+        self._segments.append((container, self._node))
+        self._node = container
+
+    def __str__(self):
+        return self._format(root="$")
+
+    def _format(self, root: str) -> str:
+        path = root + self.path[1:]
+        prefix = "" if path == "$" else f"{path}: "
+        msg = self.args[0] if self.args else None
+        if callable(msg):
+            msg = msg()
+        elif msg is None and self.errors:  # Branch errors have their own path
+            all_msg = [e._format(root=path) for e in self.errors]
+            got = type(self.value)
+            all_msg.append(f"{prefix}Expected: {self.hint}. Got: {got}")
+            return "\n".join(all_msg)
+        elif msg is None:
+            msg = f"Expected {self.hint}. Got: {type(self.value)}"
+        return prefix + msg
+
+
+def _format_segment(segment) -> str:
+    if isinstance(segment, tuple):  # Locate the item in the container
+        container, node = segment
+        if isinstance(container, dict):
+            keys = (k for k, item in container.items() if item is node)
+        else:
+            keys = (i for i, item in enumerate(container) if item is node)
+        segment = next(keys, None)
+        if isinstance(segment, int):
+            return f"[{segment}]"
+        elif segment is None:
+            return "[?]"
+    if isinstance(segment, str) and segment.isidentifier():
+        return f".{segment}"
+    return f"[{segment!r}]"
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class Discriminator:
+    """Select the union branch from a key of the JSON dict.
+
+    Usage:
+
+    ```python
+    Shape = Annotated[
+        Circle | Square,
+        types_parser.Discriminator("type", {"circle": Circle, "square": Square}),
+    ]
+    ```
+
+    Values whose tag is missing or unknown fall back to trying each branch.
+
+    Attributes:
+        key: The dict key containing the tag
+        tags: Mapping tag -> hint
+    """
+
+    key: str
+    tags: dict[Any, TypeAlias]
 
 
 def _assert_isinstance(obj, cls):
     if not isinstance(obj, cls):
-        raise InvalidError(f"Expected {cls}. Got: {type(obj)}")
+        raise InvalidError(hint=cls, value=obj)
 
 
 def validate(hint: TypeAlias, value):
+    return compile(hint)(value)
+
+
+# Compiled plans, indexed by `(hint, trusted)`. Hints are immutable and
+# hashable (`list[int]`, `int | None`, classes,...), so plans are shared
+# globally.
+_PLANS: dict[tuple[TypeAlias, bool], _Plan] = {}
+
+
+def compile(  # pylint: disable=redefined-builtin
+    hint: TypeAlias,
+    *,
+    trusted: bool = False,
+) -> _Plan:
+    """Returns the `fn(value) -> value` validator for `hint`.
+
+    `typing.get_origin`, `typing.get_args` and the validator dispatch are
+    resolved once, then cached, so calling the returned function only pays
+    for the actual checks.
+
+    Args:
+        hint: The type annotation (e.g. `list[int] | None`)
+        trusted: If `True`, the plan only converts the values (JSON dict to
+            `from_json` classes, enums,...) without any validation. Only for
+            input known to be valid.
+
+    Returns:
+        The validator, raising `InvalidError` on invalid values.
+    """
+    try:
+        return _PLANS[hint, trusted]
+    except KeyError:
+        pass
     origin = typing.get_origin(hint)
-    return _ORIGIN_TO_VALIDATOR[origin](hint, value)
+    plan = _ORIGIN_TO_COMPILER[origin](hint, trusted)
+    _PLANS[hint, trusted] = plan
+    return plan
 
 
-def _list_validator(hint: TypeAlias, value):
+def _compile_list(hint: TypeAlias, trusted: bool) -> _Plan:
     (item_hint,) = typing.get_args(hint)
-    _assert_isinstance(value, list)
-    return [validate(item_hint, val) for val in value]
+    item_plan = compile(item_hint, trusted=trusted)
+    if isinstance(item_hint, type) and hasattr(item_hint, "from_json_list"):
+        return _compile_batch_list(item_hint, item_plan, trusted)
 
+    if trusted:
+        if item_plan is _any_validator:  # Nothing to convert
+            return _any_validator
 
-def _dict_validator(hint: TypeAlias, value):
-    key_hint, item_hint = typing.get_args(hint)
-    _assert_isinstance(value, dict)
-    return {k: validate(item_hint, v) for k, v in value.items()}
+        def _trusted_list(value):
+            if type(value) is LazyList:
+                return value
+            return [item_plan(val) for val in value]
+
+        return _trusted_list
 
+    def _list_validator(value):
+        if type(value) is LazyList:  # Items are converted on access
+            return value._with_check(item_plan)  # pylint: disable=protected-access
+        _assert_isinstance(value, list)
+        try:
+            return [item_plan(val) for val in value]
+        except InvalidError as e:
+            e._add_item(value)  # pylint: disable=protected-access
+            raise
+
+    return _list_validator
+
+
+def _compile_batch_list(item_cls: type, item_plan: _Plan, trusted: bool) -> _Plan:
+    """`list[item_cls]`, where `item_cls.from_json_list` builds the whole list."""
+    from_json_list = item_cls.from_json_list
+    if trusted and _accepts_kwarg(from_json_list, "trusted"):
+        from_json_list = functools.partial(from_json_list, trusted=True)
+
+    if trusted:
+
+        def _trusted_batch_list(value):
+            if type(value) is LazyList:
+                return value
+            if _STATS is not None:
+                return _STATS.build_list(from_json_list, value)
+            return from_json_list(value)
+
+        return _trusted_batch_list
+
+    def _batch_list_validator(value):
+        if type(value) is LazyList:  # Items are converted on access
+            return value._with_check(item_plan)  # pylint: disable=protected-access
+        _assert_isinstance(value, list)
+        try:
+            if _STATS is not None:
+                return _STATS.build_list(from_json_list, value)
+            return from_json_list(value)
+        except Exception:  # pylint: disable=broad-except
+            pass
+        # Re-run item by item, to raise the detailed error
+        try:
+            return [item_plan(val) for val in value]
+        except InvalidError as e:
+            e._add_item(value)  # pylint: disable=protected-access
+            raise
 
-def _union_validator(hint: TypeAlias, value):
+    return _batch_list_validator
+
+
+def _compile_tuple(hint: TypeAlias, trusted: bool) -> _Plan:
     item_hints = typing.get_args(hint)
-    all_err = []
-    for item_hint in item_hints:
-        try:  # Return the first valid match
-            return validate(item_hint, value)
+    if len(item_hints) == 2 and item_hints[1] is Ellipsis:  # `tuple[int, ...]`
+        item_plan = compile(item_hints[0], trusted=trusted)
+        if trusted:
+            return lambda value: tuple(item_plan(val) for val in value)
+
+        def _variadic_tuple_validator(value):
+            _assert_isinstance(value, (list, tuple))
+            try:
+                return tuple([item_plan(val) for val in value])
+            except InvalidError as e:
+                e._add_item(value)  # pylint: disable=protected-access
+                raise
+
+        return _variadic_tuple_validator
+
+    # JSON arrays are converted to fixed-length tuples
+    item_plans = [compile(item_hint, trusted=trusted) for item_hint in item_hints]
+    if trusted:
+        return lambda value: tuple(
+            plan(val) for plan, val in zip(item_plans, value)
+        )
+
+    def _tuple_validator(value):
+        _assert_isinstance(value, (list, tuple))
+        if len(value) != len(item_plans):
+            raise InvalidError(
+                lambda: f"Expected {len(item_plans)} items. Got: {len(value)}"
+            )
+        try:
+            return tuple([plan(val) for plan, val in zip(item_plans, value)])
         except InvalidError as e:
-            all_err.append(e)
-    else:  # No match
-        msg = "\n".join([str(e) for e in all_err])
-        raise InvalidError(f"{msg}\nExpected: {hint}. Got: {type(value)}")
+            e._add_item(value)  # pylint: disable=protected-access
+            raise
+
+    return _tuple_validator
+
+
+def _compile_dict(hint: TypeAlias, trusted: bool) -> _Plan:
+    key_hint, item_hint = typing.get_args(hint)
+    item_plan = compile(item_hint, trusted=trusted)
+
+    if trusted:
+        if item_plan is _any_validator:  # Nothing to convert
+            return _any_validator
+        return lambda value: {k: item_plan(v) for k, v in value.items()}
+
+    def _dict_validator(value):
+        _assert_isinstance(value, dict)
+        try:
+            return {k: item_plan(v) for k, v in value.items()}
+        except InvalidError as e:
+            e._add_item(value)  # pylint: disable=protected-access
+            raise
+
+    return _dict_validator
+
+
+def _compile_union(
+    hint: TypeAlias,
+    trusted: bool,
+    discriminator: Discriminator | None = None,
+) -> _Plan:
+    item_hints = typing.get_args(hint)
+    branches = [
+        (_accepts(item_hint), compile(item_hint, trusted=trusted))
+        for item_hint in item_hints
+    ]
+    if discriminator is None:
+        key, tag_to_plan = None, {}
+    else:
+        key = discriminator.key
+        tag_to_plan = {
+            tag: compile(h, trusted=trusted) for tag, h in discriminator.tags.items()
+        }
+    is_optional = len(item_hints) == 2 and type(None) in item_hints
+    # `type(value)` -> branches which can accept it, filled on first use
+    type_to_plans: dict[type, tuple[_Plan, ...]] = {}
+
+    def _candidates(value_type: type) -> tuple[_Plan, ...]:
+        plans = tuple(plan for accepts, plan in branches if accepts(value_type))
+        type_to_plans[value_type] = plans
+        return plans
+
+    if trusted:
+
+        def _trusted_union(value):
+            value_type = type(value)
+            if value_type is dict and key in value:
+                plan = tag_to_plan.get(value[key])
+                if plan is not None:
+                    return plan(value)
+            try:
+                plans = type_to_plans[value_type]
+            except KeyError:
+                plans = _candidates(value_type)
+            # The first candidate is the one validation would have selected
+            return plans[0](value) if plans else value
 
+        return _trusted_union
 
-def _type_validator(hint: TypeAlias, value):
+    def _union_validator(value):
+        value_type = type(value)
+        if value_type is dict and key in value:  # Tagged: O(1) dispatch
+            plan = tag_to_plan.get(value[key])
+            if plan is not None:
+                return plan(value)
+        try:
+            plans = type_to_plans[value_type]
+        except KeyError:
+            plans = _candidates(value_type)
+        if is_optional and len(plans) == 1:  # `X | None`: `X` error is precise
+            return plans[0](value)
+        all_err = []
+        for plan in plans:  # Usually a single candidate
+            try:  # Return the first valid match
+                return plan(value)
+            except InvalidError as e:
+                all_err.append(e)
+                if _STATS is not None:
+                    _STATS.union_misses[hint] += 1
+        # No match. The message is only formatted if displayed.
+        raise InvalidError(hint=hint, value=value, errors=all_err)
+
+    return _union_validator
+
+
+def _compile_annotated(hint: TypeAlias, trusted: bool) -> _Plan:
+    inner_hint, *metadata = typing.get_args(hint)
+    for m in metadata:
+        if isinstance(m, Discriminator):
+            return _compile_union(inner_hint, trusted, discriminator=m)
+    return compile(inner_hint, trusted=trusted)
+
+
+def _accepts(hint: TypeAlias) -> Callable[[type], bool]:
+    """Returns whether values of a given type could match `hint`.
+
+    Used to only try the plausible branches of a union. Values of rejected
+    types would always fail validation.
+    """
+    origin = typing.get_origin(hint)
+    if origin in (list, typing.List):
+        return lambda t: issubclass(t, (list, LazyList))
+    if origin in (tuple, typing.Tuple):  # From JSON arrays
+        return lambda t: issubclass(t, (list, tuple))
+    if origin in (dict, typing.Dict):
+        return lambda t: issubclass(t, dict)
+    if origin in (types.UnionType, typing.Union):
+        all_accepts = [_accepts(h) for h in typing.get_args(hint)]
+        return lambda t: any(accepts(t) for accepts in all_accepts)
+    if origin is typing.Annotated:
+        return _accepts(typing.get_args(hint)[0])
+    if hint is typing.Any or not isinstance(hint, type):
+        return lambda t: True
+    if issubclass(hint, enum.Enum):  # Built from the raw value
+        return lambda t: True
+    if hasattr(hint, "from_json"):  # Built from the JSON object
+        return lambda t: issubclass(t, (hint, dict))
+    return lambda t: issubclass(t, hint)
+
+
+def _compile_type(hint: TypeAlias, trusted: bool) -> _Plan:
     if hint is typing.Any:
-        return value
+        return _any_validator
     if not isinstance(hint, type):
         raise AssertionError(f"Unsuported typing annotation: {hint}")
-    # TODO(epot): Dispatch too
+    # Enum and `from_json` are resolved here rather than for each value
     if issubclass(hint, enum.Enum):
-        return hint(value)
+        return hint
     if hasattr(hint, "from_json"):
-        if isinstance(value, hint):
-            return value
-        return hint.from_json(value)
-    _assert_isinstance(value, hint)
+        from_json = hint.from_json
+        if trusted and _accepts_kwarg(from_json, "trusted"):
+            from_json = functools.partial(from_json, trusted=True)
+
+        def _from_json_validator(value):
+            if isinstance(value, hint):
+                return value
+            # Another `from_json` class (e.g. a `LazyList` item of the wrong
+            # kind). `None` is left to `from_json` (e.g. `Type.from_json`).
+            if not trusted and value is not None and not isinstance(value, dict):
+                raise InvalidError(hint=hint, value=value)
+            try:
+                if _STATS is not None:
+                    return _STATS.build(from_json, value)
+                return from_json(value)
+            except InvalidError as e:
+                e._node = value  # pylint: disable=protected-access
+                raise
+
+        return _from_json_validator
+    if trusted:
+        return _any_validator
+
+    def _type_validator(value):
+        _assert_isinstance(value, hint)
+        return value
+
+    return _type_validator
+
+
+def _any_validator(value):
     return value
 
 
-_ORIGIN_TO_VALIDATOR = {
-    list: _list_validator,
-    typing.List: _list_validator,
-    # tuple: _tuple_validator,
-    # typing.Tuple: _tuple_validator,
-    dict: _dict_validator,
-    typing.Dict: _dict_validator,
-    types.UnionType: _union_validator,
-    typing.Union: _union_validator,
-    None: _type_validator,
+def _accepts_kwarg(fn, name: str) -> bool:
+    params = inspect.signature(fn).parameters
+    return name in params or any(
+        p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+_ORIGIN_TO_COMPILER = {
+    list: _compile_list,
+    typing.List: _compile_list,
+    tuple: _compile_tuple,
+    typing.Tuple: _compile_tuple,
+    dict: _compile_dict,
+    typing.Dict: _compile_dict,
+    types.UnionType: _compile_union,
+    typing.Union: _compile_union,
+    typing.Annotated: _compile_annotated,
+    None: _compile_type,
 }
 
 
@@ -89,10 +490,21 @@ _ORIGIN_TO_VALIDATOR = {
 class Validator:
     name: str
     hint: TypeAlias
+    plan: _Plan = dataclasses.field(init=False, repr=False, compare=False)
+    _key: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.plan = compile(self.hint)
+        self._key = self.name.rpartition(".")[2]  # `Cls.field` -> `field`
 
     def __call__(self, value):
+        if _STATS is not None:
+            _STATS.validator_calls[self.name] += 1
         try:
-            validate(self.hint, value)
+            return self.plan(value)
+        except InvalidError as e:
+            e._add_key(self._key)  # pylint: disable=protected-access
+            raise
         except Exception as e:
             if isinstance(value, dict):
                 input_msg = f"{{{list(value)}}}"
@@ -109,16 +521,244 @@ class Validator:
             epy.reraise(e, prefix="\n" + msg + "\n")
 
 
-def make_dataclass(cls):
-    # Lazyly initialize the class to support forward reference
-    def __new__(cls, *args, **kwargs):
+def make_dataclass(cls=None, *, slots: bool = False):
+    """Makes `cls` a dataclass whose fields are validated on assignment.
+
+    Usage:
+
+    ```python
+    @types_parser.make_dataclass
+    class A:
+        x: int = 0
+
+    @types_parser.make_dataclass(slots=True)
+    class B:
+        __slots__ = ("_cache",)  # Extra (non-field, non-pickled) attributes
+
+        x: list[A] | None = None
+    ```
+
+    Args:
+        cls: The class to decorate
+        slots: If `True`, the class is re-created with one `__slots__` per
+            field (no instance `__dict__`), for compact instances. Fields are
+            validated in `__setattr__`, while reads are plain slot reads.
+            Subclasses should use `slots=True` too.
+
+    Returns:
+        The decorated class
+    """
+    if cls is None:
+        return functools.partial(make_dataclass, slots=slots)
+    if slots:
+        cls = _make_slots_cls(cls)
+
+    # Lazyly initialize the class to support forward reference. The lazy
+    # `__init__` is replaced by the dataclass one on first use, or with
+    # `finalize`, so construction afterward is plain dataclass speed.
+    # Note: A lazy `__new__` cannot be uninstalled, as CPython keeps the
+    # `tp_new` slot wrapper (and `object.__new__` then rejects the kwargs).
+    def __init__(self, *args, **kwargs):
+        cls = type(self)
+        _make_all_dataclass(cls)
+        cls.__init__(self, *args, **kwargs)
+
+    # Unpickling bypasses `__init__` (e.g. in a fresh worker process)
+    def __setstate__(self, state):
+        cls = type(self)
         _make_all_dataclass(cls)
-        return object.__new__(cls)
+        if hasattr(cls, "__setstate__"):
+            cls.__setstate__(self, state)
+        else:
+            self.__dict__.update(state)
 
-    cls.__new__ = __new__
+    __init__._auto_dc_lazy = True
+    __setstate__._auto_dc_lazy = True
+    cls.__init__ = __init__
+    if "__setstate__" not in cls.__dict__:
+        cls.__setstate__ = __setstate__
     return cls
 
 
+def _make_slots_cls(cls):
+    """Re-creates `cls` with `__slots__` for all its fields.
+
+    Defaults cannot be class attributes (they would conflict with the slots),
+    so are kept in `_auto_dc_defaults` until the dataclass is created.
+    """
+    ns = dict(cls.__dict__)
+    ns.pop("__dict__", None)
+    ns.pop("__weakref__", None)
+    extra_slots = ns.pop("__slots__", ())
+    if isinstance(extra_slots, str):
+        extra_slots = (extra_slots,)
+    for name in extra_slots:  # Member descriptors of the original class
+        ns.pop(name, None)
+    field_names = _own_fields(cls)
+    base_slots = {
+        name
+        for base in cls.__mro__[1:]
+        for name in base.__dict__.get("__slots__", ())
+    }
+    ns["__slots__"] = tuple(
+        name for name in (*field_names, *extra_slots) if name not in base_slots
+    )
+    ns["_auto_dc_defaults"] = {k: ns.pop(k) for k in field_names if k in ns}
+    ns.setdefault("__setattr__", _slots_setattr)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, ns)
+    _update_class_cell(ns.values(), cls, new_cls)
+    return new_cls
+
+
+def _update_class_cell(values, old_cls, new_cls) -> None:
+    """Points the `super()` (`__class__` cell) of the methods to `new_cls`."""
+    for value in values:
+        if isinstance(value, (classmethod, staticmethod)):
+            fns = [value.__func__]
+        elif isinstance(value, property):
+            fns = [value.fget, value.fset, value.fdel]
+        else:
+            fns = [value]
+        for fn in fns:
+            for cell in getattr(fn, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is old_cls:
+                        cell.cell_contents = new_cls
+                except ValueError:  # Empty cell
+                    pass
+
+
+def _slots_setattr(self, name, value):
+    validator = type(self)._auto_dc_validators.get(name)
+    if validator is not None:
+        value = validator(value)
+    object.__setattr__(self, name, value)
+
+
+def _slots_getstate(self):
+    # Only the fields are pickled (extra slots are transient, like caches)
+    return tuple([getattr(self, name) for name in self._auto_dc_field_names])
+
+
+def _make_slots_setstate(cls):
+    """Returns the `__setstate__` of `_slots_getstate` (generated, no loop).
+
+    The values are written with the slot descriptors (like
+    `object.__setattr__`, without the attribute lookup).
+    """
+    names = cls._auto_dc_field_names
+    namespace = {
+        f"__set{i}": _slot_member(cls, name).__set__ for i, name in enumerate(names)
+    }
+    lines = [f"__set{i}(self, state[{i}])" for i in range(len(names))]
+    src = f"""
+def __setstate__(self, state):
+{_indent(lines or ["pass"], "    ")}
+"""
+    exec(src, namespace)  # pylint: disable=exec-used
+    setstate = namespace["__setstate__"]
+    setstate.__qualname__ = f"{cls.__qualname__}.__setstate__"
+    return setstate
+
+
+def finalize(obj: types.ModuleType | type) -> None:
+    """Materialise the `make_dataclass` classes.
+
+    This is done automatically on the first instance creation, but can be
+    called explicitly once all forward references are defined (e.g. after
+    import), to not pay the cost during loading.
+
+    Args:
+        obj: A module (all `make_dataclass` classes defined in the module are
+            finalized) or a single class
+    """
+    if isinstance(obj, types.ModuleType):
+        all_cls = [
+            v
+            for v in vars(obj).values()
+            if isinstance(v, type) and v.__module__ == obj.__name__
+        ]
+    else:
+        all_cls = [obj]
+    for cls in all_cls:
+        if _is_lazy(cls):
+            _make_all_dataclass(cls)
+
+
+def _is_lazy(cls) -> bool:
+    return getattr(cls.__dict__.get("__init__"), "_auto_dc_lazy", False)
+
+
+# `get_type_hints` results, indexed by class. Like the `compile` plans, the
+# classes are kept alive (weak keys would not help: the hints of tree-shaped
+# classes, e.g. `list[Node] | None`, reference the class itself).
+_TYPE_HINTS: dict[type, dict[str, Any]] = {}
+# Hints of the annotations defined in the class itself (not in the bases)
+_OWN_TYPE_HINTS: dict[type, dict[str, Any]] = {}
+
+
+def get_type_hints(cls) -> dict[str, Any]:
+    """Cached `typing.get_type_hints(cls)`.
+
+    The annotations of each class are evaluated once, then re-used by all
+    the subclasses. The returned dict is shared, so should not be mutated.
+
+    Args:
+        cls: The class
+
+    Returns:
+        The `{name: hint}` of `cls` and its bases
+    """
+    try:
+        return _TYPE_HINTS[cls]
+    except KeyError:
+        pass
+    hints = {}
+    for base in reversed(cls.__mro__):
+        hints.update(_own_type_hints(base))
+    _TYPE_HINTS[cls] = hints
+    return hints
+
+
+def _own_type_hints(cls) -> dict[str, Any]:
+    try:
+        return _OWN_TYPE_HINTS[cls]
+    except KeyError:
+        pass
+    annotations = cls.__dict__.get("__annotations__")
+    if not isinstance(annotations, dict) or not annotations:
+        hints = {}
+    else:
+        # Evaluate only the `cls` annotations, with the same namespaces as
+        # `typing.get_type_hints(cls)` (class, then module)
+        own_cls = type(cls.__name__, (), {"__annotations__": annotations})
+        hints = typing.get_type_hints(
+            own_cls,
+            globalns=dict(vars(cls)),
+            localns=_ModuleNamespace(sys.modules.get(cls.__module__)),
+        )
+    _OWN_TYPE_HINTS[cls] = hints
+    return hints
+
+
+class _ModuleNamespace(dict):
+    """Module globals, which also resolve the lazy (PEP 562) attributes.
+
+    So annotations can reference modules imported on first use (e.g. to
+    break an import cycle).
+    """
+
+    def __init__(self, module):
+        super().__init__(getattr(module, "__dict__", {}))
+        self._module = module
+
+    def __missing__(self, name: str):
+        try:
+            return getattr(self._module, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+
 def _make_all_dataclass(cls):
     for c in reversed(cls.mro()):
         if c is object:
@@ -129,11 +769,251 @@ def _make_all_dataclass(cls):
 def _make_dataclass(cls):
     if "_auto_dc_initialized" in cls.__dict__:
         return
-    type_hints = typing.get_type_hints(cls)
+    # Resolved before the class is modified: if a forward reference is not
+    # defined yet, the lazy `__init__` is kept, so the next construction
+    # retries
+    type_hints = get_type_hints(cls)
+    lazy_methods = {
+        name: method
+        for name in ("__init__", "__setstate__")
+        if getattr(method := cls.__dict__.get(name), "_auto_dc_lazy", False)
+    }
+    for name in lazy_methods:  # Let `dataclasses` generate the `__init__`
+        delattr(cls, name)
+    try:
+        if "_auto_dc_defaults" in cls.__dict__:
+            _make_slots_dataclass(cls, type_hints)
+        else:
+            _make_dict_dataclass(cls, type_hints)
+    except BaseException:
+        for name, method in lazy_methods.items():
+            setattr(cls, name, method)
+        raise
+    return cls
+
+
+def _make_dict_dataclass(cls, type_hints):
     for k, v in type_hints.items():
         validator = Validator(name=f"{cls.__name__}.{k}", hint=v)
         default = getattr(cls, k, dataclasses.MISSING)
-        setattr(cls, k, edc.field(validate=validator, default=default))
-    cls = dataclasses.dataclass(cls, kw_only=True)
+        if _Field is None:  # Errors are re-wrapped by `edc`
+            field = edc.field(validate=validator, default=default)
+        else:
+            field = _Field(validate=validator, field_kwargs={"default": default})
+        # `setattr` on an existing class does not trigger `__set_name__`
+        field.__set_name__(cls, k)
+        setattr(cls, k, field)
+    dataclasses.dataclass(cls, kw_only=True)
     cls._auto_dc_initialized = True
-    return cls
+
+
+# `edc.field` re-wraps every validator error with `epy.reraise`, which
+# formats the message (while `InvalidError` is only formatted on display,
+# with its final `path`), and `Validator` already adds the field to the
+# error. There is no public option to disable it, so the private
+# `field_utils._Field._validate` hook (etils 1.14) is overridden when it
+# exists, and the public `edc.field` is used otherwise.
+if hasattr(getattr(field_utils, "_Field", None), "_validate"):
+
+    class _Field(field_utils._Field):  # pylint: disable=protected-access
+        """`edc.field` descriptor, propagating the validator errors as-is."""
+
+        def _validate(self, value):
+            return self._validate_fn(value)
+
+else:
+    _Field = None
+
+
+def _make_slots_dataclass(cls, type_hints):
+    defaults = cls._auto_dc_defaults
+    validators = {}
+    for base in reversed(cls.__mro__[1:]):
+        validators.update(base.__dict__.get("_auto_dc_validators", {}))
+    # Slot descriptors, to restore after `dataclasses` sets the defaults
+    members = {k: _slot_member(cls, k) for k in _own_fields(cls)}
+    for k in members:
+        validators[k] = Validator(name=f"{cls.__name__}.{k}", hint=type_hints[k])
+        default = defaults.get(k, dataclasses.MISSING)
+        setattr(cls, k, dataclasses.field(default=default))
+    cls._auto_dc_validators = validators
+    dataclasses.dataclass(cls, kw_only=True)
+    for k, member in members.items():
+        setattr(cls, k, member)
+    cls._auto_dc_field_names = tuple(f.name for f in dataclasses.fields(cls))
+    if "__getstate__" not in cls.__dict__:
+        cls.__getstate__ = _slots_getstate
+    if "__setstate__" not in cls.__dict__:
+        cls.__setstate__ = _make_slots_setstate(cls)
+    cls._auto_dc_initialized = True
+
+
+def _slot_member(cls, name: str):
+    """Returns the slot descriptor (possibly declared by a base class)."""
+    for c in cls.__mro__:
+        if name in c.__dict__.get("__slots__", ()):
+            return c.__dict__[name]
+    raise AssertionError(f"No slot {name!r} in {cls}")
+
+
+def _own_fields(cls) -> list[str]:
+    annotations = cls.__dict__.get("__annotations__", {})
+    return [k for k, v in annotations.items() if "ClassVar" not in str(v)]
+
+
+# Generated constructors for `from_trusted`, indexed by class
+_TRUSTED_CONSTRUCTORS: dict[type, Callable[[dict[str, Any]], Any]] = {}
+
+
+def from_trusted(cls, value: dict[str, Any]):
+    """Builds the `make_dataclass` `cls` from a JSON dict, without validation.
+
+    Uses a constructor generated for `cls`, which directly fills the field
+    values (bypassing the per-field validator descriptors) and only applies
+    the conversions (`from_json`, enums,...). Unknown keys are ignored and
+    missing keys use the field default.
+
+    Should only be used for input known to be valid (e.g. generated by a
+    trusted TypeDoc run). Use `cls(**value)` otherwise.
+
+    Args:
+        cls: The `make_dataclass` class
+        value: The JSON dict (`{field_name: value}`)
+
+    Returns:
+        The `cls` instance
+    """
+    try:
+        constructor = _TRUSTED_CONSTRUCTORS[cls]
+    except KeyError:
+        constructor = _TRUSTED_CONSTRUCTORS[cls] = _make_trusted_constructor(cls)
+    return constructor(value)
+
+
+def _make_trusted_constructor(cls):
+    namespace = _constructor_namespace(cls)
+    body_str = _indent(_field_assignments(cls, namespace, trusted=True), "    ")
+    src = f"""
+def __from_trusted(value):
+    self = __new(__cls)
+{body_str}
+    return self
+"""
+    exec(src, namespace)  # pylint: disable=exec-used
+    constructor = namespace["__from_trusted"]
+    constructor.__qualname__ = f"{cls.__qualname__}.__from_trusted"
+    return constructor
+
+
+# Generated list constructors for `from_json_list`, indexed by
+# `(class, trusted)`
+_LIST_CONSTRUCTORS: dict[tuple[type, bool], Callable[[list[Any]], list[Any]]] = {}
+
+
+def from_json_list(cls, values: list[Any], *, trusted: bool = False) -> list[Any]:
+    """Builds a list of the `make_dataclass` `cls` from a list of JSON dicts.
+
+    Faster than converting the items one by one: a single constructor
+    generated for `cls` loops over the values, with the field conversions
+    inlined (no per-item dispatch, `from_json` or `__init__` call).
+
+    Items already `cls` instances are kept. In validated mode, unknown keys,
+    missing fields and invalid values raise, but without a detailed message:
+    the `list[cls]` plans re-run the per-item validation to report the error.
+
+    Args:
+        cls: The `make_dataclass` class (without `__post_init__`)
+        values: The JSON dicts
+        trusted: If `True`, skip the validation (see `from_trusted`)
+
+    Returns:
+        The `cls` instances
+    """
+    try:
+        constructor = _LIST_CONSTRUCTORS[cls, trusted]
+    except KeyError:
+        constructor = _make_list_constructor(cls, trusted)
+        _LIST_CONSTRUCTORS[cls, trusted] = constructor
+    return constructor(values)
+
+
+def _make_list_constructor(cls, trusted: bool):
+    if hasattr(cls, "__post_init__"):
+        raise TypeError(f"{cls.__name__}.__post_init__ would not be called.")
+    namespace = _constructor_namespace(cls)
+    namespace["__field_names"] = frozenset(f.name for f in dataclasses.fields(cls))
+    body = _field_assignments(cls, namespace, trusted=trusted)
+    if not trusted:  # `cls(**value)` would reject them
+        body.insert(0, "if not value.keys() <= __field_names: raise TypeError")
+    body_str = _indent(body, "        ")
+    src = f"""
+def __from_json_list(values):
+    result = []
+    append = result.append
+    for value in values:
+        if type(value) is not dict:
+            if isinstance(value, __cls):
+                append(value)
+                continue
+            raise TypeError(f"Expected dict or {{__cls}}. Got: {{type(value)}}")
+        self = __new(__cls)
+{body_str}
+        append(self)
+    return result
+"""
+    exec(src, namespace)  # pylint: disable=exec-used
+    constructor = namespace["__from_json_list"]
+    constructor.__qualname__ = f"{cls.__qualname__}.__from_json_list"
+    return constructor
+
+
+def _constructor_namespace(cls) -> dict[str, Any]:
+    _make_all_dataclass(cls)
+    return {
+        "__cls": cls,
+        "__new": object.__new__,
+        "__setattr": object.__setattr__,
+    }
+
+
+def _field_assignments(cls, namespace, *, trusted: bool) -> list[str]:
+    """Returns the lines filling the fields of `self` from the `value` dict.
+
+    The conversion plans and defaults are added to the `namespace`.
+    """
+    type_hints = get_type_hints(cls)
+    # `(name, expression)` of each field value
+    exprs = []
+    for i, field in enumerate(dataclasses.fields(cls)):
+        plan = compile(type_hints[field.name], trusted=trusted)
+        name = repr(field.name)
+        if plan is _any_validator:
+            expr = f"value[{name}]"
+        else:
+            namespace[f"__plan{i}"] = plan
+            expr = f"__plan{i}(value[{name}])"
+        if field.default is not dataclasses.MISSING:
+            namespace[f"__default{i}"] = field.default
+            expr = f"{expr} if {name} in value else __default{i}"
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[f"__factory{i}"] = field.default_factory
+            expr = f"{expr} if {name} in value else __factory{i}()"
+        # Else required: raise the `KeyError`
+        exprs.append((name, expr))
+    return _assignment_lines(cls, exprs)
+
+
+def _assignment_lines(cls, exprs: list[tuple[str, str]], obj: str = "self"):
+    """Returns the lines setting the `(repr(name), expression)` fields."""
+    if "_auto_dc_field_names" in cls.__dict__:  # `slots=True`
+        # Values are directly written to the slots
+        return [f"__setattr({obj}, {name}, {expr})" for name, expr in exprs]
+    # Values are stored where the `edc.field` descriptors read them
+    lines = [f'__setattr({obj}, "_dataclass_field_values", {{']
+    lines.extend(f"    {name}: {expr}," for name, expr in exprs)
+    lines.append("})")
+    return lines
+
+
+def _indent(lines: list[str], indent: str) -> str:
+    return "\n".join(indent + line for line in lines)
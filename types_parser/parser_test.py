@@ -110,3 +110,305 @@ def test_cls():
         MyDataclass(x="4")
 
     MyDataclass2(z="abc")
+
+
+def test_compile():
+    plan = types_parser.compile(list[MyClass] | None)
+    assert types_parser.compile(list[MyClass] | None) is plan
+    assert plan(None) is None
+    assert plan([dict(x=3)]) == [MyClass(x=3)]
+    with pytest.raises(types_parser.InvalidError):
+        plan(1)
+
+    assert types_parser.compile(MyEnum)("a") == MyEnum.A
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_compile_tuple(trusted: bool):
+    plan = types_parser.compile(list[tuple[MyClass, str]], trusted=trusted)
+    assert plan([[dict(x=1), "a"]]) == [(MyClass(x=1), "a")]
+    plan = types_parser.compile(tuple[MyEnum, ...], trusted=trusted)
+    assert plan(["a", "a"]) == (MyEnum.A, MyEnum.A)
+    if not trusted:
+        with pytest.raises(types_parser.InvalidError, match="Expected 2 items"):
+            types_parser.compile(tuple[int, str])([1])
+
+
+class _FromDictOnly:
+    """`from_json` which fails on `None` (like `Reflection.from_json`)."""
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**value)
+
+
+@dataclasses.dataclass(eq=True)
+class MyOtherClass:
+    y: int
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**{k: v for k, v in value.items() if k != "kind"})
+
+
+def test_union_dispatch():
+    # `None` is dispatched to the `None` branch, without calling `from_json`
+    _validate(_FromDictOnly | None, None)
+    _validate(str | None | int | float | bool, True)
+    _validate(str | None | int | float | bool, 1.0)
+
+    with pytest.raises(types_parser.InvalidError, match="Expected:"):
+        types_parser.validate(int | list[int], ["a"])
+
+
+def test_discriminator():
+    hint = typing.Annotated[
+        MyClass | MyOtherClass,
+        types_parser.Discriminator("kind", {"my": MyClass, "other": MyOtherClass}),
+    ]
+    _validate(hint, {"kind": "other", "y": 1}, MyOtherClass(y=1))
+    # Fallback to scanning
+    _validate(hint, {"x": 1}, MyClass(x=1))
+    with pytest.raises(TypeError):
+        types_parser.validate(hint, {"kind": "my", "y": 1})
+
+
+@types_parser.make_dataclass
+class _LazyBase:
+    x: int = 0
+
+
+@types_parser.make_dataclass
+class _LazyChild(_LazyBase):
+    y: list[_LazyChild] | None = None
+
+
+def test_finalize():
+    assert types_parser.parser._is_lazy(_LazyChild)
+    # First instance materialises the full MRO
+    assert _LazyChild(y=[_LazyChild()]).y == [_LazyChild(x=0)]
+    assert dataclasses.is_dataclass(_LazyChild)
+    assert dataclasses.is_dataclass(_LazyBase)
+    assert _LazyBase(x=1).x == 1
+    with pytest.raises(types_parser.InvalidError):
+        _LazyChild(x="1")
+
+
+@types_parser.make_dataclass
+class _FinalizedCls:
+    x: int = 0
+
+
+def test_finalize_module():
+    import sys
+
+    types_parser.finalize(sys.modules[__name__])
+    assert not types_parser.parser._is_lazy(_FinalizedCls)
+    assert dataclasses.is_dataclass(_FinalizedCls)
+    assert _FinalizedCls(x=2).x == 2
+
+
+@types_parser.make_dataclass
+class _TrustedCls:
+    x: int
+    e: MyEnum = MyEnum.A
+    items: list[MyClass] | None = None
+
+
+def test_from_trusted():
+    value = {"x": 1, "e": "a", "items": [{"x": 2}], "unknown": None}
+    obj = types_parser.from_trusted(_TrustedCls, value)
+    assert obj == _TrustedCls(x=1, e=MyEnum.A, items=[MyClass(x=2)])
+    assert types_parser.from_trusted(_TrustedCls, {"x": 1}).items is None
+    # No validation
+    assert types_parser.from_trusted(_TrustedCls, {"x": "1"}).x == "1"
+
+
+def test_setstate_before_finalize():
+    @types_parser.make_dataclass
+    class PickledCls:
+        x: int = 0
+
+    # What unpickling does in a fresh process
+    obj = object.__new__(PickledCls)
+    obj.__setstate__({"_dataclass_field_values": {"x": 3}})
+    assert obj.x == 3
+    assert "__setstate__" not in PickledCls.__dict__
+    assert obj == PickledCls(x=3)
+
+
+@types_parser.make_dataclass(slots=True)
+class _SlotsCls:
+    __slots__ = ("_cache",)
+
+    x: int = 0
+    y: list[_SlotsCls] | None = None
+
+    def double(self):
+        return 2 * self.x
+
+
+@types_parser.make_dataclass(slots=True)
+class _SlotsChild(_SlotsCls):
+    z: MyEnum = MyEnum.A
+
+    def double(self):
+        return super().double() + 1
+
+
+def test_slots():
+    import pickle
+
+    obj = _SlotsChild(x=1, y=[_SlotsCls(x=2)], z="a")
+    assert not hasattr(obj, "__dict__")
+    assert obj.y == [_SlotsCls(x=2)]
+    assert obj.z is MyEnum.A
+    assert obj.double() == 3
+    with pytest.raises(types_parser.InvalidError):
+        obj.x = "1"
+    with pytest.raises(types_parser.InvalidError):
+        _SlotsCls(x="1")
+    with pytest.raises(AttributeError):
+        obj.other = 1
+
+    obj._cache = 1  # Extra slots are not pickled
+    new_obj = pickle.loads(pickle.dumps(obj))
+    assert new_obj == obj
+    assert not hasattr(new_obj, "_cache")
+
+    trusted = types_parser.from_trusted(_SlotsChild, {"x": 1, "y": obj.y})
+    assert trusted == obj
+
+
+def _batch_cls(slots: bool):
+    @types_parser.make_dataclass(slots=slots)
+    class BatchCls:
+        x: int
+        e: MyEnum = MyEnum.A
+        tags: list[str] | None = None
+
+        @classmethod
+        def from_json(cls, value, *, trusted=False):
+            if trusted:
+                return types_parser.from_trusted(cls, value)
+            return cls(**value)
+
+        @classmethod
+        def from_json_list(cls, values, *, trusted=False):
+            return types_parser.from_json_list(cls, values, trusted=trusted)
+
+    return BatchCls
+
+
+@pytest.mark.parametrize("slots", [False, True])
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_json_list(slots: bool, trusted: bool):
+    cls = _batch_cls(slots)
+    existing = cls(x=3)
+    values = [{"x": 1}, {"x": 2, "e": "a", "tags": ["t"]}, existing]
+    plan = types_parser.compile(list[cls], trusted=trusted)
+    objs = plan(values)
+    assert objs == [cls(x=1), cls(x=2, tags=["t"]), existing]
+    assert objs[2] is existing
+    assert objs[1].e is MyEnum.A
+    lazy = types_parser.LazyList(values[:2], cls.from_json)
+    if trusted:
+        assert plan(lazy) is lazy
+    else:  # Items are validated on access
+        assert repr(plan(lazy)) == "LazyList(0/2 converted)"
+        assert plan(lazy) == objs[:2]
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_from_json_list_invalid(slots: bool):
+    cls = _batch_cls(slots)
+    plan = types_parser.compile(list[cls])
+    # Errors are re-raised item by item
+    with pytest.raises(types_parser.InvalidError):
+        plan([{"x": 1}, {"x": "2"}])
+    with pytest.raises(TypeError, match="unknown"):
+        plan([{"x": 1, "unknown": 2}])
+    with pytest.raises(TypeError, match="x"):
+        plan([{}])
+
+
+def test_get_type_hints():
+    import typing
+
+    hints = types_parser.get_type_hints(_SlotsChild)
+    assert hints == typing.get_type_hints(_SlotsChild)
+    assert types_parser.get_type_hints(_SlotsChild) is hints
+    # Base annotations are evaluated once, and shared
+    parser = types_parser.parser
+    assert parser._OWN_TYPE_HINTS[_SlotsCls] == {
+        "x": int,
+        "y": list[_SlotsCls] | None,
+    }
+
+    class Dynamic(MyDataclass):
+        z: MyEnum
+
+    assert types_parser.get_type_hints(Dynamic) == typing.get_type_hints(Dynamic)
+
+
+@types_parser.make_dataclass
+class _Node:
+    x: int = 0
+    children: list[_Node] | None = None
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**value)
+
+
+def test_invalid_error():
+    value = {"a": [{"x": 1}, {"x": 2, "children": [{"x": "3"}]}]}
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        types_parser.validate(dict[str, list[_Node]], value)
+    e = exc_info.value
+    assert e.path == "$.a[1].children[0].x"
+    assert e.hint is int
+    assert e.value == "3"
+    assert str(e) == (
+        "$.a[1].children[0].x: Expected <class 'int'>. Got: <class 'str'>"
+    )
+
+    # Union: the error of each branch, relative to the union value
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        types_parser.validate(list[list[int] | list[str]], [[1, None]])
+    e = exc_info.value
+    assert e.path == "$[0]"
+    assert [err.path for err in e.errors] == ["$[1]", "$[0]"]
+    assert str(e).splitlines()[:2] == [
+        "$[0][1]: Expected <class 'int'>. Got: <class 'NoneType'>",
+        "$[0][0]: Expected <class 'str'>. Got: <class 'int'>",
+    ]
+
+
+def test_invalid_error_public_edc_field(monkeypatch):
+    # Without the private etils hook, errors are still raised (re-wrapped)
+    monkeypatch.setattr(types_parser.parser, "_Field", None)
+
+    @types_parser.make_dataclass
+    class A:
+        x: int = 0
+
+    assert A(x=1).x == 1
+    with pytest.raises(types_parser.InvalidError) as exc_info:
+        A(x="1")
+    assert exc_info.value.path == "$.x"
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_make_dataclass_undefined_forward_ref(slots: bool, monkeypatch):
+    @types_parser.make_dataclass(slots=slots)
+    class A:
+        x: _NotYetDefined | None = None  # noqa: F821
+
+    with pytest.raises(NameError):
+        A()
+    # Retried once the name is defined
+    monkeypatch.setitem(globals(), "_NotYetDefined", int)
+    assert A(x=1).x == 1
+    with pytest.raises(types_parser.InvalidError):
+        A(x="1")
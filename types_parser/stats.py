@@ -0,0 +1,192 @@
+"""Opt-in statistics of the objects built by the `compile` plans."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import time
+from typing import Any, Callable, Iterator, TypeAlias, TypeVar
+
+from types_parser import parser
+
+_T = TypeVar("_T")
+
+
+class Stats:
+    """Per-class counts and timings of a load, to find where the time goes.
+
+    While active, the validators record:
+
+    * The classes built from JSON (`from_json`, `from_json_list`), with the
+      cumulative construction time, both including (`total_time`) and
+      excluding (`self_time`) the nested objects.
+    * The union branches which were tried but did not match, per union hint.
+    * The calls of each field validator (`Cls.field`), including the
+      `make_dataclass` descriptor assignments.
+
+    When no `Stats` is active, the validators only pay a `None` check.
+    Activation is process-wide (not per thread).
+
+    Usage:
+
+    ```python
+    with types_parser.Stats().activate() as stats:
+      project = Reflection.from_json(api_json)
+    print(stats.table())
+    ```
+
+    Attributes:
+        instances: Number of objects built, per class
+        total_time: Construction time (in seconds), per class
+        self_time: Construction time (in seconds) excluding the nested
+            objects, per class
+        union_misses: Number of failed union branches, per union hint
+        validator_calls: Number of calls, per validator name (`Cls.field`)
+    """
+
+    def __init__(self):
+        self.instances: collections.Counter[type] = collections.Counter()
+        self.total_time: collections.Counter[type] = collections.Counter()
+        self.self_time: collections.Counter[type] = collections.Counter()
+        self.union_misses: collections.Counter[TypeAlias] = collections.Counter()
+        self.validator_calls: collections.Counter[str] = collections.Counter()
+        # Time spent in the nested builds, one item per build in progress
+        self._nested_time: list[float] = []
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Stats]:
+        """Records the statistics of the validators called in the block."""
+        previous = parser._STATS  # pylint: disable=protected-access
+        parser._STATS = self  # pylint: disable=protected-access
+        try:
+            yield self
+        finally:
+            parser._STATS = previous  # pylint: disable=protected-access
+
+    def build(
+        self,
+        fn: Callable[[Any], _T],
+        value: Any,
+        *,
+        nested_time: float = 0.0,
+    ) -> _T:
+        """Returns `fn(value)`, recording the class of the result.
+
+        Args:
+            fn: The function building the object
+            value: The JSON value
+            nested_time: Time already spent building the nested objects
+                before the call (e.g. by an iterative builder), added to the
+                `total_time`
+
+        Returns:
+            The object
+        """
+        stack = self._nested_time
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            obj = fn(value)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+        cls = type(obj)
+        self.instances[cls] += 1
+        self.total_time[cls] += elapsed + nested_time
+        self.self_time[cls] += elapsed - nested
+        return obj
+
+    def build_list(
+        self,
+        fn: Callable[[list[Any]], list[_T]],
+        values: list[Any],
+    ) -> list[_T]:
+        """Like `build`, for `from_json_list` (time is split across items)."""
+        start = time.perf_counter()
+        objs = fn(values)
+        elapsed = time.perf_counter() - start
+        if self._nested_time:
+            self._nested_time[-1] += elapsed
+        if objs:
+            counts = collections.Counter(type(obj) for obj in objs)
+            for cls, count in counts.items():
+                item_time = elapsed * count / len(objs)
+                self.instances[cls] += count
+                self.total_time[cls] += item_time
+                self.self_time[cls] += item_time
+        return objs
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the statistics as a JSON-serializable dict."""
+        return {
+            "classes": {
+                _cls_name(cls): {
+                    "instances": count,
+                    "total_time": self.total_time[cls],
+                    "self_time": self.self_time[cls],
+                }
+                for cls, count in self.instances.most_common()
+            },
+            "union_misses": {
+                str(hint): count for hint, count in self.union_misses.most_common()
+            },
+            "validator_calls": dict(self.validator_calls.most_common()),
+        }
+
+    def table(self, limit: int | None = 20) -> str:
+        """Returns the statistics as a text table (`limit` rows per section)."""
+        rows = [("Class", "Instances", "Total (s)", "Self (s)")]
+        for cls, self_time in self.self_time.most_common(limit):
+            rows.append((
+                _cls_name(cls),
+                str(self.instances[cls]),
+                f"{self.total_time[cls]:.4f}",
+                f"{self_time:.4f}",
+            ))
+        lines = _format_rows(rows)
+        if self.union_misses:
+            rows = [("Union", "Misses")]
+            rows.extend(
+                (str(hint), str(count))
+                for hint, count in self.union_misses.most_common(limit)
+            )
+            lines += [""] + _format_rows(rows)
+        if self.validator_calls:
+            rows = [("Validator", "Calls")]
+            rows.extend(
+                (name, str(count))
+                for name, count in self.validator_calls.most_common(limit)
+            )
+            lines += [""] + _format_rows(rows)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instances={sum(self.instances.values())}, "
+            f"union_misses={sum(self.union_misses.values())}, "
+            f"validator_calls={sum(self.validator_calls.values())})"
+        )
+
+
+def current() -> Stats | None:
+    """Returns the active `Stats`, if any."""
+    return parser._STATS  # pylint: disable=protected-access
+
+
+def _cls_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _format_rows(rows: list[tuple[str, ...]]) -> list[str]:
+    """Left-aligns the first column, right-aligns the others."""
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    ]
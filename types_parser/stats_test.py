@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+
+import types_parser
+from types_parser import parser
+
+
+@types_parser.make_dataclass
+class Leaf:
+    x: int = 0
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**value)
+
+
+@types_parser.make_dataclass
+class Tree:
+    leaves: list[int] | list[Leaf] | None = None
+    children: list[Tree] | None = None
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**value)
+
+
+def test_stats():
+    value = {"children": [{"leaves": [{"x": 1}, {"x": 2}]}]}
+    with types_parser.Stats().activate() as stats:
+        tree = stats.build(Tree.from_json, value)
+    assert parser._STATS is None
+    assert tree == Tree(children=[Tree(leaves=[Leaf(x=1), Leaf(x=2)])])
+
+    assert stats.instances == {Tree: 2, Leaf: 2}
+    assert stats.total_time[Tree] >= stats.self_time[Tree] > 0
+    # `list[int]` is tried first for the leaves
+    assert stats.union_misses == {list[int] | list[Leaf] | None: 1}
+    assert stats.validator_calls == {
+        "Tree.leaves": 2,
+        "Tree.children": 2,
+        "Leaf.x": 2,
+    }
+
+    content = json.loads(json.dumps(stats.to_json()))
+    assert content["classes"][f"{__name__}.Leaf"]["instances"] == 2
+    assert "Tree.children" in stats.table()
+    assert repr(stats) == "Stats(instances=4, union_misses=1, validator_calls=6)"
+
+
+def test_stats_disabled():
+    with types_parser.Stats().activate() as stats:
+        pass
+    Tree.from_json({"leaves": [{"x": 1}]})
+    assert not stats.instances and not stats.validator_calls
@@ -0,0 +1,328 @@
+"""Native decoding of the `make_dataclass` classes, with `msgspec`.
+
+Alternative engine to the pure-Python `compile` validators: `make_decoder`
+derives `msgspec.Struct` types from the same annotations, so decoding and
+validating the JSON happens in a single native pass. The structs are then
+converted to the `make_dataclass` objects.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import itertools
+import sys
+import types
+import typing
+from typing import Any, Callable, TypeAlias
+
+import msgspec
+from types_parser import parser
+
+_Converter = Callable[[Any], Any]
+
+_SCHEMA_IDS = itertools.count()
+_SCALARS = (int, float, str, bool)
+
+
+@dataclasses.dataclass(frozen=True)
+class TaggedUnion:
+    """Polymorphic class hierarchy, decoded as a `msgspec` tagged union.
+
+    Attributes:
+        tag_field: JSON key selecting the class (e.g. `"type"`)
+        variants: Mapping `tag -> (cls, constants)`. JSON objects with the
+            `tag` are built as `cls`, with the `constants` field values (e.g.
+            `{"type": tag}`). Constant fields other than the `tag_field` are
+            accepted in the JSON, but ignored.
+    """
+
+    tag_field: str
+    variants: dict[str | int, tuple[type, dict[str, Any]]]
+
+
+def make_decoder(
+    hint: TypeAlias,
+    *,
+    unions: dict[type, TaggedUnion] | None = None,
+    json_types: dict[type, TypeAlias] | None = None,
+) -> Callable[[bytes], Any]:
+    """Returns a function decoding JSON bytes into `hint`.
+
+    The result is the same as `compile(hint)(json.loads(data))`, but the
+    structs are generated once, so the decoder should be re-used.
+
+    Args:
+        hint: The type to decode (e.g. `Reflection`)
+        unions: The polymorphic base classes (whose `from_json` dispatches
+            to the subclasses), indexed by base class
+        json_types: The JSON type of the other classes with a custom
+            `from_json` (called on the decoded value), indexed by class
+
+    Returns:
+        The `decode(data)` function, which accepts `bytes` or any buffer and
+        raises `msgspec.ValidationError` (with the JSON path) on invalid
+        input.
+    """
+    schema = _Schema(unions or {}, json_types or {})
+    decoder = msgspec.json.Decoder(schema.struct_type(hint))
+    convert = schema.converter(hint) or (lambda value: value)
+
+    def decode(data):
+        return convert(decoder.decode(data))
+
+    return decode
+
+
+class _Schema:
+    """Generated structs, in a dedicated module namespace.
+
+    Struct annotations are source strings resolved lazily by `msgspec` in
+    the module namespace, so the structs can be recursive.
+    """
+
+    def __init__(
+        self,
+        unions: dict[type, TaggedUnion],
+        json_types: dict[type, TypeAlias],
+    ):
+        self._unions = unions
+        self._json_types = json_types
+        self._namespace_ids = itertools.count()
+        # `msgspec` looks up the module of the structs in `sys.modules`
+        self.module = types.ModuleType(f"{__name__}._schema{next(_SCHEMA_IDS)}")
+        self.module.typing = typing
+        sys.modules[self.module.__name__] = self.module
+        # Source name of the registered objects, structs and union aliases
+        self._names: dict[Any, str] = {}
+        # Union aliases to define once all the variants are created
+        self._pending_unions: dict[str, list[str]] = {}
+
+    def struct_type(self, hint: TypeAlias):
+        src = self._src(hint)
+        for name, variant_names in self._pending_unions.items():
+            variants = tuple(getattr(self.module, n) for n in variant_names)
+            setattr(self.module, name, typing.Union[variants])
+        self._pending_unions.clear()
+        return eval(src, vars(self.module))  # pylint: disable=eval-used
+
+    def _register(self, key: Any, prefix: str) -> tuple[str, bool]:
+        """Returns the source name of `key` and whether it is new."""
+        if key in self._names:
+            return self._names[key], False
+        name = self._names[key] = f"{prefix}{next(self._namespace_ids)}"
+        return name, True
+
+    def _src(self, hint: TypeAlias) -> str:
+        """Returns the source of the `msgspec` annotation matching `hint`."""
+        origin = typing.get_origin(hint)
+        args = typing.get_args(hint)
+        if hint is None or hint is type(None):
+            return "None"
+        elif hint is typing.Any:
+            return "typing.Any"
+        elif origin is typing.Annotated:  # `Discriminator` are tagged unions
+            return self._src(args[0])
+        elif origin in (list, typing.List):
+            return f"list[{self._src(args[0])}]"
+        elif origin in (dict, typing.Dict):
+            return f"dict[{self._src(args[0])}, {self._src(args[1])}]"
+        elif origin in (tuple, typing.Tuple):
+            if len(args) == 2 and args[1] is Ellipsis:
+                return f"tuple[{self._src(args[0])}, ...]"
+            return f"tuple[{', '.join(self._src(a) for a in args)}]"
+        elif origin in (types.UnionType, typing.Union):
+            return " | ".join(self._src(a) for a in args)
+        elif not isinstance(hint, type):
+            raise TypeError(f"Unsupported annotation: {hint}")
+        elif hint in self._json_types:
+            return self._src(self._json_types[hint])
+        elif hint in _SCALARS:
+            return hint.__name__
+        elif issubclass(hint, enum.Enum):  # Decoded from the value
+            name, is_new = self._register(hint, "_Enum")
+            if is_new:
+                setattr(self.module, name, hint)
+            return name
+        elif self._union_of(hint) is not None:
+            return self._union_src(hint)
+        else:
+            return self._struct_src(hint, tag_field=None, tag=None, constants={})
+
+    def _union_of(self, cls: type) -> TaggedUnion | None:
+        for base, union in self._unions.items():
+            if issubclass(cls, base):
+                return union
+        return None
+
+    def _union_src(self, cls: type) -> str:
+        """`cls` and its subclasses, as a union of the tagged structs."""
+        name, is_new = self._register(cls, "_Union")
+        if not is_new:
+            return name
+        union = self._union_of(cls)
+        variant_names = [
+            self._struct_src(
+                variant_cls,
+                tag_field=union.tag_field,
+                tag=tag,
+                constants=constants,
+            )
+            for tag, (variant_cls, constants) in union.variants.items()
+            if issubclass(variant_cls, cls)
+        ]
+        if not variant_names:
+            raise TypeError(f"No variant of {cls.__name__} in the tagged union.")
+        self._pending_unions[name] = variant_names
+        return name
+
+    def _struct_src(
+        self,
+        cls: type,
+        *,
+        tag_field: str | None,
+        tag: str | int | None,
+        constants: dict[str, Any],
+    ) -> str:
+        name, is_new = self._register((cls, tag), f"_{cls.__name__}")
+        if not is_new:  # (Or being created, for recursive structs)
+            return name
+        if not dataclasses.is_dataclass(cls) and not parser._is_lazy(cls):
+            raise TypeError(f"Cannot decode {cls}: Not a `make_dataclass` class.")
+        parser._make_all_dataclass(cls)
+        type_hints = parser.get_type_hints(cls)
+        fields = []
+        namespace = {
+            "__cls": cls,
+            "__new": object.__new__,
+            "__setattr": object.__setattr__,
+        }
+        # `(name, expression)` of each field value
+        exprs = []
+        for i, field in enumerate(dataclasses.fields(cls)):
+            if field.name in constants:
+                namespace[f"__const{i}"] = constants[field.name]
+                exprs.append((repr(field.name), f"__const{i}"))
+                if field.name != tag_field:  # Accepted, but ignored
+                    fields.append((field.name, "typing.Any", None))
+                continue
+            hint = type_hints[field.name]
+            if field.default is None:  # `x: X = None` also accepts `null`
+                hint = hint | None
+            if field.default is not dataclasses.MISSING:
+                fields.append((field.name, self._src(hint), field.default))
+            elif field.default_factory is not dataclasses.MISSING:
+                default = msgspec.field(default_factory=field.default_factory)
+                fields.append((field.name, self._src(hint), default))
+            else:
+                fields.append((field.name, self._src(hint)))
+            exprs.append((repr(field.name), self._value_expr(hint, field, i, namespace)))
+
+        body = parser._assignment_lines(cls, exprs, obj="obj")
+        body_str = "\n".join(f"    {line}" for line in body)
+        src = f"""
+def _to_object(self):
+    obj = __new(__cls)
+{body_str}
+    return obj
+"""
+        exec(src, namespace)  # pylint: disable=exec-used
+        to_object = namespace["_to_object"]
+        to_object.__qualname__ = f"{name}._to_object"
+
+        struct_kwargs = {}
+        if tag_field is not None:
+            struct_kwargs = {"tag_field": tag_field, "tag": tag}
+        struct = msgspec.defstruct(
+            name,
+            fields,
+            kw_only=True,
+            forbid_unknown_fields=True,
+            module=self.module.__name__,
+            namespace={"_to_object": to_object},
+            **struct_kwargs,
+        )
+        setattr(self.module, name, struct)
+        return name
+
+    def _value_expr(self, hint, field, i: int, namespace: dict[str, Any]) -> str:
+        """Returns the expression converting the struct field value."""
+        value = f"self.{field.name}"
+        args = typing.get_args(hint)
+        if (
+            typing.get_origin(hint) in (types.UnionType, typing.Union)
+            and type(None) in args
+            and len(args) == 2
+        ):  # `X | None`: inline the `None` check
+            (hint,) = (a for a in args if a is not type(None))
+            convert = self.converter(hint)
+            if convert is None:
+                return value
+            namespace[f"__convert{i}"] = convert
+            return f"None if {value} is None else __convert{i}({value})"
+        convert = self.converter(hint)
+        if convert is None:
+            return value
+        namespace[f"__convert{i}"] = convert
+        return f"__convert{i}({value})"
+
+    def converter(self, hint: TypeAlias) -> _Converter | None:
+        """Returns the struct -> object conversion (`None` if identity)."""
+        origin = typing.get_origin(hint)
+        args = typing.get_args(hint)
+        if hint is typing.Any:
+            return None
+        elif origin is typing.Annotated:
+            return self.converter(args[0])
+        elif origin in (list, typing.List):
+            item_convert = self.converter(args[0])
+            if item_convert is None:
+                return None
+            return lambda value: [item_convert(v) for v in value]
+        elif origin in (dict, typing.Dict):
+            item_convert = self.converter(args[1])
+            if item_convert is None:
+                return None
+            return lambda value: {k: item_convert(v) for k, v in value.items()}
+        elif origin in (tuple, typing.Tuple):
+            if len(args) == 2 and args[1] is Ellipsis:
+                item_convert = self.converter(args[0])
+                if item_convert is None:
+                    return None
+                return lambda value: tuple(item_convert(v) for v in value)
+            converts = [self.converter(a) or _identity for a in args]
+            if all(c is _identity for c in converts):
+                return None
+            return lambda value: tuple(c(v) for c, v in zip(converts, value))
+        elif origin in (types.UnionType, typing.Union):
+            converts = [self.converter(a) for a in args if a is not type(None)]
+            if all(c is None for c in converts):
+                return None
+            elif len(converts) == 1:
+                (convert,) = converts
+                return lambda value: None if value is None else convert(value)
+            elif all(c in (None, _to_object) for c in converts):
+                return _struct_to_object
+            raise TypeError(f"Unsupported union of converted types: {hint}")
+        elif not isinstance(hint, type):
+            raise TypeError(f"Unsupported annotation: {hint}")
+        elif hint in self._json_types:
+            return hint.from_json
+        elif hint in _SCALARS or issubclass(hint, enum.Enum):
+            return None  # Already decoded by `msgspec`
+        return _to_object
+
+
+def _identity(value):
+    return value
+
+
+def _to_object(value):
+    return value._to_object()  # pylint: disable=protected-access
+
+
+def _struct_to_object(value):
+    """Converts the struct values of a union (other values are kept)."""
+    if isinstance(value, msgspec.Struct):
+        return value._to_object()  # pylint: disable=protected-access
+    return value
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import enum
+import json
+
+import pytest
+import types_parser
+
+msgspec = pytest.importorskip("msgspec")
+from types_parser import structs  # pylint: disable=g-import-not-at-top
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Flags:
+    def __init__(self, bits: int):
+        self.bits = bits
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(bits=sum(value.values()))
+
+    def __eq__(self, other):
+        return isinstance(other, Flags) and self.bits == other.bits
+
+
+@types_parser.make_dataclass(slots=True)
+class Node:
+    type: str
+    flags: Flags | None = None
+
+    @classmethod
+    def from_json(cls, value):
+        return _TAG_TO_CLS[value["type"]](**value)
+
+
+@types_parser.make_dataclass(slots=True)
+class Leaf(Node):
+    color: Color = Color.RED
+    pair: tuple[int, str] | None = None
+
+
+@types_parser.make_dataclass(slots=True)
+class Tree(Node):
+    children: list[Node]
+    attrs: dict[str, Leaf] | None = None
+
+
+@types_parser.make_dataclass
+class Root:  # Not `slots=True`
+    root: Node
+    name: str
+
+    @classmethod
+    def from_json(cls, value):
+        return cls(**value)
+
+
+_TAG_TO_CLS = {"leaf": Leaf, "tree": Tree}
+
+
+def _decoder():
+    return structs.make_decoder(
+        Root,
+        unions={
+            Node: structs.TaggedUnion(
+                tag_field="type",
+                variants={tag: (cls, {"type": tag}) for tag, cls in _TAG_TO_CLS.items()},
+            )
+        },
+        json_types={Flags: dict[str, bool]},
+    )
+
+
+def test_make_decoder():
+    value = {
+        "name": "x",
+        "root": {
+            "type": "tree",
+            "flags": {"a": True, "b": True, "c": False},
+            "children": [
+                {"type": "leaf", "pair": [1, "a"]},
+                {"type": "tree", "children": []},
+            ],
+            "attrs": {"a": {"type": "leaf", "color": "red"}},
+        },
+    }
+    root = _decoder()(json.dumps(value).encode())
+    assert root == types_parser.validate(Root, value)
+    assert type(root.root.children[0]) is Leaf
+    assert root.root.flags.bits == 2
+    assert root.root.children[0].pair == (1, "a")
+    assert root.root.attrs["a"].color is Color.RED
+
+
+def test_make_decoder_invalid():
+    decode = _decoder()
+    value = {"name": "x", "root": {"type": "tree", "children": [{"type": "leaf"}]}}
+    value["root"]["children"][0]["color"] = "blue"
+    with pytest.raises(msgspec.ValidationError, match=r"\$\.root\.children\[0\]\.color"):
+        decode(json.dumps(value).encode())
+    with pytest.raises(msgspec.ValidationError, match="unknown field `other`"):
+        decode(b'{"name": "x", "root": {"type": "leaf", "other": 1}}')